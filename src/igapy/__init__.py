@@ -1,16 +1,33 @@
 from .client import IGClient
-from .accounts import Accounts
-from .markets import Markets
-from .prices import Prices
-from .orders import Orders
-from .sentiment import Sentiment
-from .history import History
-from .repeat import RepeatDealWindow
-from .watchlists import Watchlists
-from .costs import CostsAndCharges
-from .operations import Operations
-from .streaming import IGStreamingClient
-from .session import SessionAPI
+from .async_client import AsyncIGClient
+from .ratelimit import RateLimiter
+from .cache import ResponseCache
+from .accounts import Accounts, AsyncAccounts
+from .markets import Markets, AsyncMarkets
+from .prices import Prices, AsyncPrices
+from .orders import Orders, AsyncOrders
+from .sentiment import Sentiment, AsyncSentiment
+from .history import History, AsyncHistory
+from .repeat import RepeatDealWindow, AsyncRepeatDealWindow
+from .watchlists import Watchlists, AsyncWatchlists
+from .costs import CostsAndCharges, AsyncCostsAndCharges
+from .operations import Operations, AsyncOperations
+from .streaming import IGStreamingClient, UpdateStream
+from .session import SessionAPI, AsyncSessionAPI
+from .frames import PriceFrame
+from .store import PriceStore
+from .allowance import AllowanceTracker
+from .backfill import BulkDownloader, CSVSink, ParquetSink, StoreSink
+from .resample import resample
+from .navigation import MarketCrawler, MarketIndex
+from .search import MarketSearchIndex
+from .details import MarketDetailsCache
+from .confirm import DealConfirmer, AsyncDealConfirmer
+from .books import PositionBook, WorkingOrderBook
+from .validation import OrderValidator
+from .bulk import BulkOrders
+from .metrics import LatencyMetrics
+from .dispatch import Dispatcher
 
 __all__ = [
     "IGClient",
@@ -25,5 +42,40 @@ __all__ = [
     "CostsAndCharges",
     "Operations",
     "IGStreamingClient",
+    "UpdateStream",
     "SessionAPI",
+    "AsyncIGClient",
+    "AsyncAccounts",
+    "AsyncMarkets",
+    "AsyncPrices",
+    "AsyncOrders",
+    "AsyncSentiment",
+    "AsyncHistory",
+    "AsyncRepeatDealWindow",
+    "AsyncWatchlists",
+    "AsyncCostsAndCharges",
+    "AsyncOperations",
+    "AsyncSessionAPI",
+    "RateLimiter",
+    "ResponseCache",
+    "PriceFrame",
+    "PriceStore",
+    "AllowanceTracker",
+    "BulkDownloader",
+    "CSVSink",
+    "ParquetSink",
+    "StoreSink",
+    "resample",
+    "MarketCrawler",
+    "MarketIndex",
+    "MarketSearchIndex",
+    "MarketDetailsCache",
+    "DealConfirmer",
+    "AsyncDealConfirmer",
+    "PositionBook",
+    "WorkingOrderBook",
+    "OrderValidator",
+    "BulkOrders",
+    "LatencyMetrics",
+    "Dispatcher",
 ]
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class Accounts:
@@ -23,3 +24,23 @@ class Accounts:
     def update_preferences(self, preferences: dict) -> dict:
         """Update account preferences."""
         return self.client.put("/accounts/preferences", preferences)
+
+
+class AsyncAccounts:
+    """Async client for IG accounts endpoints."""
+
+    def __init__(self, client: "AsyncIGClient") -> None:
+        """Initialize AsyncAccounts API client."""
+        self.client = client
+
+    async def list_accounts(self) -> dict:
+        """List all accounts."""
+        return await self.client.get("/accounts")
+
+    async def get_preferences(self) -> dict:
+        """Get account preferences."""
+        return await self.client.get("/accounts/preferences")
+
+    async def update_preferences(self, preferences: dict) -> dict:
+        """Update account preferences."""
+        return await self.client.put("/accounts/preferences", preferences)
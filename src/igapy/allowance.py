@@ -0,0 +1,99 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from .utils import resolution_seconds
+
+
+def estimate_points(resolution: str, start: datetime, end: datetime) -> int:
+    """Estimate the data points a date-range request costs.
+
+    Market closures are ignored, so the estimate errs on the high side.
+    """
+    step = resolution_seconds(resolution)
+    return max(0, int((end - start).total_seconds() // step) + 1)
+
+
+class FetchPlan:
+    """Result of planning price fetches against the remaining allowance."""
+
+    def __init__(
+        self, now: list, deferred: list, cost: int, resets_in: float
+    ) -> None:
+        """Initialize FetchPlan.
+        :param now: Jobs that fit the remaining allowance.
+        :param deferred: Jobs to run after the allowance resets.
+        :param cost: Estimated points used by the jobs in now.
+        :param resets_in: Seconds until the allowance resets, if known.
+        """
+        self.now = now
+        self.deferred = deferred
+        self.cost = cost
+        self.resets_in = resets_in
+
+
+class AllowanceTracker:
+    """Tracks the historical-data allowance reported by prices responses."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize AllowanceTracker with nothing known yet."""
+        self.remaining = None
+        self.total = None
+        self._expires_at = None
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def update(self, response: dict) -> None:
+        """Record the allowance from a prices response, if present."""
+        allowance = response.get("metadata", {}).get("allowance")
+        allowance = allowance or response.get("allowance")
+        if not allowance:
+            return
+        with self._lock:
+            self.remaining = allowance.get("remainingAllowance")
+            self.total = allowance.get("totalAllowance")
+            expiry = allowance.get("allowanceExpiry")
+            if expiry is not None:
+                self._expires_at = self._clock() + expiry
+
+    @property
+    def resets_in(self) -> float:
+        """Seconds until the allowance resets, or None if unknown."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - self._clock())
+
+    def plan(self, jobs: list) -> FetchPlan:
+        """Fit (epic, resolution, start, end) jobs into the allowance.
+
+        Cheapest jobs run first so the most jobs complete. The first job
+        that does not fit is split at the remaining budget, and everything
+        after it is deferred until the allowance resets. With no allowance
+        known yet, every job runs now.
+        """
+        costed = sorted(
+            ((estimate_points(job[1], job[2], job[3]), job) for job in jobs),
+            key=lambda item: item[0],
+        )
+        with self._lock:
+            budget = self.remaining
+        if budget is None:
+            cost = sum(c for c, _ in costed)
+            return FetchPlan([j for _, j in costed], [], cost, None)
+        now, deferred, used = [], [], 0
+        for cost, job in costed:
+            left = budget - used
+            if deferred or left <= 0:
+                deferred.append(job)
+            elif cost <= left:
+                now.append(job)
+                used += cost
+            else:
+                epic, resolution, start, end = job
+                step = timedelta(seconds=resolution_seconds(resolution))
+                split = start + (left - 1) * step
+                now.append((epic, resolution, start, split))
+                deferred.append((epic, resolution, split + step, end))
+                used += left
+        return FetchPlan(now, deferred, used, self.resets_in)
@@ -0,0 +1,128 @@
+import json
+import aiohttp
+from .allowance import AllowanceTracker
+from .exceptions import ApiKeyMissingError, IGAPIError
+from .ratelimit import RateLimiter
+from .utils import build_headers
+
+
+class AsyncIGClient:
+    """Authenticated IG REST API client for asyncio applications."""
+
+    def __init__(
+        self,
+        api_key: str,
+        username: str,
+        password: str,
+        is_demo: bool = True,
+        rate_limiter: RateLimiter = None,
+    ) -> None:
+        """Initialize AsyncIGClient.
+
+        The underlying aiohttp session is created lazily inside the running
+        event loop on the first request.
+        :param rate_limiter: Optional RateLimiter that paces every request.
+        """
+        self.api_key = api_key
+        self.username = username
+        self.password = password
+        self.is_demo = is_demo
+        self.base_url = (
+            "https://demo-api.ig.com/gateway/deal"
+            if is_demo
+            else "https://api.ig.com/gateway/deal"
+        )
+        self.session = None
+        self.session_data = None
+        self.rate_limiter = rate_limiter
+        self.allowance = AllowanceTracker()
+
+    async def __aenter__(self) -> "AsyncIGClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _ensure_session(self):
+        """Return the aiohttp session, creating it on first use."""
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def login(self) -> dict:
+        """Authenticate and start session."""
+        if not self.api_key:
+            raise ApiKeyMissingError("API key is missing")
+        session = self._ensure_session()
+        url = f"{self.base_url}/session"
+        headers = {
+            "X-IG-API-KEY": self.api_key,
+            "Content-Type": "application/json",
+        }
+        payload = {"identifier": self.username, "password": self.password}
+        resp = await session.post(url, json=payload, headers=headers)
+        # Reading the body releases the connection back to the pool.
+        text = await resp.text()
+        if resp.status != 200:
+            raise IGAPIError(f"Login failed: {resp.status}")
+        cst = resp.headers.get("CST")
+        token = resp.headers.get("X-SECURITY-TOKEN")
+        if cst and token:
+            session.headers.update({"CST": cst, "X-SECURITY-TOKEN": token})
+        self.session_data = self._handle_response(resp.status, text)
+        return self.session_data
+
+    async def get(self, path: str, params: dict = None) -> dict:
+        """Send GET request."""
+        return await self._request("GET", path, params=params)
+
+    async def post(self, path: str, data: dict) -> dict:
+        """Send POST request."""
+        return await self._request("POST", path, data=data)
+
+    async def put(self, path: str, data: dict) -> dict:
+        """Send PUT request."""
+        return await self._request("PUT", path, data=data)
+
+    async def delete(self, path: str) -> dict:
+        """Send DELETE request."""
+        return await self._request("DELETE", path)
+
+    async def _request(
+        self, method: str, path: str, params: dict = None, data: dict = None
+    ) -> dict:
+        """Send request, paced by the rate limiter if one is configured."""
+        session = self._ensure_session()
+        url = self.base_url + path
+        headers = build_headers(self)
+        lane = None
+        if self.rate_limiter is not None:
+            lane = self.rate_limiter.lane(method, path)
+            await self.rate_limiter.acquire_async(lane)
+        if method == "GET":
+            resp = await session.get(url, params=params, headers=headers)
+        elif method == "POST":
+            resp = await session.post(url, json=data, headers=headers)
+        elif method == "PUT":
+            resp = await session.put(url, json=data, headers=headers)
+        else:
+            resp = await session.delete(url, headers=headers)
+        text = await resp.text()
+        if lane and resp.status == 403 and "exceeded" in text:
+            self.rate_limiter.penalize(lane, text)
+        return self._handle_response(resp.status, text)
+
+    def _handle_response(self, status: int, text: str) -> dict:
+        """Handle API response body."""
+        if status >= 400:
+            raise IGAPIError(f"API error: {status} {text}")
+        try:
+            return json.loads(text)
+        except ValueError:
+            return {}
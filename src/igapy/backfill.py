@@ -0,0 +1,203 @@
+from __future__ import annotations
+import csv
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, Callable
+
+from .exceptions import InvalidInputError
+from .frames import COLUMNS, PriceFrame
+from .utils import format_date, resolution_seconds, to_epoch_ms
+
+if TYPE_CHECKING:
+    from .prices import Prices
+    from .store import PriceStore
+
+
+def split_job(job: tuple, chunk_points: int) -> list:
+    """Split an (epic, resolution, start, end) job into request chunks."""
+    if chunk_points < 1:
+        raise InvalidInputError("Chunk points must be at least 1")
+    epic, resolution, start, end = job
+    step = timedelta(seconds=resolution_seconds(resolution))
+    span = step * (chunk_points - 1)
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + span, end)
+        chunks.append((epic, resolution, start, chunk_end))
+        start = chunk_end + step
+    return chunks
+
+
+def _chunk_key(chunk: tuple) -> str:
+    epic, resolution, start, end = chunk
+    return f"{epic}|{resolution}|{start.isoformat()}|{end.isoformat()}"
+
+
+class BackfillReport:
+    """Outcome of a BulkDownloader run."""
+
+    def __init__(self) -> None:
+        """Initialize an empty BackfillReport."""
+        self.completed = []
+        self.skipped = []
+        self.failed = []
+
+    @property
+    def ok(self) -> bool:
+        """True if no chunk failed."""
+        return not self.failed
+
+
+class BulkDownloader:
+    """Parallel chunked date-range downloader for multi-epic backfills.
+
+    Requests run on a bounded thread pool through the client, so they
+    are paced by its rate limiter. Results reach the sink in job and
+    chunk order. With a checkpoint file, completed chunks are recorded
+    and skipped when the same backfill is run again.
+    """
+
+    def __init__(
+        self,
+        prices: Prices,
+        max_workers: int = 4,
+        chunk_points: int = 1000,
+        checkpoint: str = None,
+    ) -> None:
+        """Initialize BulkDownloader.
+        :param max_workers: Maximum concurrent requests.
+        :param chunk_points: Maximum data points per request.
+        :param checkpoint: Optional path recording completed chunks.
+        """
+        self.prices = prices
+        self.max_workers = max_workers
+        self.chunk_points = chunk_points
+        self.checkpoint = checkpoint
+
+    def _load_checkpoint(self) -> set:
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return set()
+        with open(self.checkpoint) as f:
+            return set(f.read().splitlines())
+
+    def _fetch(self, chunk: tuple) -> dict:
+        epic, resolution, start, end = chunk
+        return self.prices.get_prices_date_range(
+            epic, resolution, format_date(start), format_date(end)
+        )
+
+    def run(
+        self,
+        jobs: list,
+        sink: Callable[[tuple, dict], None],
+        progress: Callable[[int, int], None] = None,
+    ) -> BackfillReport:
+        """Download every job and stream responses to sink in order.
+
+        sink is called as sink(chunk, response) from the calling thread,
+        where chunk is (epic, resolution, start, end). A failed chunk is
+        recorded in the report and the run carries on with the rest.
+        """
+        report = BackfillReport()
+        done_keys = self._load_checkpoint()
+        chunks = [c for job in jobs for c in split_job(job, self.chunk_points)]
+        total = len(chunks)
+        pending = deque()
+        log = open(self.checkpoint, "a") if self.checkpoint else None
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                queue = iter(chunks)
+                finished = 0
+                while True:
+                    while len(pending) < self.max_workers * 2:
+                        chunk = next(queue, None)
+                        if chunk is None:
+                            break
+                        if _chunk_key(chunk) in done_keys:
+                            report.skipped.append(chunk)
+                            finished += 1
+                            if progress:
+                                progress(finished, total)
+                            continue
+                        pending.append(
+                            (chunk, pool.submit(self._fetch, chunk))
+                        )
+                    if not pending:
+                        break
+                    chunk, future = pending.popleft()
+                    try:
+                        sink(chunk, future.result())
+                    except Exception as e:
+                        report.failed.append((chunk, e))
+                    else:
+                        report.completed.append(chunk)
+                        if log:
+                            log.write(_chunk_key(chunk) + "\n")
+                            log.flush()
+                    finished += 1
+                    if progress:
+                        progress(finished, total)
+        finally:
+            if log:
+                log.close()
+        return report
+
+
+class CSVSink:
+    """Backfill sink appending decoded bars to a CSV file."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize CSVSink, writing a header if the file is new."""
+        new = not os.path.exists(path) or not os.path.getsize(path)
+        self._file = open(path, "a", newline="")
+        self._writer = csv.writer(self._file)
+        if new:
+            self._writer.writerow(("epic", "resolution", *COLUMNS))
+
+    def __call__(self, chunk: tuple, response: dict) -> None:
+        epic, resolution = chunk[0], chunk[1]
+        frame = PriceFrame.from_response(response)
+        columns = [frame[name] for name in COLUMNS]
+        for row in zip(*columns):
+            self._writer.writerow((epic, resolution, *row))
+
+    def close(self) -> None:
+        """Close the CSV file."""
+        self._file.close()
+
+
+class ParquetSink:
+    """Backfill sink writing one Parquet file per chunk (needs pyarrow)."""
+
+    def __init__(self, directory: str) -> None:
+        """Initialize ParquetSink writing into directory."""
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, chunk: tuple, response: dict) -> None:
+        import pyarrow.parquet as pq
+
+        epic, resolution, start, _ = chunk
+        name = f"{epic}_{resolution}_{to_epoch_ms(start)}.parquet"
+        table = PriceFrame.from_response(response).to_arrow()
+        pq.write_table(table, os.path.join(self.directory, name))
+
+
+class StoreSink:
+    """Backfill sink merging chunks into a PriceStore."""
+
+    def __init__(self, store: PriceStore) -> None:
+        """Initialize StoreSink for a PriceStore."""
+        self.store = store
+
+    def __call__(self, chunk: tuple, response: dict) -> None:
+        epic, resolution, start, end = chunk
+        self.store.write(
+            epic,
+            resolution,
+            PriceFrame.from_response(response),
+            to_epoch_ms(start),
+            to_epoch_ms(end),
+        )
@@ -0,0 +1,294 @@
+from __future__ import annotations
+import json
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .orders import Orders
+    from .streaming import IGStreamingClient
+
+
+class _Book(ABC):
+    """Local copy of REST state kept current from a TRADE stream field.
+
+    Subclasses set _field and implement _fetch, _add and _remove. Records
+    are replaced, never mutated, so a record read from the book is a
+    consistent snapshot and safe to keep. Reads take the same lock as
+    updates and reconciles, so they never see a half-built book.
+    """
+
+    _field = None
+
+    def __init__(
+        self,
+        orders: Orders,
+        streaming: IGStreamingClient,
+        reconcile_interval: float = None,
+    ) -> None:
+        """Initialize the book, listen for updates and take a snapshot.
+        :param orders: Orders client used for REST snapshots.
+        :param streaming: Started IGStreamingClient.
+        :param reconcile_interval: Seconds between REST reconciliations,
+            or None to only reconcile when reconcile() is called.
+        """
+        self.orders = orders
+        self.streaming = streaming
+        self.reconcile_interval = reconcile_interval
+        self._by_id = {}
+        self._lock = threading.Lock()
+        self._reconcile_lock = threading.Lock()
+        # Updates seen while a REST snapshot is in flight, replayed on it.
+        self._replay = []
+        self._stop = threading.Event()
+        self._thread = None
+        streaming.add_trade_listener(self._on_trade)
+        try:
+            self.reconcile()
+        except Exception:
+            streaming.remove_trade_listener(self._on_trade)
+            raise
+        if reconcile_interval:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def reconcile(self) -> None:
+        """Rebuild the book from a REST snapshot.
+
+        Stream updates that arrive while the snapshot is fetched are
+        applied again on top of it, so none are lost.
+        """
+        with self._reconcile_lock:
+            with self._lock:
+                if self._replay is None:
+                    self._replay = []
+            try:
+                records = self._fetch()
+            except Exception:
+                with self._lock:
+                    self._replay = None
+                raise
+            self._rebuild(records)
+
+    def _rebuild(self, records: list) -> None:
+        with self._lock:
+            for record in list(self._by_id.values()):
+                self._remove(record)
+            self._by_id = {}
+            for record in records:
+                self._by_id[record["dealId"]] = record
+                self._add(record)
+            for update in self._replay:
+                self._apply(update)
+            self._replay = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.reconcile_interval):
+            try:
+                self.reconcile()
+            except Exception as e:
+                name = type(self).__name__
+                print(f"[{name}] Reconcile failed: {e}")
+
+    def _on_trade(self, data: dict) -> None:
+        raw = data.get(self._field)
+        if not raw:
+            return
+        update = json.loads(raw) if isinstance(raw, str) else raw
+        with self._lock:
+            if self._replay is not None:
+                self._replay.append(update)
+            self._apply(update)
+
+    def _apply(self, update: dict) -> None:
+        if update.get("dealStatus") == "REJECTED":
+            return
+        deal_id = update.get("dealId")
+        old = self._by_id.pop(deal_id, None)
+        if old is not None:
+            self._remove(old)
+        if update.get("status") == "DELETED":
+            return
+        fields = {k: v for k, v in update.items() if k != "status"}
+        record = self._normalize(dict(old or {}, **fields))
+        self._by_id[deal_id] = record
+        self._add(record)
+
+    def _normalize(self, record: dict) -> dict:
+        return record
+
+    @abstractmethod
+    def _fetch(self) -> list:
+        """Return the current records from REST."""
+
+    @abstractmethod
+    def _add(self, record: dict) -> None:
+        """Add a record to the subclass indexes."""
+
+    @abstractmethod
+    def _remove(self, record: dict) -> None:
+        """Remove a record from the subclass indexes."""
+
+    def get(self, deal_id: str) -> dict:
+        """Return the record for a deal id, or None."""
+        with self._lock:
+            return self._by_id.get(deal_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._by_id)
+
+    def close(self) -> None:
+        """Stop listening to the stream and stop reconciling."""
+        self._stop.set()
+        self.streaming.remove_trade_listener(self._on_trade)
+
+
+class PositionBook(_Book):
+    """Open positions from one REST snapshot plus OPU stream updates.
+
+    Positions are flat dicts of the REST position fields plus epic,
+    indexed by dealId and by epic. Reads are O(1) and thread-safe.
+    """
+
+    _field = "OPU"
+
+    def __init__(
+        self,
+        orders: Orders,
+        streaming: IGStreamingClient,
+        reconcile_interval: float = 300.0,
+    ) -> None:
+        """Initialize PositionBook from get_positions.
+        :param orders: Orders client used for REST snapshots.
+        :param streaming: Started IGStreamingClient.
+        :param reconcile_interval: Seconds between REST reconciliations,
+            or None to only reconcile when reconcile() is called.
+        """
+        self._by_epic = {}
+        super().__init__(orders, streaming, reconcile_interval)
+
+    def _fetch(self) -> list:
+        return [
+            dict(item["position"], epic=item["market"]["epic"])
+            for item in self.orders.get_positions().get("positions", [])
+        ]
+
+    def _add(self, record: dict) -> None:
+        self._by_epic.setdefault(record["epic"], {})[record["dealId"]] = record
+
+    def _remove(self, record: dict) -> None:
+        deals = self._by_epic.get(record["epic"], {})
+        deals.pop(record["dealId"], None)
+        if not deals:
+            self._by_epic.pop(record["epic"], None)
+
+    def by_epic(self, epic: str) -> list:
+        """Return the open positions on an epic."""
+        with self._lock:
+            return list(self._by_epic.get(epic, {}).values())
+
+    def positions(self) -> list:
+        """Return every open position."""
+        with self._lock:
+            return list(self._by_id.values())
+
+
+class WorkingOrderBook(_Book):
+    """Working orders from one REST snapshot plus WOU stream updates.
+
+    Orders are flat dicts of the REST working order fields, with level
+    and size under the same keys the stream uses. They are indexed by
+    dealId, by epic, and by epic and direction in level order, so orders
+    near a price are found with a binary search.
+    """
+
+    _field = "WOU"
+
+    def __init__(
+        self,
+        orders: Orders,
+        streaming: IGStreamingClient,
+        reconcile_interval: float = 300.0,
+    ) -> None:
+        """Initialize WorkingOrderBook from get_working_orders.
+        :param orders: Orders client used for REST snapshots.
+        :param streaming: Started IGStreamingClient.
+        :param reconcile_interval: Seconds between REST reconciliations,
+            or None to only reconcile when reconcile() is called.
+        """
+        self._by_epic = {}
+        self._levels = {}
+        super().__init__(orders, streaming, reconcile_interval)
+
+    def _normalize(self, record: dict) -> dict:
+        # REST v2 names these orderLevel and orderSize.
+        if "orderLevel" in record:
+            record["level"] = record.pop("orderLevel")
+        if "orderSize" in record:
+            record["size"] = record.pop("orderSize")
+        record["level"] = float(record["level"])
+        return record
+
+    def _fetch(self) -> list:
+        response = self.orders.get_working_orders()
+        return [
+            self._normalize(dict(item["workingOrderData"]))
+            for item in response.get("workingOrders", [])
+        ]
+
+    def _add(self, record: dict) -> None:
+        deal_id, epic = record["dealId"], record["epic"]
+        self._by_epic.setdefault(epic, {})[deal_id] = record
+        key = (epic, record["direction"])
+        levels, ids = self._levels.setdefault(key, ([], []))
+        i = bisect_right(levels, record["level"])
+        levels.insert(i, record["level"])
+        ids.insert(i, deal_id)
+
+    def _remove(self, record: dict) -> None:
+        deal_id, epic = record["dealId"], record["epic"]
+        deals = self._by_epic.get(epic, {})
+        deals.pop(deal_id, None)
+        if not deals:
+            self._by_epic.pop(epic, None)
+        key = (epic, record["direction"])
+        levels, ids = self._levels.get(key, ([], []))
+        start = bisect_left(levels, record["level"])
+        stop = bisect_right(levels, record["level"])
+        for i in range(start, stop):
+            if ids[i] == deal_id:
+                del levels[i], ids[i]
+                break
+        if not levels:
+            self._levels.pop(key, None)
+
+    def by_epic(self, epic: str) -> list:
+        """Return the working orders on an epic."""
+        with self._lock:
+            return list(self._by_epic.get(epic, {}).values())
+
+    def working_orders(self) -> list:
+        """Return every working order."""
+        with self._lock:
+            return list(self._by_id.values())
+
+    def near(
+        self, epic: str, price: float, points: float, direction: str = None
+    ) -> list:
+        """Return orders on epic with a level within points of price.
+
+        Points are in the market's price units. Results are in level
+        order, optionally only for one direction ("BUY" or "SELL").
+        """
+        directions = [direction] if direction else ["BUY", "SELL"]
+        found = []
+        with self._lock:
+            for d in directions:
+                levels, ids = self._levels.get((epic, d), ([], []))
+                start = bisect_left(levels, price - points)
+                stop = bisect_right(levels, price + points)
+                found.extend(self._by_id[i] for i in ids[start:stop])
+        found.sort(key=lambda record: record["level"])
+        return found
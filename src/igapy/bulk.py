@@ -0,0 +1,122 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .confirm import DealConfirmer
+    from .orders import Orders
+
+
+class BulkOrderReport:
+    """Per-deal outcome of a BulkOrders action.
+
+    failed only holds deals whose delete request failed, so they are safe
+    to retry. Deals whose delete was sent but whose confirmation could
+    not be fetched are in unconfirmed as (deal_id, response, error), with
+    the dealReference in the response; check them before retrying.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty BulkOrderReport."""
+        self.completed = []
+        self.rejected = []
+        self.failed = []
+        self.unconfirmed = []
+        self.confirms = {}
+
+    @property
+    def ok(self) -> bool:
+        """True if every deal was accepted."""
+        return not (self.failed or self.rejected or self.unconfirmed)
+
+
+class BulkOrders:
+    """Concurrent position closes and working-order cancels.
+
+    Deletions run on a bounded thread pool through the client, so they
+    are paced by its rate limiter's trading lane. With a DealConfirmer,
+    each deal's confirmation is collected from the stream as well.
+    """
+
+    def __init__(
+        self,
+        orders: Orders,
+        max_workers: int = 10,
+        confirmer: DealConfirmer = None,
+    ) -> None:
+        """Initialize BulkOrders.
+        :param max_workers: Maximum concurrent requests.
+        :param confirmer: Optional DealConfirmer used to confirm deals.
+        """
+        self.orders = orders
+        self.max_workers = max_workers
+        self.confirmer = confirmer
+
+    def _run(
+        self, deal_ids: list, action: Callable[[str], dict]
+    ) -> BulkOrderReport:
+        def call(deal_id):
+            response = action(deal_id)
+            reference = (response or {}).get("dealReference")
+            if self.confirmer is None or not reference:
+                return response, None, None
+            try:
+                return response, self.confirmer.confirm(reference), None
+            except Exception as e:
+                return response, None, e
+
+        report = BulkOrderReport()
+        if not deal_ids:
+            return report
+        workers = min(self.max_workers, len(deal_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(d, pool.submit(call, d)) for d in deal_ids]
+            for deal_id, future in futures:
+                try:
+                    response, confirm, error = future.result()
+                except Exception as e:
+                    report.failed.append((deal_id, e))
+                    continue
+                if error is not None:
+                    report.unconfirmed.append((deal_id, response, error))
+                    continue
+                if confirm is not None:
+                    report.confirms[deal_id] = confirm
+                    if confirm.get("dealStatus") == "REJECTED":
+                        report.rejected.append((deal_id, confirm))
+                        continue
+                report.completed.append((deal_id, response))
+        return report
+
+    def close_positions(self, deal_ids: list) -> BulkOrderReport:
+        """Close positions by deal id concurrently."""
+        return self._run(list(deal_ids), self.orders.delete_position)
+
+    def close_by_epic(self, epic: str) -> BulkOrderReport:
+        """Close every open position on an epic."""
+        return self.close_positions(self._position_ids(epic))
+
+    def flatten(self) -> BulkOrderReport:
+        """Close every open position."""
+        return self.close_positions(self._position_ids())
+
+    def cancel_working_orders(self, deal_ids: list) -> BulkOrderReport:
+        """Cancel working orders by deal id concurrently."""
+        return self._run(list(deal_ids), self.orders.delete_working_order)
+
+    def cancel_all(self, epic: str = None) -> BulkOrderReport:
+        """Cancel every working order, or those on one epic."""
+        items = self.orders.get_working_orders().get("workingOrders", [])
+        return self.cancel_working_orders(
+            item["workingOrderData"]["dealId"]
+            for item in items
+            if epic is None or item["workingOrderData"]["epic"] == epic
+        )
+
+    def _position_ids(self, epic: str = None) -> list:
+        items = self.orders.get_positions().get("positions", [])
+        return [
+            item["position"]["dealId"]
+            for item in items
+            if epic is None or item["market"]["epic"] == epic
+        ]
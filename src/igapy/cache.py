@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Callable
+
+# Reference data that rarely changes, with TTLs in seconds.
+DEFAULT_CACHE_TTLS = {
+    "/markets/*": 60.0,
+    "/market-navigation": 3600.0,
+    "/market-navigation/*": 3600.0,
+    "/accounts/preferences": 300.0,
+    "/repeat-dealing-window": 300.0,
+}
+
+
+class ResponseCache:
+    """Thread-safe TTL and LRU cache for GET responses.
+
+    Only paths matching one of the TTL patterns are cached. Cached
+    responses are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        ttls: dict = None,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize ResponseCache.
+        :param ttls: Mapping of fnmatch path pattern to TTL in seconds.
+            Defaults to DEFAULT_CACHE_TTLS.
+        :param maxsize: Maximum number of cached responses.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL for a path, or None if it is not cacheable."""
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    def get(self, key: tuple):
+        """Return a cached response, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: tuple, value: dict, ttl: float) -> None:
+        """Store a response for ttl seconds, evicting the oldest entries."""
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, pattern: str = None) -> int:
+        """Drop entries whose path matches pattern, or all entries.
+
+        Returns the number of entries removed.
+        """
+        with self._lock:
+            if pattern is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [k for k in self._entries if fnmatchcase(k[0], pattern)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,15 +1,38 @@
+import json
+import time
+
 import requests
+from .allowance import AllowanceTracker
+from .cache import ResponseCache
 from .exceptions import ApiKeyMissingError, IGAPIError
-from .utils import build_headers
+from .metrics import PARSE, SEND, SERIALIZE, MetricsSink
+from .ratelimit import TRADING, RateLimiter
+from .singleflight import SingleFlight
+from .utils import build_headers, request_key
 
 
 class IGClient:
     """Authenticated IG REST API client."""
 
     def __init__(
-        self, api_key: str, username: str, password: str, is_demo: bool = True
+        self,
+        api_key: str,
+        username: str,
+        password: str,
+        is_demo: bool = True,
+        rate_limiter: RateLimiter = None,
+        cache: ResponseCache = None,
+        coalesce: bool = False,
+        metrics: MetricsSink = None,
     ) -> None:
-        """Initialize IGClient."""
+        """Initialize IGClient.
+        :param rate_limiter: Optional RateLimiter that paces every request.
+        :param cache: Optional ResponseCache for reference-data GETs.
+        :param coalesce: If True, concurrent identical GETs share one
+            in-flight request.
+        :param metrics: Optional sink for serialize, send and parse
+            timings of trading requests, tagged with the order's epic.
+        """
         self.api_key = api_key
         self.username = username
         self.password = password
@@ -20,6 +43,11 @@ class IGClient:
             else "https://api.ig.com/gateway/deal"
         )
         self.session = requests.Session()
+        self.rate_limiter = rate_limiter
+        self.allowance = AllowanceTracker()
+        self.cache = cache
+        self._single_flight = SingleFlight() if coalesce else None
+        self.metrics = metrics
 
     def login(self) -> dict:
         """Authenticate and start session."""
@@ -46,32 +74,88 @@ class IGClient:
         return self.session_data
 
     def get(self, path: str, params: dict = None) -> dict:
-        """Send GET request."""
-        url = self.base_url + path
-        headers = build_headers(self)
-        resp = self.session.get(url, params=params, headers=headers)
-        return self._handle_response(resp)
+        """Send GET request, served from the cache when possible."""
+        ttl = self.cache.ttl_for(path) if self.cache is not None else None
+        if ttl is None:
+            return self._fetch(path, params)
+        key = request_key(path, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._fetch(path, params)
+        self.cache.set(key, result, ttl)
+        return result
+
+    def _fetch(self, path: str, params: dict = None) -> dict:
+        """Send GET request, coalesced with identical in-flight GETs."""
+        if self._single_flight is None:
+            return self._request("GET", path, params=params)
+        return self._single_flight.do(
+            request_key(path, params),
+            lambda: self._request("GET", path, params=params),
+        )
 
     def post(self, path: str, data: dict) -> dict:
         """Send POST request."""
-        url = self.base_url + path
-        headers = build_headers(self)
-        resp = self.session.post(url, json=data, headers=headers)
-        return self._handle_response(resp)
+        return self._write("POST", path, data)
 
     def put(self, path: str, data: dict) -> dict:
         """Send PUT request."""
-        url = self.base_url + path
-        headers = build_headers(self)
-        resp = self.session.put(url, json=data, headers=headers)
-        return self._handle_response(resp)
+        return self._write("PUT", path, data)
 
     def delete(self, path: str) -> dict:
         """Send DELETE request."""
+        return self._write("DELETE", path)
+
+    def _write(self, method: str, path: str, data: dict = None) -> dict:
+        """Send a write request and drop cached responses for its path."""
+        try:
+            return self._request(method, path, data=data)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(path)
+
+    def _request(
+        self, method: str, path: str, params: dict = None, data: dict = None
+    ) -> dict:
+        """Send request, paced by the rate limiter if one is configured."""
         url = self.base_url + path
         headers = build_headers(self)
-        resp = self.session.delete(url, headers=headers)
-        return self._handle_response(resp)
+        lane = None
+        if self.rate_limiter is not None:
+            lane = self.rate_limiter.lane(method, path)
+            self.rate_limiter.acquire(lane)
+        timed = (
+            self.metrics is not None
+            and RateLimiter.lane(method, path) == TRADING
+        )
+        if timed:
+            # Encode here so serialization is timed apart from the send;
+            # allow_nan=False matches what requests does for json=.
+            epic = data.get("epic") if data else None
+            start = time.perf_counter()
+            body = {"data": json.dumps(data, allow_nan=False)}
+            sent = time.perf_counter()
+            self.metrics.record(SERIALIZE, sent - start, epic)
+        else:
+            body = {"json": data}
+        if method == "GET":
+            resp = self.session.get(url, params=params, headers=headers)
+        elif method == "POST":
+            resp = self.session.post(url, headers=headers, **body)
+        elif method == "PUT":
+            resp = self.session.put(url, headers=headers, **body)
+        else:
+            resp = self.session.delete(url, headers=headers)
+        if timed:
+            received = time.perf_counter()
+            self.metrics.record(SEND, received - sent, epic)
+        if lane and resp.status_code == 403 and "exceeded" in resp.text:
+            self.rate_limiter.penalize(lane, resp.text)
+        result = self._handle_response(resp)
+        if timed:
+            self.metrics.record(PARSE, time.perf_counter() - received, epic)
+        return result
 
     def _handle_response(self, resp) -> dict:
         """Handle API response."""
@@ -0,0 +1,211 @@
+from __future__ import annotations
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import TYPE_CHECKING
+
+from .metrics import CONFIRM, OPU, MetricsSink
+
+if TYPE_CHECKING:
+    from .orders import AsyncOrders, Orders
+    from .streaming import IGStreamingClient
+
+# Most confirms kept for deals nobody is waiting on yet.
+_BUFFER_SIZE = 256
+
+
+class _Confirmations:
+    """Matches streamed CONFIRMS to waiting deal references."""
+
+    def __init__(
+        self,
+        orders,
+        streaming: IGStreamingClient,
+        timeout: float,
+        metrics: MetricsSink,
+    ):
+        self.orders = orders
+        self.streaming = streaming
+        self.timeout = timeout
+        self.metrics = metrics
+        self.stream_confirms = 0
+        self.rest_confirms = 0
+        self._pending = {}
+        self._early = OrderedDict()
+        # Send times of placed deals with the stages still to record, and
+        # stream arrival times seen before a deal was placed, for the
+        # confirm and OPU latency metrics.
+        self._sent = {}
+        self._arrived = OrderedDict()
+        self._lock = threading.Lock()
+        streaming.add_trade_listener(self._on_trade)
+
+    def wait_for(self, deal_reference: str) -> Future:
+        """Return a Future resolved by the streamed confirm for a deal."""
+        with self._lock:
+            future = self._pending.get(deal_reference)
+            if future is not None:
+                return future
+            future = Future()
+            early = self._early.pop(deal_reference, None)
+            if early is None:
+                self._pending[deal_reference] = future
+        if early is not None:
+            future.set_result(early)
+        return future
+
+    def _on_trade(self, data: dict) -> None:
+        now = time.perf_counter()
+        if self.metrics is not None and data.get("OPU"):
+            self._on_opu(data["OPU"], now)
+        raw = data.get("CONFIRMS")
+        if not raw:
+            return
+        confirm = json.loads(raw) if isinstance(raw, str) else raw
+        reference = confirm.get("dealReference")
+        if self.metrics is not None:
+            self._timed(CONFIRM, reference, now)
+        with self._lock:
+            future = self._pending.pop(reference, None)
+            if future is None:
+                self._early[reference] = confirm
+                while len(self._early) > _BUFFER_SIZE:
+                    self._early.popitem(last=False)
+                return
+            self.stream_confirms += 1
+        try:
+            future.set_result(confirm)
+        except InvalidStateError:
+            pass  # cancelled by an async waiter that timed out
+
+    def _on_opu(self, raw, now: float) -> None:
+        update = json.loads(raw) if isinstance(raw, str) else raw
+        self._timed(OPU, update.get("dealReference"), now)
+
+    def _timed(self, stage: str, reference: str, now: float) -> None:
+        """Record a stage's latency, or keep its time until the send."""
+        with self._lock:
+            sent = self._sent.get(reference)
+            if sent is None:
+                self._arrived[(stage, reference)] = now
+                while len(self._arrived) > _BUFFER_SIZE:
+                    self._arrived.popitem(last=False)
+                return
+            start, epic, waiting = sent
+            if stage not in waiting:
+                return
+            waiting.discard(stage)
+            if not waiting:
+                del self._sent[reference]
+        self.metrics.record(stage, now - start, epic)
+
+    def _mark_sent(self, reference: str, start: float, epic: str) -> None:
+        if self.metrics is None:
+            return
+        with self._lock:
+            self._sent[reference] = (start, epic, {CONFIRM, OPU})
+            while len(self._sent) > _BUFFER_SIZE:
+                self._sent.pop(next(iter(self._sent)))
+            arrived = [
+                (stage, self._arrived.pop((stage, reference)))
+                for stage in (CONFIRM, OPU)
+                if (stage, reference) in self._arrived
+            ]
+        for stage, now in arrived:
+            self._timed(stage, reference, now)
+
+    def _discard(self, deal_reference: str) -> None:
+        with self._lock:
+            self._pending.pop(deal_reference, None)
+            self.rest_confirms += 1
+
+    def close(self) -> None:
+        """Stop listening to the TRADE stream."""
+        self.streaming.remove_trade_listener(self._on_trade)
+
+
+class DealConfirmer(_Confirmations):
+    """Deal confirmation from the TRADE stream instead of polling.
+
+    Confirms are matched by dealReference as they stream in. Only if none
+    arrives within timeout seconds is get_confirms called over REST.
+    """
+
+    def __init__(
+        self,
+        orders: Orders,
+        streaming: IGStreamingClient,
+        timeout: float = 2.0,
+        metrics: MetricsSink = None,
+    ) -> None:
+        """Initialize DealConfirmer.
+        :param orders: Orders client used to place deals and as fallback.
+        :param streaming: Started IGStreamingClient.
+        :param timeout: Seconds to wait for a streamed confirm.
+        :param metrics: Optional sink for the time from sending an order
+            to its streamed confirm and OPU, tagged with the epic.
+        """
+        super().__init__(orders, streaming, timeout, metrics)
+
+    def confirm(self, deal_reference: str, timeout: float = None) -> dict:
+        """Wait for a deal's confirm, falling back to get_confirms."""
+        future = self.wait_for(deal_reference)
+        try:
+            return future.result(self.timeout if timeout is None else timeout)
+        except FutureTimeout:
+            self._discard(deal_reference)
+            return self.orders.get_confirms(deal_reference)
+
+    def place_and_confirm(self, order: dict, timeout: float = None) -> dict:
+        """Create an OTC position and return its deal confirmation."""
+        reference = order.get("dealReference")
+        if reference:
+            self.wait_for(reference)
+        start = time.perf_counter()
+        reference = self.orders.create_otc_position(order)["dealReference"]
+        self._mark_sent(reference, start, order.get("epic"))
+        return self.confirm(reference, timeout)
+
+
+class AsyncDealConfirmer(_Confirmations):
+    """Async deal confirmation from the TRADE stream."""
+
+    def __init__(
+        self,
+        orders: AsyncOrders,
+        streaming: IGStreamingClient,
+        timeout: float = 2.0,
+        metrics: MetricsSink = None,
+    ) -> None:
+        """Initialize AsyncDealConfirmer."""
+        super().__init__(orders, streaming, timeout, metrics)
+
+    async def confirm(
+        self, deal_reference: str, timeout: float = None
+    ) -> dict:
+        """Wait for a deal's confirm, falling back to get_confirms."""
+        future = asyncio.wrap_future(self.wait_for(deal_reference))
+        try:
+            return await asyncio.wait_for(
+                future, self.timeout if timeout is None else timeout
+            )
+        except asyncio.TimeoutError:
+            self._discard(deal_reference)
+            return await self.orders.get_confirms(deal_reference)
+
+    async def place_and_confirm(
+        self, order: dict, timeout: float = None
+    ) -> dict:
+        """Create an OTC position and return its deal confirmation."""
+        reference = order.get("dealReference")
+        if reference:
+            self.wait_for(reference)
+        start = time.perf_counter()
+        response = await self.orders.create_otc_position(order)
+        reference = response["dealReference"]
+        self._mark_sent(reference, start, order.get("epic"))
+        return await self.confirm(reference, timeout)
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class CostsAndCharges:
@@ -35,3 +36,35 @@ class CostsAndCharges:
         return self.client.get(
             f"/indicativecostsandcharges/history/from/{from_date}/to/{to_date}"
         )
+
+
+class AsyncCostsAndCharges:
+    """Async client for IG costs and charges endpoints."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncCostsAndCharges."""
+        self.client = client
+
+    async def close_costs(self, data: dict) -> dict:
+        """Close costs and charges."""
+        return await self.client.post("/indicativecostsandcharges/close", data)
+
+    async def open_costs(self, data: dict) -> dict:
+        """Open costs and charges."""
+        return await self.client.post("/indicativecostsandcharges/open", data)
+
+    async def edit_costs(self, data: dict) -> dict:
+        """Edit costs and charges."""
+        return await self.client.post("/indicativecostsandcharges/edit", data)
+
+    async def download_pdf(self, reference: str) -> dict:
+        """Download costs PDF by reference."""
+        return await self.client.get(
+            f"/indicativecostsandcharges/durablemedium/{reference}"
+        )
+
+    async def history_costs(self, from_date: str, to_date: str) -> dict:
+        """Get costs history for date range."""
+        return await self.client.get(
+            f"/indicativecostsandcharges/history/from/{from_date}/to/{to_date}"
+        )
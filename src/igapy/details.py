@@ -0,0 +1,133 @@
+from __future__ import annotations
+import threading
+from typing import TYPE_CHECKING
+
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from .markets import Markets
+    from .streaming import IGStreamingClient
+
+# MARKET item fields the cache listens to.
+MARKET_FIELDS = ["MARKET_STATE", "UPDATE_TIME", "BID", "OFFER"]
+
+# Streaming MARKET_STATE values whose REST marketStatus is spelt
+# differently; the rest are the same in both APIs.
+_REST_STATUS = {
+    "EDIT": "EDITS_ONLY",
+    "AUCTION": "ON_AUCTION",
+    "AUCTION_NO_EDIT": "ON_AUCTION_NO_EDITS",
+}
+
+
+def _price(value):
+    return float(value) if value not in (None, "") else None
+
+
+class MarketDetailsCache:
+    """Market details kept fresh by the MARKET stream instead of a TTL.
+
+    Each cached epic is subscribed to MARKET_STATE, UPDATE_TIME, BID and
+    OFFER. Price and time updates are patched into the cached snapshot.
+    A market state change can come with new dealing rules, so it drops
+    the entry and the next lookup goes back to REST. Cached details are
+    shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, markets: Markets, streaming: IGStreamingClient) -> None:
+        """Initialize MarketDetailsCache.
+        :param markets: Markets client used to fetch details over REST.
+        :param streaming: Started IGStreamingClient for MARKET updates.
+        """
+        self.markets = markets
+        self.streaming = streaming
+        self.fetches = 0
+        self._entries = {}
+        self._versions = {}
+        self._states = {}
+        self._subscribed = set()
+        self._single_flight = SingleFlight()
+        self._lock = threading.Lock()
+
+    def get_market_details(self, epic: str) -> dict:
+        """Return cached details, fetching over REST only on a miss."""
+        with self._lock:
+            entry = self._entries.get(epic)
+        if entry is not None:
+            return entry
+        return self._single_flight.do(epic, lambda: self._load(epic))
+
+    def _load(self, epic: str) -> dict:
+        self._subscribe(epic)
+        with self._lock:
+            version = self._versions.get(epic, 0)
+        self.fetches += 1
+        details = self.markets.get_market_details(epic)
+        with self._lock:
+            # A state change while fetching may mean details are stale.
+            if self._versions.get(epic, 0) == version:
+                self._entries[epic] = details
+        return details
+
+    def _subscribe(self, epic: str) -> None:
+        with self._lock:
+            if epic in self._subscribed:
+                return
+            self._subscribed.add(epic)
+        self.streaming.subscribe_market(
+            epic, MARKET_FIELDS, lambda data: self._on_update(epic, data)
+        )
+
+    def _on_update(self, epic: str, data: dict) -> None:
+        changed = False
+        with self._lock:
+            entry = self._entries.get(epic)
+            state = data.get("MARKET_STATE")
+            if state is not None:
+                status = _REST_STATUS.get(state, state)
+                previous = self._states.get(epic)
+                self._states[epic] = status
+                cached = entry and entry.get("snapshot", {}).get(
+                    "marketStatus"
+                )
+                changed = (previous is not None and previous != status) or (
+                    entry is not None and cached != status
+                )
+            if changed:
+                self._versions[epic] = self._versions.get(epic, 0) + 1
+                self._entries.pop(epic, None)
+            elif entry is not None:
+                snapshot = dict(entry.get("snapshot") or {})
+                if data.get("BID") is not None:
+                    snapshot["bid"] = _price(data["BID"])
+                if data.get("OFFER") is not None:
+                    snapshot["offer"] = _price(data["OFFER"])
+                if data.get("UPDATE_TIME") is not None:
+                    snapshot["updateTime"] = data["UPDATE_TIME"]
+                # Copy on write so readers never see a half-applied update.
+                self._entries[epic] = dict(entry, snapshot=snapshot)
+        if changed:
+            cache = getattr(self.markets.client, "cache", None)
+            if cache is not None:
+                cache.invalidate(f"/markets/{epic}")
+
+    def invalidate(self, epic: str = None) -> None:
+        """Drop one epic's details, or all of them."""
+        with self._lock:
+            epics = [epic] if epic is not None else list(self._entries)
+            for e in epics:
+                self._versions[e] = self._versions.get(e, 0) + 1
+                self._entries.pop(e, None)
+
+    def close(self) -> None:
+        """Unsubscribe from every MARKET item and clear the cache."""
+        with self._lock:
+            epics = list(self._subscribed)
+            self._subscribed.clear()
+            self._entries.clear()
+            self._states.clear()
+        for epic in epics:
+            self.streaming.unsubscribe_market(epic)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,265 @@
+import threading
+from collections import OrderedDict, deque
+from queue import SimpleQueue
+from typing import Callable, Hashable
+
+# Overflow policies for a full channel.
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+CONFLATE = "conflate"
+POLICIES = (BLOCK, DROP_OLDEST, CONFLATE)
+
+# Updates a worker delivers from one channel before yielding to others.
+_BATCH = 64
+
+_EMPTY = object()
+
+
+class BoundedQueue:
+    """Bounded FIFO of updates that applies an overflow policy when full.
+
+    BLOCK waits for room, DROP_OLDEST discards the oldest update and
+    CONFLATE replaces the queued update with the same key in place.
+    Callers hold cond around every call, so they can update their own
+    state together with the queue; a BLOCK put waits on cond.
+    """
+
+    def __init__(self, maxsize: int, policy: str) -> None:
+        """Initialize BoundedQueue.
+        :param maxsize: Most updates held at once.
+        :param policy: BLOCK, DROP_OLDEST or CONFLATE.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        if maxsize < 1:
+            raise ValueError("Queue size must be at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.conflated = 0
+        self.closed = False
+        self.cond = threading.Condition()
+        self._items = OrderedDict() if policy == CONFLATE else deque()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, key: Hashable, value) -> bool:
+        """Add an update, keyed for CONFLATE; False if the queue closed."""
+        items = self._items
+        if self.closed:
+            return False
+        if self.policy == CONFLATE:
+            if key in items:
+                self.conflated += 1
+            elif len(items) >= self.maxsize:
+                items.popitem(last=False)
+                self.dropped += 1
+            items[key] = value
+            return True
+        if len(items) >= self.maxsize:
+            if self.policy == DROP_OLDEST:
+                items.popleft()
+                self.dropped += 1
+            else:
+                while len(items) >= self.maxsize and not self.closed:
+                    self.cond.wait()
+                if self.closed:
+                    return False
+        items.append(value)
+        return True
+
+    def get(self):
+        """Remove and return the oldest update, or _EMPTY."""
+        if not self._items:
+            return _EMPTY
+        if self.policy == CONFLATE:
+            value = self._items.popitem(last=False)[1]
+        else:
+            value = self._items.popleft()
+        self.cond.notify_all()
+        return value
+
+    def drain(self) -> list:
+        """Remove and return every update, oldest first."""
+        items = self._items
+        values = list(items.values() if self.policy == CONFLATE else items)
+        items.clear()
+        self.cond.notify_all()
+        return values
+
+    def close(self) -> None:
+        """Refuse further updates and wake any blocked producer."""
+        self.closed = True
+        self.cond.notify_all()
+
+
+class Channel:
+    """Bounded buffer between a producer and one callback.
+
+    Calling the channel enqueues its arguments, so it can be passed as a
+    streaming callback. List and dict arguments are copied on enqueue,
+    since changed_only subscriptions reuse one values list per item.
+    Updates are delivered in order by at most one worker at a time. With
+    CONFLATE, a new update replaces the queued one with the same key,
+    keeping only the latest value per item; for changed_only callbacks
+    the delivered mask then only covers the latest update.
+    """
+
+    def __init__(
+        self,
+        dispatcher: "Dispatcher",
+        name: str,
+        callback: Callable,
+        maxsize: int,
+        policy: str,
+        key: Callable[..., Hashable] = None,
+    ) -> None:
+        """Initialize Channel; use Dispatcher.channel instead."""
+        self.name = name
+        self.callback = callback
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self.delivered = 0
+        self.errors = 0
+        self._dispatcher = dispatcher
+        self._queue = BoundedQueue(maxsize, policy)
+        self._cond = self._queue.cond
+        self._scheduled = False
+
+    @property
+    def depth(self) -> int:
+        """Number of updates waiting to be delivered."""
+        return len(self._queue)
+
+    @property
+    def dropped(self) -> int:
+        """Updates discarded because the channel was full."""
+        return self._queue.dropped
+
+    @property
+    def conflated(self) -> int:
+        """Updates replaced by a later one for the same key."""
+        return self._queue.conflated
+
+    def __call__(self, *args) -> None:
+        """Enqueue an update, applying the overflow policy if full."""
+        args = tuple(
+            arg.copy() if isinstance(arg, (list, dict)) else arg
+            for arg in args
+        )
+        key = None
+        if self.key is not None and self.policy == CONFLATE:
+            key = self.key(*args)
+        with self._cond:
+            self._queue.put(key, args)
+            schedule = not self._scheduled
+            self._scheduled = True
+        if schedule:
+            self._dispatcher._ready.put(self)
+
+    def _take(self):
+        with self._cond:
+            args = self._queue.get()
+            if args is _EMPTY:
+                self._scheduled = False
+                self._cond.notify_all()
+            return args
+
+    def stats(self) -> dict:
+        """Return depth and delivery counters."""
+        return {
+            "depth": self.depth,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+            "errors": self.errors,
+        }
+
+
+class Dispatcher:
+    """Worker pool that runs callbacks off the Lightstreamer thread.
+
+    Each channel is served by one worker at a time, so updates for an
+    item keep their order while different channels run in parallel. A
+    slow callback only backs up its own channel.
+    """
+
+    def __init__(
+        self, workers: int = 4, maxsize: int = 1024, policy: str = BLOCK
+    ) -> None:
+        """Initialize Dispatcher and start its workers.
+        :param workers: Number of worker threads.
+        :param maxsize: Default channel capacity.
+        :param policy: Default overflow policy: BLOCK, DROP_OLDEST or
+            CONFLATE.
+        """
+        self.maxsize = maxsize
+        self.policy = policy
+        self.channels = {}
+        self._ready = SimpleQueue()
+        self._threads = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def channel(
+        self,
+        name: str,
+        callback: Callable,
+        maxsize: int = None,
+        policy: str = None,
+        key: Callable[..., Hashable] = None,
+    ) -> Channel:
+        """Create a channel delivering to callback.
+
+        :param key: For CONFLATE, maps an update's arguments to its item,
+            e.g. lambda epic, data: epic. Without it the whole channel
+            conflates to its latest update.
+        """
+        channel = Channel(
+            self,
+            name,
+            callback,
+            maxsize or self.maxsize,
+            policy or self.policy,
+            key,
+        )
+        self.channels[name] = channel
+        return channel
+
+    def _work(self) -> None:
+        while True:
+            channel = self._ready.get()
+            if channel is None:
+                return
+            for _ in range(_BATCH):
+                args = channel._take()
+                if args is _EMPTY:
+                    break
+                try:
+                    channel.callback(*args)
+                    channel.delivered += 1
+                except Exception as e:
+                    channel.errors += 1
+                    print(f"[ERROR] Exception in {channel.name} callback: {e}")
+            else:
+                self._ready.put(channel)
+
+    def stats(self) -> dict:
+        """Return stats for every channel by name."""
+        return {name: ch.stats() for name, ch in self.channels.items()}
+
+    def close(self) -> None:
+        """Deliver every queued update, then stop the workers."""
+        for channel in list(self.channels.values()):
+            with channel._cond:
+                while channel._scheduled:
+                    channel._cond.wait()
+        for _ in self._threads:
+            self._ready.put(None)
+        for thread in self._threads:
+            thread.join()
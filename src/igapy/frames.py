@@ -0,0 +1,116 @@
+from array import array
+from datetime import datetime
+from .utils import to_epoch_ms
+
+TIMESTAMP = "timestamp"
+
+# Column name -> (price field, side) in a prices response snapshot.
+PRICE_COLUMNS = {
+    f"{side}_{part}": (f"{part}Price", key)
+    for side, key in (("bid", "bid"), ("ask", "ask"), ("last", "lastTraded"))
+    for part in ("open", "high", "low", "close")
+}
+VOLUME = "volume"
+COLUMNS = (TIMESTAMP, *PRICE_COLUMNS, VOLUME)
+
+_NAN = float("nan")
+
+
+def parse_snapshot_time(snapshot: dict) -> int:
+    """Return a snapshot's time as epoch milliseconds.
+
+    Uses snapshotTimeUTC when present, otherwise snapshotTime (treated as
+    UTC) in either the ISO or the "yyyy/MM/dd hh:mm:ss" format.
+    """
+    text = snapshot.get("snapshotTimeUTC") or snapshot["snapshotTime"]
+    return to_epoch_ms(datetime.fromisoformat(text.replace("/", "-")))
+
+
+def column_typecode(name: str) -> str:
+    """Return the array typecode used for a column."""
+    return "q" if name == TIMESTAMP else "d"
+
+
+class PriceFrame:
+    """Columnar OHLCV prices backed by contiguous typed buffers.
+
+    The timestamp column holds int64 epoch milliseconds and every other
+    column holds float64 values, with NaN for missing prices. Columns are
+    array.array or memoryview objects, so they expose the buffer protocol
+    and convert to NumPy or Arrow without copying.
+    """
+
+    def __init__(self, columns: dict = None) -> None:
+        """Initialize PriceFrame from a mapping of column name to buffer."""
+        if columns is None:
+            columns = {name: array(column_typecode(name)) for name in COLUMNS}
+        self.columns = columns
+
+    @classmethod
+    def from_response(cls, response: dict) -> "PriceFrame":
+        """Decode a prices response into columns."""
+        frame = cls()
+        cols = frame.columns
+        timestamps = cols[TIMESTAMP]
+        volumes = cols[VOLUME]
+        price_cols = [
+            (cols[name], field, key)
+            for name, (field, key) in PRICE_COLUMNS.items()
+        ]
+        for snapshot in response.get("prices", []):
+            timestamps.append(parse_snapshot_time(snapshot))
+            for column, field, key in price_cols:
+                value = (snapshot.get(field) or {}).get(key)
+                column.append(_NAN if value is None else value)
+            volume = snapshot.get("lastTradedVolume")
+            volumes.append(_NAN if volume is None else volume)
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.columns[TIMESTAMP])
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    def slice(self, start: int, stop: int) -> "PriceFrame":
+        """Return rows start:stop as zero-copy memoryview columns."""
+        return PriceFrame(
+            {
+                name: memoryview(column)[start:stop]
+                for name, column in self.columns.items()
+            }
+        )
+
+    def to_numpy(self) -> dict:
+        """Return columns as NumPy arrays sharing this frame's memory."""
+        import numpy as np
+
+        return {
+            name: np.frombuffer(
+                column, dtype=np.int64 if name == TIMESTAMP else np.float64
+            )
+            for name, column in self.columns.items()
+        }
+
+    def to_pandas(self):
+        """Return a pandas DataFrame indexed by UTC timestamp."""
+        import pandas as pd
+
+        arrays = self.to_numpy()
+        index = pd.to_datetime(arrays.pop(TIMESTAMP), unit="ms", utc=True)
+        return pd.DataFrame(arrays, index=index, copy=False)
+
+    def to_arrow(self):
+        """Return a pyarrow Table whose columns wrap this frame's buffers."""
+        import pyarrow as pa
+
+        length = len(self)
+        arrays = {}
+        for name, column in self.columns.items():
+            if name == TIMESTAMP:
+                kind = pa.timestamp("ms", tz="UTC")
+            else:
+                kind = pa.float64()
+            buffer = pa.py_buffer(column)
+            arrays[name] = pa.Array.from_buffers(kind, length, [None, buffer])
+        return pa.table(arrays)
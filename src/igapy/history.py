@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class History:
@@ -53,3 +54,59 @@ class History:
         return self.client.get(
             f"/history/transactions/{transaction_type}/{from_date}/{to_date}"
         )
+
+
+class AsyncHistory:
+    """Async client for IG history endpoints."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncHistory."""
+        self.client = client
+
+    async def get_activity(self, params: dict = None) -> dict:
+        """Get account activity history."""
+        return await self.client.get("/history/activity", params)
+
+    async def get_activity_by_period(self, last_period: str) -> dict:
+        """Get activity history for period."""
+        return await self.client.get(f"/history/activity/{last_period}")
+
+    async def get_activity_by_date_range(
+        self, from_date: str, to_date: str
+    ) -> dict:
+        """Get activity history for date range."""
+        return await self.client.get(
+            f"/history/activity/{from_date}/{to_date}"
+        )
+
+    async def get_transactions(self, params: dict = None) -> dict:
+        """Get transaction history."""
+        return await self.client.get("/history/transactions", params)
+
+    async def get_transactions_by_period(self, last_period: str) -> dict:
+        """Get transaction history for period."""
+        return await self.client.get(f"/history/transactions/{last_period}")
+
+    async def get_transactions_by_date_range(
+        self, from_date: str, to_date: str
+    ) -> dict:
+        """Get transaction history for date range."""
+        return await self.client.get(
+            f"/history/transactions/{from_date}/{to_date}"
+        )
+
+    async def get_transactions_by_type_and_period(
+        self, transaction_type: str, last_period: str
+    ) -> dict:
+        """Get transaction history by type and period."""
+        return await self.client.get(
+            f"/history/transactions/{transaction_type}/{last_period}"
+        )
+
+    async def get_transactions_by_type_and_date_range(
+        self, transaction_type: str, from_date: str, to_date: str
+    ) -> dict:
+        """Get transaction history by type and date range."""
+        return await self.client.get(
+            f"/history/transactions/{transaction_type}/{from_date}/{to_date}"
+        )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from .utils import MAX_IDS_PER_REQUEST, fetch_chunked, fetch_chunked_async
+
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class Markets:
@@ -20,9 +23,25 @@ class Markets:
         """Get market details."""
         return self.client.get(f"/markets/{epic}")
 
-    def get_markets(self, epics: list[str]) -> dict:
-        """Get multiple markets."""
-        return self.client.get("/markets", {"epics": ",".join(epics)})
+    def get_markets(
+        self,
+        epics: list[str],
+        chunk_size: int = MAX_IDS_PER_REQUEST,
+        max_workers: int = 8,
+    ) -> dict:
+        """Get multiple markets.
+
+        Long epic lists are fetched in concurrent chunks and merged in
+        input order; epics whose chunk failed are listed under "failed".
+        """
+        return fetch_chunked(
+            lambda part: self.client.get(
+                "/markets", {"epics": ",".join(part)}
+            ),
+            epics,
+            chunk_size,
+            max_workers,
+        )
 
     def get_market_navigation(self) -> dict:
         """Get market navigation tree."""
@@ -31,3 +50,39 @@ class Markets:
     def get_market_sub_nodes(self, node_id: str) -> dict:
         """Get sub-nodes for navigation node."""
         return self.client.get(f"/market-navigation/{node_id}")
+
+
+class AsyncMarkets:
+    """Async client for IG markets endpoints."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncMarkets."""
+        self.client = client
+
+    async def search_markets(self, search_term: str) -> dict:
+        """Search markets by term."""
+        return await self.client.get("/markets", {"searchTerm": search_term})
+
+    async def get_market_details(self, epic: str) -> dict:
+        """Get market details."""
+        return await self.client.get(f"/markets/{epic}")
+
+    async def get_markets(
+        self, epics: list[str], chunk_size: int = MAX_IDS_PER_REQUEST
+    ) -> dict:
+        """Get multiple markets, fetching long lists in concurrent chunks."""
+        return await fetch_chunked_async(
+            lambda part: self.client.get(
+                "/markets", {"epics": ",".join(part)}
+            ),
+            epics,
+            chunk_size,
+        )
+
+    async def get_market_navigation(self) -> dict:
+        """Get market navigation tree."""
+        return await self.client.get("/market-navigation")
+
+    async def get_market_sub_nodes(self, node_id: str) -> dict:
+        """Get sub-nodes for navigation node."""
+        return await self.client.get(f"/market-navigation/{node_id}")
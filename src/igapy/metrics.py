@@ -0,0 +1,124 @@
+import math
+import threading
+from typing import Protocol
+
+# Order-path stages, in the order they happen.
+SERIALIZE = "serialize"
+SEND = "send"
+PARSE = "parse"
+CONFIRM = "confirm"
+OPU = "opu"
+ORDER_STAGES = (SERIALIZE, SEND, PARSE, CONFIRM, OPU)
+
+# Time from a streaming disconnect to resubscribing after reconnecting.
+RECONNECT = "reconnect"
+
+# Bucket bounds grow by 1%, from 1 microsecond up.
+_GROWTH = math.log(1.01)
+_FLOOR = 1e-6
+
+
+class MetricsSink(Protocol):
+    """Anything that accepts latency samples, e.g. a StatsD adapter."""
+
+    def record(self, stage: str, seconds: float, epic: str = None) -> None:
+        """Record one latency sample for a stage."""
+
+
+class Histogram:
+    """Log-bucketed latency histogram with about 1% relative error."""
+
+    def __init__(self) -> None:
+        """Initialize an empty Histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets = {}
+
+    def record(self, seconds: float) -> None:
+        """Add a sample in seconds."""
+        index = int(math.log(max(seconds, _FLOOR) / _FLOOR) / _GROWTH)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def copy(self) -> "Histogram":
+        """Return an independent copy of the histogram."""
+        other = Histogram()
+        other.count = self.count
+        other.total = self.total
+        other.max = self.max
+        other._buckets = dict(self._buckets)
+        return other
+
+    def percentile(self, p: float) -> float:
+        """Return the p-th percentile in seconds, or None if empty."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                upper = _FLOOR * math.exp((index + 1) * _GROWTH)
+                return min(upper, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean sample in seconds, or None if empty."""
+        return self.total / self.count if self.count else None
+
+
+class LatencyMetrics:
+    """In-memory metrics sink keeping a histogram per stage and epic.
+
+    Every sample also counts towards the stage's all-epic histogram,
+    which is reported under epic None.
+    """
+
+    def __init__(self) -> None:
+        """Initialize LatencyMetrics."""
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float, epic: str = None) -> None:
+        """Record one latency sample for a stage."""
+        keys = (
+            [(stage, None)] if epic is None else [(stage, None), (stage, epic)]
+        )
+        with self._lock:
+            for key in keys:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram()
+                histogram.record(seconds)
+
+    def histogram(self, stage: str, epic: str = None) -> Histogram:
+        """Return a copy of the histogram for a stage and epic, or None.
+
+        The copy is taken under the lock, so it can be read while other
+        threads keep recording.
+        """
+        with self._lock:
+            histogram = self._histograms.get((stage, epic))
+            return None if histogram is None else histogram.copy()
+
+    def percentiles(
+        self, stage: str, epic: str = None, points=(50, 90, 99)
+    ) -> dict:
+        """Return {p: seconds} for a stage and epic, plus count."""
+        with self._lock:
+            histogram = self._histograms.get((stage, epic))
+            if histogram is None:
+                return {"count": 0}
+            result = {p: histogram.percentile(p) for p in points}
+            result["count"] = histogram.count
+        return result
+
+    def summary(self, points=(50, 90, 99)) -> dict:
+        """Return percentiles for every recorded stage and epic."""
+        with self._lock:
+            keys = list(self._histograms)
+        return {key: self.percentiles(*key, points=points) for key in keys}
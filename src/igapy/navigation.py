@@ -0,0 +1,168 @@
+from __future__ import annotations
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from .markets import Markets
+
+ROOT = ""
+
+
+class MarketIndex:
+    """Local snapshot of the market navigation tree and its markets.
+
+    nodes maps node id to a dict with name, parent, children, markets
+    (epics) and fetched_at; the root node has id "". markets maps epic to
+    the market summary from the navigation response plus its node id.
+    """
+
+    def __init__(
+        self, nodes: dict = None, markets: dict = None, snapshot_at=None
+    ) -> None:
+        """Initialize MarketIndex."""
+        self.nodes = nodes or {}
+        self.markets = markets or {}
+        self.snapshot_at = snapshot_at
+
+    def save(self, path: str) -> None:
+        """Write the index to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "snapshot_at": self.snapshot_at,
+                    "nodes": self.nodes,
+                    "markets": self.markets,
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "MarketIndex":
+        """Read an index saved with save()."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data["nodes"], data["markets"], data["snapshot_at"])
+
+    def remove_subtree(self, node_id: str) -> None:
+        """Drop a node, its descendants and their markets."""
+        stack = [node_id]
+        while stack:
+            node = self.nodes.pop(stack.pop(), None)
+            if node is None:
+                continue
+            stack.extend(node["children"])
+            for epic in node["markets"]:
+                self.markets.pop(epic, None)
+
+
+class MarketCrawler:
+    """Breadth-first navigation crawler with bounded concurrency.
+
+    Each tree level is fetched on a thread pool of at most max_workers
+    requests, paced by the client's rate limiter.
+    """
+
+    def __init__(
+        self,
+        markets: Markets,
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize MarketCrawler."""
+        self.markets = markets
+        self.max_workers = max_workers
+        self._clock = clock
+        self.failed = []
+
+    def _fetch(self, node_id: str) -> dict:
+        if node_id == ROOT:
+            return self.markets.get_market_navigation()
+        return self.markets.get_market_sub_nodes(node_id)
+
+    def crawl(self) -> MarketIndex:
+        """Crawl the whole navigation tree into a new MarketIndex."""
+        index = MarketIndex()
+        index.nodes[ROOT] = self._node(ROOT, "", None)
+        self._walk(index, [ROOT])
+        return index
+
+    def recrawl(self, index: MarketIndex, max_age: float) -> MarketIndex:
+        """Refresh nodes fetched more than max_age seconds ago.
+
+        Fresh subtrees are kept as they are; stale nodes are refetched,
+        and children that are new or no longer listed are added or
+        removed with their subtrees.
+        """
+        cutoff = self._clock() - max_age
+        stale = {
+            node_id
+            for node_id, node in index.nodes.items()
+            if node["fetched_at"] is None or node["fetched_at"] < cutoff
+        }
+        # A stale parent revisits its stale children itself.
+        roots = [n for n in stale if index.nodes[n]["parent"] not in stale]
+        self._walk(index, roots, cutoff)
+        return index
+
+    @staticmethod
+    def _node(node_id: str, name: str, parent: str) -> dict:
+        return {
+            "id": node_id,
+            "name": name,
+            "parent": parent,
+            "children": [],
+            "markets": [],
+            "fetched_at": None,
+        }
+
+    def _walk(self, index: MarketIndex, level: list, cutoff=None) -> None:
+        self.failed = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while level:
+                futures = [(n, pool.submit(self._fetch, n)) for n in level]
+                level = []
+                for node_id, future in futures:
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        self.failed.append((node_id, e))
+                        continue
+                    level.extend(self._apply(index, node_id, response, cutoff))
+        index.snapshot_at = self._clock()
+
+    def _apply(self, index, node_id, response, cutoff) -> list:
+        """Store a node's response and return children still to fetch."""
+        node = index.nodes[node_id]
+        children = response.get("nodes") or []
+        new_ids = [child["id"] for child in children]
+        for old in set(node["children"]) - set(new_ids):
+            index.remove_subtree(old)
+        for epic in node["markets"]:
+            index.markets.pop(epic, None)
+        node["children"] = new_ids
+        node["markets"] = []
+        for market in response.get("markets") or []:
+            node["markets"].append(market["epic"])
+            index.markets[market["epic"]] = dict(market, node=node_id)
+        node["fetched_at"] = self._clock()
+        pending = []
+        for child in children:
+            existing = index.nodes.get(child["id"])
+            fresh = (
+                existing is not None
+                and cutoff is not None
+                and existing["fetched_at"] is not None
+                and existing["fetched_at"] >= cutoff
+            )
+            if fresh:
+                continue
+            if existing is None:
+                index.nodes[child["id"]] = self._node(
+                    child["id"], child["name"], node_id
+                )
+            else:
+                existing.update(name=child["name"], parent=node_id)
+            pending.append(child["id"])
+        return pending
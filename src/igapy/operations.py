@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class Operations:
@@ -23,3 +24,23 @@ class Operations:
     def disable_application(self) -> dict:
         """Disable an application."""
         return self.client.put("/operations/application/disable", {})
+
+
+class AsyncOperations:
+    """Async client for IG operations endpoints."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncOperations."""
+        self.client = client
+
+    async def list_applications(self) -> dict:
+        """List all applications."""
+        return await self.client.get("/operations/application")
+
+    async def update_application(self, data: dict) -> dict:
+        """Update an application."""
+        return await self.client.put("/operations/application", data)
+
+    async def disable_application(self) -> dict:
+        """Disable an application."""
+        return await self.client.put("/operations/application/disable", {})
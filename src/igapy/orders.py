@@ -3,17 +3,27 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
+    from .validation import OrderValidator
 
 
 class Orders:
     """Client for IG orders endpoints."""
 
-    def __init__(self, client: IGClient) -> None:
-        """Initialize Orders."""
+    def __init__(
+        self, client: IGClient, validator: OrderValidator = None
+    ) -> None:
+        """Initialize Orders.
+        :param validator: Optional OrderValidator run on new orders before
+            they are sent.
+        """
         self.client = client
+        self.validator = validator
 
     def create_otc_position(self, order: dict) -> dict:
         """Create OTC position."""
+        if self.validator is not None:
+            self.validator.validate(order)
         return self.client.post("/positions/otc", order)
 
     def get_positions(self) -> dict:
@@ -38,6 +48,8 @@ class Orders:
 
     def create_working_order(self, order: dict) -> dict:
         """Create working order."""
+        if self.validator is not None:
+            self.validator.validate(order)
         return self.client.post("/working-orders/otc", order)
 
     def delete_working_order(self, deal_id: str) -> dict:
@@ -47,3 +59,57 @@ class Orders:
     def get_confirms(self, deal_reference: str) -> dict:
         """Get deal confirmation."""
         return self.client.get(f"/confirms/{deal_reference}")
+
+
+class AsyncOrders:
+    """Async client for IG orders endpoints."""
+
+    def __init__(
+        self, client: AsyncIGClient, validator: OrderValidator = None
+    ) -> None:
+        """Initialize AsyncOrders.
+        :param validator: Optional OrderValidator run on new orders before
+            they are sent.
+        """
+        self.client = client
+        self.validator = validator
+
+    async def create_otc_position(self, order: dict) -> dict:
+        """Create OTC position."""
+        if self.validator is not None:
+            await self.validator.validate_async(order)
+        return await self.client.post("/positions/otc", order)
+
+    async def get_positions(self) -> dict:
+        """Get all open positions."""
+        return await self.client.get("/positions")
+
+    async def get_position(self, deal_id: str) -> dict:
+        """Get position by deal ID."""
+        return await self.client.get(f"/positions/{deal_id}")
+
+    async def update_position(self, deal_id: str, data: dict) -> dict:
+        """Update position by deal ID."""
+        return await self.client.put(f"/positions/{deal_id}", data)
+
+    async def delete_position(self, deal_id: str) -> dict:
+        """Delete position by deal ID."""
+        return await self.client.delete(f"/positions/{deal_id}")
+
+    async def get_working_orders(self) -> dict:
+        """Get all working orders."""
+        return await self.client.get("/working-orders")
+
+    async def create_working_order(self, order: dict) -> dict:
+        """Create working order."""
+        if self.validator is not None:
+            await self.validator.validate_async(order)
+        return await self.client.post("/working-orders/otc", order)
+
+    async def delete_working_order(self, deal_id: str) -> dict:
+        """Delete working order by deal ID."""
+        return await self.client.delete(f"/working-orders/otc/{deal_id}")
+
+    async def get_confirms(self, deal_reference: str) -> dict:
+        """Get deal confirmation."""
+        return await self.client.get(f"/confirms/{deal_reference}")
@@ -1,8 +1,10 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class Prices:
@@ -12,6 +14,12 @@ class Prices:
         """Initialize Prices."""
         self.client = client
 
+    def _get(self, path: str, params: dict = None) -> dict:
+        """Send GET request and record the reported data allowance."""
+        response = self.client.get(path, params)
+        self.client.allowance.update(response)
+        return response
+
     def get_prices(
         self,
         epic: str,
@@ -23,32 +31,129 @@ class Prices:
         page_number: int = 1,
     ) -> dict:
         """Get historical prices."""
-        params = {}
+        params = {"resolution": resolution}
         if from_date and to_date:
             params.update({"from": from_date, "to": to_date})
         if max_points is not None:
             params["max"] = max_points
         if page_size is not None:
             params.update({"pageSize": page_size, "pageNumber": page_number})
-        return self.client.get(f"/prices/{epic}", params)
+        return self._get(f"/prices/{epic}", params)
+
+    def iter_prices(
+        self,
+        epic: str,
+        resolution: str = "MINUTE",
+        from_date: str = None,
+        to_date: str = None,
+        max_points: int = None,
+        page_size: int = 20,
+    ) -> Iterator[dict]:
+        """Yield price snapshots across all pages.
+
+        Follows metadata.pageData and fetches the next page in the
+        background while the caller consumes the current one.
+        """
+
+        def fetch(page_number: int) -> dict:
+            return self.get_prices(
+                epic,
+                resolution,
+                from_date,
+                to_date,
+                max_points,
+                page_size,
+                page_number,
+            )
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            page, number = fetch(1), 1
+            while True:
+                page_data = page.get("metadata", {}).get("pageData", {})
+                total = page_data.get("totalPages", 1)
+                pending = None
+                if number < total:
+                    pending = pool.submit(fetch, number + 1)
+                yield from page.get("prices", [])
+                if pending is None:
+                    return
+                page, number = pending.result(), number + 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def get_prices_num_points(
         self, epic: str, resolution: str, num_points: int
     ) -> dict:
         """Get prices by number of points."""
-        return self.client.get(f"/prices/{epic}/{resolution}/{num_points}")
+        return self._get(f"/prices/{epic}/{resolution}/{num_points}")
 
     def get_prices_date_range(
         self, epic: str, resolution: str, start: str, end: str
     ) -> dict:
         """Get prices by date range."""
-        return self.client.get(f"/prices/{epic}/{resolution}/{start}/{end}")
+        return self._get(f"/prices/{epic}/{resolution}/{start}/{end}")
 
     def get_prices_query_range(
         self, epic: str, resolution: str, start: str, end: str
     ) -> dict:
         """Get prices by query range."""
-        return self.client.get(
+        return self._get(
+            f"/prices/{epic}/{resolution}",
+            {"startdate": start, "enddate": end},
+        )
+
+
+class AsyncPrices:
+    """Async client for IG prices endpoints."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncPrices."""
+        self.client = client
+
+    async def _get(self, path: str, params: dict = None) -> dict:
+        """Send GET request and record the reported data allowance."""
+        response = await self.client.get(path, params)
+        self.client.allowance.update(response)
+        return response
+
+    async def get_prices(
+        self,
+        epic: str,
+        resolution: str = "MINUTE",
+        from_date: str = None,
+        to_date: str = None,
+        max_points: int = None,
+        page_size: int = None,
+        page_number: int = 1,
+    ) -> dict:
+        """Get historical prices."""
+        params = {"resolution": resolution}
+        if from_date and to_date:
+            params.update({"from": from_date, "to": to_date})
+        if max_points is not None:
+            params["max"] = max_points
+        if page_size is not None:
+            params.update({"pageSize": page_size, "pageNumber": page_number})
+        return await self._get(f"/prices/{epic}", params)
+
+    async def get_prices_num_points(
+        self, epic: str, resolution: str, num_points: int
+    ) -> dict:
+        """Get prices by number of points."""
+        return await self._get(f"/prices/{epic}/{resolution}/{num_points}")
+
+    async def get_prices_date_range(
+        self, epic: str, resolution: str, start: str, end: str
+    ) -> dict:
+        """Get prices by date range."""
+        return await self._get(f"/prices/{epic}/{resolution}/{start}/{end}")
+
+    async def get_prices_query_range(
+        self, epic: str, resolution: str, start: str, end: str
+    ) -> dict:
+        """Get prices by query range."""
+        return await self._get(
             f"/prices/{epic}/{resolution}",
             {"startdate": start, "enddate": end},
         )
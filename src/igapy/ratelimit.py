@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+from typing import Callable
+
+TRADING = "trading"
+NON_TRADING = "non_trading"
+
+# Writes under these prefixes count against IG's per-account trading
+# allowance. This covers /positions/otc and /working-orders/otc as well as
+# the per-deal update and delete paths used by Orders.
+TRADING_PATHS = ("/positions", "/working-orders")
+
+# IG error code for the per-app limit, which covers every request.
+API_KEY_ALLOWANCE_ERROR = "exceeded-api-key-allowance"
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize TokenBucket.
+        :param rate: Tokens added per second.
+        :param capacity: Maximum number of tokens (burst size).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take one token, or return seconds until one is available."""
+        self._refill()
+        # Tolerate float rounding so a computed wait always suffices.
+        if self.tokens >= 1 - 1e-9:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def delay(self) -> float:
+        """Return seconds until a token is available, without taking it."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the server reports an overrun."""
+        self._refill()
+        self.tokens = 0.0
+
+
+class RateLimiter:
+    """Client-side scheduler with separate trading and non-trading lanes.
+
+    Requests are paced rather than rejected. While a trading request is
+    waiting for a token, non-trading requests are held back so orders
+    always go ahead of data fetches.
+    """
+
+    def __init__(
+        self,
+        trading_per_minute: int = 100,
+        non_trading_per_minute: int = 30,
+        burst: int = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize RateLimiter.
+        :param trading_per_minute: IG trading allowance per minute.
+        :param non_trading_per_minute: IG non-trading allowance per minute.
+        :param burst: Bucket capacity. Defaults to a tenth of each
+            allowance. The refill rate is reduced by the burst so that no
+            rolling minute can exceed the allowance. An allowance of one
+            request per minute cannot be paced exactly this way and may
+            allow two in the first minute.
+        """
+        for value in (trading_per_minute, non_trading_per_minute):
+            if value < 1:
+                raise ValueError("Allowance per minute must be at least 1")
+        if burst is not None and burst < 1:
+            raise ValueError("Burst must be at least 1")
+        self.buckets = {
+            TRADING: self._bucket(trading_per_minute, burst, clock),
+            NON_TRADING: self._bucket(non_trading_per_minute, burst, clock),
+        }
+        self._cond = threading.Condition()
+        self._trading_waiting = 0
+
+    @staticmethod
+    def _bucket(per_minute: int, burst: int, clock) -> TokenBucket:
+        capacity = burst if burst is not None else per_minute // 10
+        capacity = max(1, min(capacity, per_minute - 1))
+        rate = max(1, per_minute - capacity) / 60.0
+        return TokenBucket(rate, capacity, clock)
+
+    @staticmethod
+    def lane(method: str, path: str) -> str:
+        """Return the lane a request belongs to.
+
+        Any non-GET request under /positions or /working-orders is a
+        trading request; everything else is non-trading.
+        """
+        if method != "GET" and path.startswith(TRADING_PATHS):
+            return TRADING
+        return NON_TRADING
+
+    def _try_acquire(self, lane: str) -> float:
+        if lane == NON_TRADING and self._trading_waiting:
+            return max(self.buckets[TRADING].delay(), 0.001)
+        return self.buckets[lane].try_acquire()
+
+    def try_acquire(self, lane: str) -> float:
+        """Take a token without blocking.
+
+        Returns 0.0 on success, otherwise the seconds to wait before
+        trying again.
+        """
+        with self._cond:
+            return self._try_acquire(lane)
+
+    def acquire(self, lane: str) -> None:
+        """Block until a token is available in the given lane."""
+        trading = lane == TRADING
+        with self._cond:
+            if trading:
+                self._trading_waiting += 1
+            try:
+                while True:
+                    wait = self._try_acquire(lane)
+                    if not wait:
+                        return
+                    self._cond.wait(wait)
+            finally:
+                if trading:
+                    self._trading_waiting -= 1
+                    self._cond.notify_all()
+
+    async def acquire_async(self, lane: str) -> None:
+        """Wait without blocking the event loop for a token in a lane."""
+        trading = lane == TRADING
+        if trading:
+            with self._cond:
+                self._trading_waiting += 1
+        try:
+            wait = self.try_acquire(lane)
+            while wait:
+                await asyncio.sleep(wait)
+                wait = self.try_acquire(lane)
+        finally:
+            if trading:
+                with self._cond:
+                    self._trading_waiting -= 1
+                    self._cond.notify_all()
+
+    def penalize(self, lane: str, message: str = "") -> None:
+        """Drain a lane after IG reports the allowance was exceeded.
+
+        The per-app allowance covers every request, so that error drains
+        both lanes.
+        """
+        with self._cond:
+            if API_KEY_ALLOWANCE_ERROR in message:
+                for bucket in self.buckets.values():
+                    bucket.drain()
+            else:
+                self.buckets[lane].drain()
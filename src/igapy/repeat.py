@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class RepeatDealWindow:
@@ -15,3 +16,15 @@ class RepeatDealWindow:
     def get_repeat_deal_window(self) -> dict:
         """Get repeat deal window info."""
         return self.client.get("/repeat-dealing-window")
+
+
+class AsyncRepeatDealWindow:
+    """Async client for IG repeat deal window endpoint."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncRepeatDealWindow."""
+        self.client = client
+
+    async def get_repeat_deal_window(self) -> dict:
+        """Get repeat deal window info."""
+        return await self.client.get("/repeat-dealing-window")
@@ -0,0 +1,95 @@
+import math
+from datetime import timedelta
+from itertools import groupby
+
+from .exceptions import InvalidInputError
+from .frames import COLUMNS, TIMESTAMP, VOLUME, PriceFrame
+from .utils import from_epoch_ms, resolution_seconds, to_epoch_ms
+
+# 1970-01-05, the first Monday after the epoch, in milliseconds.
+_FIRST_MONDAY_MS = 4 * 86400000
+
+
+def _month_start(ts: int, offset_ms: int) -> int:
+    dt = from_epoch_ms(ts - offset_ms)
+    month = dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return to_epoch_ms(month) + offset_ms
+
+
+def _first(values):
+    for v in values:
+        if not math.isnan(v):
+            return v
+    return math.nan
+
+
+def _last(values):
+    return _first(reversed(values))
+
+
+def _max(values):
+    values = [v for v in values if not math.isnan(v)]
+    return max(values) if values else math.nan
+
+
+def _min(values):
+    values = [v for v in values if not math.isnan(v)]
+    return min(values) if values else math.nan
+
+
+def _sum(values):
+    values = [v for v in values if not math.isnan(v)]
+    return math.fsum(values) if values else math.nan
+
+
+_AGGREGATES = {"open": _first, "high": _max, "low": _min, "close": _last}
+
+
+def resample(
+    frame: PriceFrame, resolution: str, offset: timedelta = timedelta(0)
+) -> PriceFrame:
+    """Build coarser OHLCV bars from a finer, time-ordered PriceFrame.
+
+    Bars are bucketed by start time. Each bucket's open and close are the
+    first and last non-missing values, its high and low ignore missing
+    values, and volumes are summed. Buckets with no input bars are left
+    out rather than filled.
+    :param resolution: Target IG resolution, e.g. "HOUR" or "DAY".
+    :param offset: Shift of bucket boundaries from midnight UTC, e.g.
+        timedelta(hours=22) for daily bars that start at the session open.
+    """
+    offset_ms = offset // timedelta(milliseconds=1)
+    if resolution == "MONTH":
+
+        def bucket(ts):
+            return _month_start(ts, offset_ms)
+
+    else:
+        width = resolution_seconds(resolution) * 1000
+        origin = offset_ms + (_FIRST_MONDAY_MS if resolution == "WEEK" else 0)
+
+        def bucket(ts):
+            return (ts - origin) // width * width + origin
+
+    timestamps = frame[TIMESTAMP]
+    if any(b < a for a, b in zip(timestamps, timestamps[1:])):
+        raise InvalidInputError("Frame must be sorted by timestamp")
+    out = PriceFrame()
+    sources = [
+        (
+            out[name],
+            frame[name],
+            _sum if name == VOLUME else _AGGREGATES[name.rsplit("_", 1)[1]],
+        )
+        for name in COLUMNS
+        if name != TIMESTAMP
+    ]
+    for start, rows in groupby(
+        range(len(frame)), lambda i: bucket(timestamps[i])
+    ):
+        rows = list(rows)
+        lo, hi = rows[0], rows[-1] + 1
+        out[TIMESTAMP].append(start)
+        for target, source, aggregate in sources:
+            target.append(aggregate(source[lo:hi]))
+    return out
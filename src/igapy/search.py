@@ -0,0 +1,109 @@
+from __future__ import annotations
+import re
+from typing import TYPE_CHECKING, Iterable
+
+from .navigation import MarketIndex
+
+if TYPE_CHECKING:
+    from .markets import Markets
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN.findall(text.lower()) if text else []
+
+
+class _TrieNode:
+    __slots__ = ("children", "epics")
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.epics = set()
+
+
+class MarketSearchIndex:
+    """Offline market search over epic, instrument name and expiry.
+
+    A prefix trie answers partial-token queries and an inverted index of
+    whole tokens ranks exact matches first. Every query token must match.
+    """
+
+    def __init__(
+        self, markets: Iterable[dict] = (), fallback: Markets = None
+    ) -> None:
+        """Initialize MarketSearchIndex.
+        :param markets: Market summaries with at least an epic.
+        :param fallback: Optional Markets client queried on a miss.
+        """
+        self.fallback = fallback
+        self.markets = {}
+        self._trie = _TrieNode()
+        self._tokens = {}
+        for market in markets:
+            self.add(market)
+
+    @classmethod
+    def from_index(
+        cls, index: MarketIndex, fallback: Markets = None
+    ) -> "MarketSearchIndex":
+        """Build a search index from a crawled MarketIndex."""
+        return cls(index.markets.values(), fallback)
+
+    @classmethod
+    def from_snapshot(
+        cls, path: str, fallback: Markets = None
+    ) -> "MarketSearchIndex":
+        """Build a search index from a saved MarketIndex snapshot."""
+        return cls.from_index(MarketIndex.load(path), fallback)
+
+    def add(self, market: dict) -> None:
+        """Index a market summary."""
+        epic = market["epic"]
+        self.markets[epic] = market
+        tokens = set(tokenize(epic))
+        tokens.update(tokenize(market.get("instrumentName")))
+        tokens.update(tokenize(market.get("expiry")))
+        for token in tokens:
+            self._tokens.setdefault(token, set()).add(epic)
+            node = self._trie
+            for char in token:
+                node = node.children.setdefault(char, _TrieNode())
+                node.epics.add(epic)
+
+    def _prefix(self, token: str) -> set:
+        node = self._trie
+        for char in token:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return node.epics
+
+    def search(self, search_term: str, limit: int = None) -> dict:
+        """Answer a search_markets-style query from the local index.
+
+        Returns {"markets": [...]} like Markets.search_markets, with exact
+        epic matches first, then whole-token matches, then by name. On a
+        miss the fallback client is queried if one is configured.
+        """
+        term = search_term.lower()
+        tokens = tokenize(term)
+        matches = None
+        for token in tokens:
+            found = self._prefix(token)
+            matches = set(found) if matches is None else matches & found
+            if not matches:
+                break
+        if not matches:
+            if self.fallback is not None:
+                return self.fallback.search_markets(search_term)
+            return {"markets": []}
+
+        def rank(epic):
+            exact = sum(epic in self._tokens.get(t, ()) for t in tokens)
+            name = self.markets[epic].get("instrumentName") or ""
+            return (epic.lower() != term, -exact, name, epic)
+
+        ordered = sorted(matches, key=rank)[:limit]
+        return {"markets": [self.markets[epic] for epic in ordered]}
@@ -1,8 +1,11 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from .utils import MAX_IDS_PER_REQUEST, fetch_chunked, fetch_chunked_async
+
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class Sentiment:
@@ -12,10 +15,24 @@ class Sentiment:
         """Initialize Sentiment."""
         self.client = client
 
-    def list_client_sentiment(self, market_ids: list[str]) -> dict:
-        """List sentiment for multiple markets."""
-        return self.client.get(
-            "/client-sentiment", {"marketIds": ",".join(market_ids)}
+    def list_client_sentiment(
+        self,
+        market_ids: list[str],
+        chunk_size: int = MAX_IDS_PER_REQUEST,
+        max_workers: int = 8,
+    ) -> dict:
+        """List sentiment for multiple markets.
+
+        Long id lists are fetched in concurrent chunks and merged in input
+        order; ids whose chunk failed are listed under "failed".
+        """
+        return fetch_chunked(
+            lambda part: self.client.get(
+                "/client-sentiment", {"marketIds": ",".join(part)}
+            ),
+            market_ids,
+            chunk_size,
+            max_workers,
         )
 
     def get_client_sentiment(self, market_id: str) -> dict:
@@ -25,3 +42,31 @@ class Sentiment:
     def get_related_sentiment(self, market_id: str) -> dict:
         """Get related sentiment for a market."""
         return self.client.get(f"/client-sentiment/related/{market_id}")
+
+
+class AsyncSentiment:
+    """Async client for IG client sentiment endpoints."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncSentiment."""
+        self.client = client
+
+    async def list_client_sentiment(
+        self, market_ids: list[str], chunk_size: int = MAX_IDS_PER_REQUEST
+    ) -> dict:
+        """List sentiment for multiple markets in concurrent chunks."""
+        return await fetch_chunked_async(
+            lambda part: self.client.get(
+                "/client-sentiment", {"marketIds": ",".join(part)}
+            ),
+            market_ids,
+            chunk_size,
+        )
+
+    async def get_client_sentiment(self, market_id: str) -> dict:
+        """Get sentiment for a market."""
+        return await self.client.get(f"/client-sentiment/{market_id}")
+
+    async def get_related_sentiment(self, market_id: str) -> dict:
+        """Get related sentiment for a market."""
+        return await self.client.get(f"/client-sentiment/related/{market_id}")
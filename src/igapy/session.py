@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class SessionAPI:
@@ -37,3 +38,39 @@ class SessionAPI:
         """Switch to another account."""
         data = {"accountId": account_id, "defaultAccount": default_account}
         return self.client.put("/session", data)
+
+
+class AsyncSessionAPI:
+    """Async client for IG session endpoints."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncSessionAPI."""
+        self.client = client
+
+    async def get_session_details(
+        self, fetch_session_tokens: bool = False
+    ) -> dict:
+        """Get session details."""
+        params = {"fetchSessionTokens": str(fetch_session_tokens).lower()}
+        return await self.client.get("/session", params)
+
+    async def logout(self) -> dict:
+        """Logout from session."""
+        return await self.client.delete("/session")
+
+    async def get_encryption_key(self) -> dict:
+        """Get encryption key."""
+        return await self.client.get("/session/encryptionKey")
+
+    async def refresh_session(self, refresh_token: str) -> dict:
+        """Refresh session."""
+        return await self.client.post(
+            "/session/refresh-token", {"refresh_token": refresh_token}
+        )
+
+    async def switch_account(
+        self, account_id: str, default_account: bool = False
+    ) -> dict:
+        """Switch to another account."""
+        data = {"accountId": account_id, "defaultAccount": default_account}
+        return await self.client.put("/session", data)
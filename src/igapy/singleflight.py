@@ -0,0 +1,46 @@
+import threading
+from typing import Callable, Hashable
+
+
+class _Call:
+    """An in-flight call shared by every caller with the same key."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one execution."""
+
+    def __init__(self) -> None:
+        """Initialize SingleFlight."""
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], object]):
+        """Run fn once per key at a time and share its outcome.
+
+        Callers arriving while a call for the same key is in flight wait
+        for it and receive the same result or exception.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        if call.error is not None:
+            raise call.error
+        return call.result
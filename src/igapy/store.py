@@ -0,0 +1,214 @@
+from __future__ import annotations
+import json
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from .frames import COLUMNS, TIMESTAMP, PriceFrame, column_typecode
+from .utils import (
+    format_date,
+    from_epoch_ms,
+    resolution_seconds,
+    to_epoch_ms,
+)
+
+if TYPE_CHECKING:
+    from .prices import Prices
+
+
+def _next_bar_ms(ms: int, resolution: str) -> int:
+    """Return the time of the bar one resolution step after ms."""
+    if resolution == "MONTH":
+        dt = from_epoch_ms(ms)
+        years, month = divmod(dt.month, 12)
+        year, month = dt.year + years, month + 1
+        day = min(dt.day, monthrange(year, month)[1])
+        return to_epoch_ms(dt.replace(year=year, month=month, day=day))
+    return ms + resolution_seconds(resolution) * 1000
+
+
+def _merge_intervals(intervals: list, resolution: str) -> list:
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= _next_bar_ms(merged[-1][1], resolution):
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+class PriceStore:
+    """Local columnar price store keyed by (epic, resolution).
+
+    Each key is a directory holding one raw binary file per PriceFrame
+    column plus a coverage file listing the time ranges already fetched.
+    New bars later than everything stored are appended in place; a
+    backfill that lands earlier rewrites the files atomically. Reads are
+    memory-mapped, so loaded frames are zero-copy views of the files.
+    """
+
+    def __init__(self, root: str) -> None:
+        """Initialize PriceStore rooted at a directory."""
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _dir(self, epic: str, resolution: str) -> str:
+        return os.path.join(self.root, epic, resolution)
+
+    def _coverage_path(self, epic: str, resolution: str) -> str:
+        return os.path.join(self._dir(epic, resolution), "coverage.json")
+
+    def coverage(self, epic: str, resolution: str) -> list:
+        """Return the stored [start_ms, end_ms] ranges, sorted."""
+        try:
+            with open(self._coverage_path(epic, resolution)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def missing(
+        self, epic: str, resolution: str, start_ms: int, end_ms: int
+    ) -> list:
+        """Return the sub-ranges of [start_ms, end_ms] not yet stored.
+
+        A gap after a stored range starts one bar later, since IG date
+        ranges only have second precision.
+        """
+        gaps = []
+        cursor = start_ms
+        for lo, hi in self.coverage(epic, resolution):
+            if hi < cursor:
+                continue
+            if lo > end_ms:
+                break
+            if lo > cursor:
+                gaps.append((cursor, lo - 1))
+            cursor = max(cursor, _next_bar_ms(hi, resolution))
+        if cursor <= end_ms:
+            gaps.append((cursor, end_ms))
+        return gaps
+
+    def load(self, epic: str, resolution: str) -> PriceFrame:
+        """Return every stored bar as memory-mapped columns.
+
+        The mappings are released once the frame and its columns are no
+        longer referenced.
+        """
+        columns = {}
+        directory = self._dir(epic, resolution)
+        for name in COLUMNS:
+            path = os.path.join(directory, f"{name}.bin")
+            if not os.path.exists(path) or not os.path.getsize(path):
+                return PriceFrame()
+            with open(path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            columns[name] = memoryview(mapped).cast(column_typecode(name))
+        return PriceFrame(columns)
+
+    def write(
+        self,
+        epic: str,
+        resolution: str,
+        frame: PriceFrame,
+        start_ms: int,
+        end_ms: int,
+    ) -> None:
+        """Merge a frame covering [start_ms, end_ms] into the store."""
+        with self._lock:
+            directory = self._dir(epic, resolution)
+            os.makedirs(directory, exist_ok=True)
+            if len(frame):
+                last = self._last_timestamp(directory)
+                if last is None or frame[TIMESTAMP][0] > last:
+                    self._append(directory, frame)
+                else:
+                    self._rewrite(directory, self._read(directory), frame)
+            coverage = self.coverage(epic, resolution)
+            coverage.append([start_ms, end_ms])
+            path = self._coverage_path(epic, resolution)
+            with open(path + ".tmp", "w") as f:
+                json.dump(_merge_intervals(coverage, resolution), f)
+            os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def _last_timestamp(directory: str):
+        path = os.path.join(directory, f"{TIMESTAMP}.bin")
+        column = array(column_typecode(TIMESTAMP))
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() < column.itemsize:
+                    return None
+                f.seek(-column.itemsize, os.SEEK_END)
+                column.frombytes(f.read(column.itemsize))
+        except FileNotFoundError:
+            return None
+        return column[0]
+
+    @staticmethod
+    def _read(directory: str) -> PriceFrame:
+        """Read every column into memory, without mapping the files."""
+        columns = {}
+        for name in COLUMNS:
+            column = array(column_typecode(name))
+            with open(os.path.join(directory, f"{name}.bin"), "rb") as f:
+                column.frombytes(f.read())
+            columns[name] = column
+        return PriceFrame(columns)
+
+    @staticmethod
+    def _append(directory: str, frame: PriceFrame) -> None:
+        for name in COLUMNS:
+            with open(os.path.join(directory, f"{name}.bin"), "ab") as f:
+                f.write(frame[name])
+
+    @staticmethod
+    def _rewrite(directory: str, stored: PriceFrame, frame: PriceFrame):
+        rows = {}
+        for source in (stored, frame):
+            for i, ts in enumerate(source[TIMESTAMP]):
+                rows[ts] = tuple(source[name][i] for name in COLUMNS)
+        ordered = [rows[ts] for ts in sorted(rows)]
+        for index, name in enumerate(COLUMNS):
+            column = array(
+                column_typecode(name), (row[index] for row in ordered)
+            )
+            path = os.path.join(directory, f"{name}.bin")
+            # Replace rather than truncate so existing mappings stay valid.
+            with open(path + ".tmp", "wb") as f:
+                f.write(column)
+            os.replace(path + ".tmp", path)
+
+    def fetch(
+        self,
+        prices: Prices,
+        epic: str,
+        resolution: str,
+        start: datetime,
+        end: datetime,
+    ) -> PriceFrame:
+        """Return bars in [start, end], fetching only missing ranges.
+
+        Naive datetimes are treated as UTC.
+        """
+        start_ms, end_ms = to_epoch_ms(start), to_epoch_ms(end)
+        for lo, hi in self.missing(epic, resolution, start_ms, end_ms):
+            response = prices.get_prices_date_range(
+                epic,
+                resolution,
+                format_date(from_epoch_ms(lo)),
+                format_date(from_epoch_ms(hi)),
+            )
+            frame = PriceFrame.from_response(response)
+            self.write(epic, resolution, frame, lo, hi)
+        stored = self.load(epic, resolution)
+        timestamps = stored[TIMESTAMP]
+        return stored.slice(
+            bisect_left(timestamps, start_ms),
+            bisect_right(timestamps, end_ms),
+        )
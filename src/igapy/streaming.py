@@ -1,11 +1,190 @@
 from typing import TYPE_CHECKING, Callable
+import asyncio
+import random
 import time
+from collections import deque
 
 if TYPE_CHECKING:
     from .client import IGClient
 from lightstreamer.client import LightstreamerClient, Subscription
 import threading
 
+from .dispatch import BLOCK, BoundedQueue
+from .metrics import RECONNECT, MetricsSink
+
+# Floor on the first reconnect delay, so a zero reconnect_delay still
+# backs off instead of hammering the login endpoint.
+_MIN_RECONNECT_DELAY = 0.1
+
+# TRADE item fields shared by every trade listener.
+TRADE_FIELDS = ["CONFIRMS", "OPU", "WOU"]
+
+
+def _listener(label: str, on_update: Callable, guard: bool = True):
+    """Build a subscription listener that logs events for label.
+
+    With guard False, on_update is called directly and exceptions are left
+    to the Lightstreamer thread.
+    """
+
+    def guarded(item_update):
+        try:
+            on_update(item_update)
+        except Exception as e:
+            print(f"[ERROR] Exception in onItemUpdate callback: {e}")
+
+    class _Listener:
+        onItemUpdate = staticmethod(guarded if guard else on_update)
+
+        @staticmethod
+        def onSubscription():
+            print(f"[Subscription] Subscribed to {label}")
+
+        @staticmethod
+        def onSubscriptionError(code, message):
+            print(f"[Subscription] Error for {label}: {code} - {message}")
+
+        @staticmethod
+        def onUnsubscription():
+            print(f"[Subscription] Unsubscribed from {label}")
+
+    return _Listener()
+
+
+def _apply_changes(item_update, values: list) -> int:
+    """Copy changed fields into values and return their bitmask.
+
+    values holds the latest value of every field by position and is
+    reused for each update of the item, so callbacks must copy what they
+    keep. Bit i of the mask is set if field i changed in this update.
+    """
+    mask = 0
+    for pos, value in item_update.getChangedFieldsByPosition().items():
+        values[pos - 1] = value
+        mask |= 1 << (pos - 1)
+    return mask
+
+
+class UpdateStream:
+    """Async iterator of (item, data) updates from one subscription.
+
+    Updates are buffered on the Lightstreamer thread and handed to the
+    event loop in batches, with one loop wakeup per batch rather than per
+    update. When the buffer is full the policy applies, as for a
+    dispatch channel: BLOCK holds up the Lightstreamer thread,
+    DROP_OLDEST discards the oldest update and CONFLATE keeps only the
+    latest update per item. Closing the stream, cancelling the task
+    iterating it, or leaving an async for loop unsubscribes; after a
+    break that happens once the loop's iterator is finalized, so use
+    async with to unsubscribe at a known point.
+    """
+
+    def __init__(
+        self,
+        streaming: "IGStreamingClient",
+        items: list[str],
+        fields: list[str],
+        mode: str,
+        adapter: str,
+        maxsize: int,
+        policy: str,
+    ) -> None:
+        """Initialize UpdateStream; use IGStreamingClient.updates."""
+        self.streaming = streaming
+        self.items = list(items)
+        self.fields = fields
+        self.mode = mode
+        self.adapter = adapter
+        self.maxsize = maxsize
+        self.policy = policy
+        self._key = None
+        self._loop = None
+        self._event = None
+        self._queue = BoundedQueue(maxsize, policy)
+        self._cond = self._queue.cond
+        self._batch = deque()
+        self._wakeup_pending = False
+
+    @property
+    def dropped(self) -> int:
+        """Updates discarded because the buffer was full."""
+        return self._queue.dropped
+
+    @property
+    def conflated(self) -> int:
+        """Updates replaced by a later one for the same item."""
+        return self._queue.conflated
+
+    def _start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        self._key = self.streaming.subscribe_items(
+            self.items, self.mode, self.fields, self._put, self.adapter
+        )
+
+    def _put(self, item: str, data: dict) -> None:
+        """Buffer an update; runs on the Lightstreamer thread."""
+        with self._cond:
+            if not self._queue.put(item, (item, data)):
+                return
+            wake = not self._wakeup_pending
+            self._wakeup_pending = True
+        if wake:
+            self._loop.call_soon_threadsafe(self._event.set)
+
+    def _drain(self) -> None:
+        with self._cond:
+            self._batch.extend(self._queue.drain())
+            self._wakeup_pending = False
+
+    async def __aiter__(self):
+        try:
+            while True:
+                try:
+                    yield await self.__anext__()
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.close()
+
+    async def __anext__(self) -> tuple:
+        if self._loop is None:
+            self._start()
+        while not self._batch:
+            if self._queue.closed:
+                raise StopAsyncIteration
+            self._drain()
+            if self._batch:
+                break
+            try:
+                await self._event.wait()
+            except asyncio.CancelledError:
+                self.close()
+                raise
+            self._event.clear()
+        return self._batch.popleft()
+
+    async def __aenter__(self) -> "UpdateStream":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Unsubscribe and end iteration."""
+        self.close()
+
+    def close(self) -> None:
+        """Unsubscribe and end iteration."""
+        with self._cond:
+            if self._queue.closed:
+                return
+            self._queue.close()
+        if self._key is not None:
+            self.streaming.unsubscribe(self._key)
+        if self._event is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._event.set)
+
 
 class IGStreamingClient:
     """Streaming client for IG using Lightstreamer SDK."""
@@ -15,10 +194,23 @@ class IGStreamingClient:
         client: "IGClient",
         reconnect: bool = True,
         reconnect_delay: int = 5,
+        debug: bool = False,
+        max_reconnect_delay: float = 60.0,
+        refresh_session: bool = True,
+        metrics: MetricsSink = None,
     ) -> None:
         """Initialize IGStreamingClient with authenticated IGClient.
         :param reconnect: If True, automatically reconnect on disconnect.
-        :param reconnect_delay: Seconds to wait before reconnecting.
+        :param reconnect_delay: Seconds to wait before the first reconnect
+            attempt, at least 0.1; later attempts back off exponentially
+            with jitter.
+        :param debug: If True, changed_only callbacks are wrapped in the
+            same exception logging as dict callbacks.
+        :param max_reconnect_delay: Upper bound on the backoff delay.
+        :param refresh_session: If True, log in again for fresh session
+            tokens before reconnecting.
+        :param metrics: Optional sink for the time taken to recover from
+            a disconnect.
         """
         self.client = client
         self._ls_client = None
@@ -27,7 +219,21 @@ class IGStreamingClient:
         self.account_id = self.client.session_data.get("currentAccountId")
         self._reconnect = reconnect
         self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._refresh_session = refresh_session
+        self.metrics = metrics
+        self.last_recovery_time = None
         self._should_run = True
+        self._disconnected = threading.Event()
+        self._stopped = threading.Event()
+        self._recovering = False
+        self._supervisor = None
+        self.debug = debug
+        self._trade_listeners = []
+        self._trade_key = None
+        self._groups = {}
+        self._group_count = 0
+        self._epics = {}
 
     def start(self) -> None:
         """Start Lightstreamer connection. Reconnects if enabled."""
@@ -48,18 +254,17 @@ class IGStreamingClient:
 
         def on_status_change(status):
             print(f"[Lightstreamer] Connection status: {status}")
-            if (
+            if not (
                 status.startswith("DISCONNECTED")
                 and self._reconnect
                 and self._should_run
             ):
-                print(
-                    "[Lightstreamer] Disconnected. Attempting to reconnect in",
-                    self._reconnect_delay,
-                    "seconds...",
-                )
-                time.sleep(self._reconnect_delay)
-                self._reconnect_subscriptions()
+                return
+            # Never block the SDK thread; the supervisor reconnects. Our
+            # own disconnect while recovering must not start another.
+            with self._lock:
+                if not self._recovering:
+                    self._disconnected.set()
 
         def on_server_error(code, msg):
             print(f"[Lightstreamer] Server error: {code} - {msg}")
@@ -75,17 +280,80 @@ class IGStreamingClient:
             )()
         )
         self._ls_client.connect()
+        if self._reconnect and self._supervisor is None:
+            self._supervisor = threading.Thread(
+                target=self._supervise, daemon=True
+            )
+            self._supervisor.start()
+
+    def _backoff(self, attempt: int) -> float:
+        """Return the delay before a reconnect attempt, with jitter."""
+        base = max(self._reconnect_delay, _MIN_RECONNECT_DELAY)
+        delay = min(self._max_reconnect_delay, base * 2**attempt)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _supervise(self) -> None:
+        """Reconnect after each disconnect until stopped."""
+        while self._should_run:
+            self._disconnected.wait()
+            if not self._should_run:
+                return
+            started = time.monotonic()
+            with self._lock:
+                self._recovering = True
+            attempt = 0
+            try:
+                while self._should_run:
+                    delay = self._backoff(attempt)
+                    print(
+                        "[Lightstreamer] Disconnected. Attempting to "
+                        f"reconnect in {delay:.1f} seconds..."
+                    )
+                    if self._stopped.wait(delay):
+                        return
+                    try:
+                        self._reconnect_subscriptions()
+                        break
+                    except Exception as e:
+                        print(f"[Lightstreamer] Reconnect failed: {e}")
+                        attempt += 1
+            finally:
+                with self._lock:
+                    self._recovering = False
+                    self._disconnected.clear()
+            self.last_recovery_time = time.monotonic() - started
+            if self.metrics is not None:
+                self.metrics.record(RECONNECT, self.last_recovery_time)
+
+    def _refresh_tokens(self) -> None:
+        """Log in again and pass the new session tokens to Lightstreamer."""
+        login = getattr(self.client, "login", None)
+        if self._refresh_session and callable(login):
+            login()
+        cst = self.client.session.headers.get("CST")
+        xst = self.client.session.headers.get("X-SECURITY-TOKEN")
+        if cst and xst:
+            self._ls_client.connectionDetails.setPassword(
+                f"CST-{cst}|XST-{xst}"
+            )
 
     def _reconnect_subscriptions(self):
-        """Reconnects the Lightstreamer client and all active subscriptions."""
+        """Reconnects the Lightstreamer client and all active subscriptions.
+
+        Subscriptions are copied under the lock and resubscribed outside
+        it, skipping any the SDK still reports as active.
+        """
+        self._refresh_tokens()
         try:
             self._ls_client.disconnect()
         except Exception:
             pass
         self._ls_client.connect()
-        # Re-subscribe to all items
         with self._lock:
-            for item, sub in self._subscriptions.items():
+            subscriptions = list(self._subscriptions.values())
+        for sub in subscriptions:
+            is_active = getattr(sub, "isActive", None)
+            if is_active is None or not is_active():
                 self._ls_client.subscribe(sub)
         print("[Lightstreamer] Reconnected and re-subscribed to all items.")
 
@@ -96,43 +364,176 @@ class IGStreamingClient:
         fields: list[str],
         callback: Callable[[dict], None],  # expects callback(data)
         adapter: str = None,
+        changed_only: bool = False,
     ) -> None:
         """
         Subscribe to any Lightstreamer item (generic).
         The callback will be called as callback(data) for item updates.
+        With changed_only, it is called as callback(values, mask) instead;
+        see _apply_changes.
         """
         subscription = Subscription(mode=mode, items=[item], fields=fields)
         if adapter:
             subscription.setDataAdapter(adapter)
+        if changed_only:
+            values = [None] * len(fields)
 
-        class _Listener:
-            @staticmethod
-            def onItemUpdate(item_update):
-                try:
-                    data = {
-                        field: item_update.getValue(field) for field in fields
-                    }
-                    callback(data)
-                except Exception as e:
-                    print(f"[ERROR] Exception in onItemUpdate callback: {e}")
-
-            @staticmethod
-            def onSubscription():
-                print(f"[Subscription] Subscribed to {item}")
+            def on_update(item_update):
+                callback(values, _apply_changes(item_update, values))
 
-            @staticmethod
-            def onSubscriptionError(code, message):
-                print(f"[Subscription] Error for {item}: {code} - {message}")
+        else:
 
-            @staticmethod
-            def onUnsubscription():
-                print(f"[Subscription] Unsubscribed from {item}")
+            def on_update(item_update):
+                callback(
+                    {field: item_update.getValue(field) for field in fields}
+                )
 
-        subscription.addListener(_Listener())
+        guard = self.debug or not changed_only
+        subscription.addListener(_listener(item, on_update, guard))
         with self._lock:
             self._ls_client.subscribe(subscription)
             self._subscriptions[item] = subscription
 
+    def subscribe_items(
+        self,
+        items: list[str],
+        mode: str,
+        fields: list[str],
+        callback: Callable[[str, dict], None],
+        adapter: str = None,
+        changed_only: bool = False,
+    ) -> str:
+        """Subscribe to many items with one Lightstreamer subscription.
+
+        The callback is called as callback(item, data), or as
+        callback(item, values, mask) with changed_only, with the item
+        found from the update's position. Returns the group key, which
+        unsubscribe() accepts like an item.
+        """
+        items = list(items)
+        with self._lock:
+            self._group_count += 1
+            key = f"GROUP:{self._group_count}"
+        subscription = Subscription(mode=mode, items=items, fields=fields)
+        if adapter:
+            subscription.setDataAdapter(adapter)
+
+        if changed_only:
+            slots = [[None] * len(fields) for _ in items]
+
+            def on_update(item_update):
+                pos = item_update.getItemPos() - 1
+                values = slots[pos]
+                callback(
+                    items[pos], values, _apply_changes(item_update, values)
+                )
+
+        else:
+
+            def on_update(item_update):
+                item = items[item_update.getItemPos() - 1]
+                data = {f: item_update.getValue(f) for f in fields}
+                callback(item, data)
+
+        guard = self.debug or not changed_only
+        subscription.addListener(_listener(key, on_update, guard))
+        with self._lock:
+            self._ls_client.subscribe(subscription)
+            self._subscriptions[key] = subscription
+            self._groups[key] = (
+                items,
+                mode,
+                fields,
+                callback,
+                adapter,
+                changed_only,
+            )
+        return key
+
+    def updates(
+        self,
+        items: list[str],
+        fields: list[str],
+        mode: str = "MERGE",
+        adapter: str = None,
+        maxsize: int = 10000,
+        policy: str = BLOCK,
+    ) -> UpdateStream:
+        """Return an async iterator of (item, data) updates for items.
+
+        The items are subscribed when iteration starts, in one
+        subscription, and unsubscribed when the stream is closed or the
+        iterating task is cancelled. See UpdateStream for the policies.
+        """
+        return UpdateStream(
+            self, items, fields, mode, adapter, maxsize, policy
+        )
+
+    def subscribe_prices(
+        self,
+        epics: list[str],
+        fields: list[str],
+        callback: Callable[[str, dict], None],
+        changed_only: bool = False,
+    ) -> str:
+        """Subscribe to prices for many epics in one subscription.
+
+        The callback is called as callback(epic, data), or as
+        callback(epic, values, mask) with changed_only. Epics that
+        already have a grouped price subscription are left where they
+        are. Returns the group key, or None if nothing was new.
+        """
+        with self._lock:
+            epics = [e for e in dict.fromkeys(epics) if e not in self._epics]
+        if not epics:
+            return None
+        names = {f"PRICE:{self.account_id}:{e}": e for e in epics}
+        if changed_only:
+
+            def on_item(item, values, mask):
+                callback(names[item], values, mask)
+
+        else:
+
+            def on_item(item, data):
+                callback(names[item], data)
+
+        key = self.subscribe_items(
+            list(names), "MERGE", fields, on_item, "Pricing", changed_only
+        )
+        with self._lock:
+            for epic in epics:
+                self._epics[epic] = key
+        return key
+
+    def unsubscribe_prices(self, epics: list[str]) -> None:
+        """Remove epics from their grouped price subscriptions.
+
+        Each affected group is replaced by one subscription for the
+        epics it still holds, or dropped if none are left. The
+        replacement is subscribed before the old group is dropped, so
+        the remaining epics have no gap in updates.
+        """
+        prefix = f"PRICE:{self.account_id}:"
+        removed = {}
+        with self._lock:
+            for epic in epics:
+                key = self._epics.pop(epic, None)
+                if key is not None:
+                    removed.setdefault(key, set()).add(prefix + epic)
+        for key, gone in removed.items():
+            with self._lock:
+                items, *options = self._groups[key]
+            remaining = [item for item in items if item not in gone]
+            if remaining:
+                new_key = self.subscribe_items(remaining, *options)
+                with self._lock:
+                    for item in remaining:
+                        self._epics[item.removeprefix(prefix)] = new_key
+            with self._lock:
+                del self._groups[key]
+                self._ls_client.unsubscribe(self._subscriptions.pop(key))
+
     # Convenience methods for all IG streaming types
     def subscribe_price(
         self, epic: str, fields: list[str], callback: Callable[[dict], None]
@@ -179,6 +580,62 @@ class IGStreamingClient:
             if sub:
                 self._ls_client.unsubscribe(sub)
 
+    def subscribe_market(
+        self, epic: str, fields: list[str], callback: Callable[[dict], None]
+    ) -> None:
+        """Subscribe to market state and price updates for a given epic."""
+        item = f"MARKET:{epic}"
+        self.subscribe(item, "MERGE", fields, callback)
+
+    def unsubscribe_market(self, epic: str) -> None:
+        """Unsubscribe from market updates for a given epic."""
+        item = f"MARKET:{epic}"
+        with self._lock:
+            sub = self._subscriptions.pop(item, None)
+            if sub:
+                self._ls_client.unsubscribe(sub)
+
+    def add_trade_listener(self, callback: Callable[[dict], None]) -> None:
+        """Add a listener for CONFIRMS, OPU and WOU trade updates.
+
+        All listeners share one TRADE subscription, opened with the first
+        listener and closed when the last one is removed. It is kept apart
+        from subscribe_trade, so either can be used without the other.
+        """
+        with self._lock:
+            self._trade_listeners.append(callback)
+            first = len(self._trade_listeners) == 1
+        if first:
+            key = self.subscribe_items(
+                [f"TRADE:{self.account_id}"],
+                "DISTINCT",
+                TRADE_FIELDS,
+                lambda item, data: self._on_trade(data),
+            )
+            with self._lock:
+                self._trade_key = key
+
+    def remove_trade_listener(self, callback: Callable[[dict], None]) -> None:
+        """Remove a trade listener added with add_trade_listener."""
+        with self._lock:
+            if callback not in self._trade_listeners:
+                return
+            self._trade_listeners.remove(callback)
+            key = None if self._trade_listeners else self._trade_key
+            if key is not None:
+                self._trade_key = None
+        if key is not None:
+            self.unsubscribe(key)
+
+    def _on_trade(self, data: dict) -> None:
+        with self._lock:
+            listeners = list(self._trade_listeners)
+        for listener in listeners:
+            try:
+                listener(data)
+            except Exception as e:
+                print(f"[ERROR] Exception in trade listener: {e}")
+
     def subscribe_chart_tick(
         self, epic: str, fields: list[str], callback: Callable[[dict], None]
     ) -> None:
@@ -214,14 +671,19 @@ class IGStreamingClient:
                 self._ls_client.unsubscribe(sub)
 
     def unsubscribe(self, item: str) -> None:
-        """Unsubscribe from any Lightstreamer item by item string."""
+        """Unsubscribe from any Lightstreamer item or group key."""
         with self._lock:
             sub = self._subscriptions.pop(item, None)
             if sub:
                 self._ls_client.unsubscribe(sub)
+            if self._groups.pop(item, None) is not None:
+                for epic in [e for e, k in self._epics.items() if k == item]:
+                    del self._epics[epic]
 
     def stop(self) -> None:
         """Disconnect from Lightstreamer server and stop reconnect attempts."""
         self._should_run = False
+        self._stopped.set()
+        self._disconnected.set()
         if self._ls_client:
             self._ls_client.disconnect()
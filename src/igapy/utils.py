@@ -1,10 +1,42 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict
+from .exceptions import InvalidInputError
 
 if TYPE_CHECKING:
     from .client import IGClient
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+# Date format used in IG price date-range paths.
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Bar length in seconds for each IG price resolution. MONTH is an
+# approximation, used only for estimates.
+RESOLUTION_SECONDS = {
+    "SECOND": 1,
+    "MINUTE": 60,
+    "MINUTE_2": 120,
+    "MINUTE_3": 180,
+    "MINUTE_5": 300,
+    "MINUTE_10": 600,
+    "MINUTE_15": 900,
+    "MINUTE_30": 1800,
+    "HOUR": 3600,
+    "HOUR_2": 7200,
+    "HOUR_3": 10800,
+    "HOUR_4": 14400,
+    "DAY": 86400,
+    "WEEK": 604800,
+    "MONTH": 2592000,
+}
+
+# Most ids IG accepts in one bulk markets or sentiment request.
+MAX_IDS_PER_REQUEST = 50
+
+_EPOCH = datetime(1970, 1, 1)
+_MILLISECOND = timedelta(milliseconds=1)
 
 
 def parse_date(date_str: str) -> datetime:
@@ -12,6 +44,23 @@ def parse_date(date_str: str) -> datetime:
     return datetime.fromisoformat(date_str)
 
 
+def format_date(dt: datetime) -> str:
+    """Format a datetime for IG price date-range paths."""
+    return dt.strftime(DATE_FORMAT)
+
+
+def to_epoch_ms(dt: datetime) -> int:
+    """Convert a datetime to epoch milliseconds, treating naive as UTC."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _MILLISECOND
+
+
+def from_epoch_ms(ms: int) -> datetime:
+    """Convert epoch milliseconds to a naive UTC datetime."""
+    return _EPOCH + ms * _MILLISECOND
+
+
 def build_headers(client: "IGClient") -> Dict[str, str]:
     """Build headers for API requests."""
     headers = {
@@ -25,3 +74,95 @@ def build_headers(client: "IGClient") -> Dict[str, str]:
             "X-SECURITY-TOKEN"
         ]
     return headers
+
+
+def request_key(path: str, params: dict = None) -> tuple:
+    """Build a hashable key identifying a GET request."""
+    return (path, tuple(sorted((params or {}).items())))
+
+
+def resolution_seconds(resolution: str) -> int:
+    """Return the bar length in seconds for an IG price resolution."""
+    try:
+        return RESOLUTION_SECONDS[resolution]
+    except KeyError:
+        raise InvalidInputError(f"Unknown resolution: {resolution}")
+
+
+def chunk_ids(ids: list, size: int) -> list:
+    """Split ids into consecutive chunks of at most size."""
+    if size < 1:
+        raise InvalidInputError("Chunk size must be at least 1")
+    ids = list(ids)
+    chunks = []
+    for start in range(0, len(ids), size):
+        end = start + size
+        chunks.append(ids[start:end])
+    return chunks
+
+
+def _merge_chunks(chunks: list, results: list) -> dict:
+    """Merge chunk responses in input order, noting failed ids.
+
+    List values are concatenated and other values are taken from the
+    first successful response. If every chunk failed, the first error is
+    raised.
+    """
+    merged, failed, errors = {}, [], []
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            failed.extend(chunk)
+            errors.append(result)
+            continue
+        for key, value in result.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, value)
+    if errors and len(errors) == len(results):
+        raise errors[0]
+    if failed:
+        merged["failed"] = failed
+    return merged
+
+
+def _call(fetch: Callable, chunk: list):
+    try:
+        return fetch(chunk)
+    except Exception as e:
+        return e
+
+
+def fetch_chunked(
+    fetch: Callable[[list], dict],
+    ids: list,
+    chunk_size: int = MAX_IDS_PER_REQUEST,
+    max_workers: int = 8,
+) -> dict:
+    """Fetch ids in chunks concurrently and merge the responses.
+
+    A single chunk is fetched directly and returned unchanged. Otherwise
+    ids of chunks that failed are listed under "failed".
+    """
+    chunks = chunk_ids(ids, chunk_size)
+    if len(chunks) <= 1:
+        return fetch(chunks[0] if chunks else [])
+    workers = min(max_workers, len(chunks))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda c: _call(fetch, c), chunks))
+    return _merge_chunks(chunks, results)
+
+
+async def fetch_chunked_async(
+    fetch: Callable[[list], Awaitable[dict]],
+    ids: list,
+    chunk_size: int = MAX_IDS_PER_REQUEST,
+) -> dict:
+    """Async version of fetch_chunked, running chunks with gather."""
+    chunks = chunk_ids(ids, chunk_size)
+    if len(chunks) <= 1:
+        return await fetch(chunks[0] if chunks else [])
+    results = await asyncio.gather(
+        *(fetch(c) for c in chunks), return_exceptions=True
+    )
+    return _merge_chunks(chunks, results)
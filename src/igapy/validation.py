@@ -0,0 +1,239 @@
+from __future__ import annotations
+import asyncio
+import inspect
+from decimal import Decimal
+from typing import TYPE_CHECKING, Union
+
+from .exceptions import InvalidInputError
+
+if TYPE_CHECKING:
+    from .details import MarketDetailsCache
+    from .markets import AsyncMarkets, Markets
+
+
+def _decimals(value) -> int:
+    exponent = Decimal(str(value)).normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+
+def _point_size(instrument: dict, snapshot: dict) -> float:
+    """Return the size of one point in the market's price units.
+
+    IG quotes many markets scaled, e.g. EUR/USD as 11234.5 with a
+    scalingFactor of 10000 and onePipMeans "0.0001 USD/EUR", so a point
+    is onePipMeans times scalingFactor. Defaults to 1 when unknown.
+    """
+    try:
+        pip = float(str(instrument["onePipMeans"]).split()[0])
+    except (KeyError, IndexError, ValueError):
+        return 1.0
+    scaling = snapshot.get("scalingFactor") or instrument.get("scalingFactor")
+    size = pip * float(scaling or 1)
+    return size if size > 0 else 1.0
+
+
+def _rule(rules: dict, name: str, price: float, point: float):
+    """Return a dealing rule as a distance in points, or None.
+
+    Percentage rules need a reference price and are skipped without one.
+    """
+    rule = rules.get(name)
+    if not rule or rule.get("value") is None:
+        return None
+    if rule.get("unit") == "PERCENTAGE":
+        if price is None:
+            return None
+        return price * rule["value"] / 100 / point
+    return rule["value"]
+
+
+class OrderValidator:
+    """Checks orders against a market's dealingRules before sending them.
+
+    Market details come from markets.get_market_details, so pass a
+    MarketDetailsCache (or a client with a ResponseCache) to keep
+    validation off the network. Sizes may not have more decimal places
+    than the market's minimum deal size. Stop and limit levels are
+    converted to distances in points before the rules are applied.
+    """
+
+    def __init__(
+        self, markets: Union[Markets, AsyncMarkets, MarketDetailsCache]
+    ) -> None:
+        """Initialize OrderValidator with a source of market details."""
+        self.markets = markets
+
+    def validate(self, order: dict) -> None:
+        """Raise InvalidInputError if the order breaks the market's rules."""
+        self._check_order(order)
+        details = self.markets.get_market_details(order["epic"])
+        if inspect.isawaitable(details):
+            details.close()
+            raise TypeError(
+                "Async market details need validate_async, not validate"
+            )
+        self._check_details(order, details)
+
+    async def validate_async(self, order: dict) -> None:
+        """Validate an order without blocking the event loop.
+
+        Details are awaited from an async source such as AsyncMarkets,
+        and fetched on a worker thread from a synchronous one.
+        """
+        self._check_order(order)
+        get_details = self.markets.get_market_details
+        if inspect.iscoroutinefunction(get_details):
+            details = await get_details(order["epic"])
+        else:
+            details = await asyncio.to_thread(get_details, order["epic"])
+        self._check_details(order, details)
+
+    @staticmethod
+    def _check_order(order: dict) -> None:
+        if not order.get("epic"):
+            raise InvalidInputError("Order has no epic")
+        direction = order.get("direction")
+        if direction not in ("BUY", "SELL"):
+            raise InvalidInputError(f"Invalid direction: {direction}")
+
+    def _check_details(self, order: dict, details: dict) -> None:
+        rules = details.get("dealingRules") or {}
+        instrument = details.get("instrument") or {}
+        snapshot = details.get("snapshot") or {}
+        self._check_size(order, rules)
+        self._check_currency(order, instrument)
+        price = order.get("level")
+        if price is None:
+            buy = order["direction"] == "BUY"
+            price = snapshot.get("offer" if buy else "bid")
+        point = _point_size(instrument, snapshot)
+        self._check_stop(order, rules, instrument, price, point)
+        self._check_limit(order, rules, instrument, price, point)
+
+    @staticmethod
+    def _check_size(order: dict, rules: dict) -> None:
+        size = order.get("size")
+        if size is None or size <= 0:
+            raise InvalidInputError(f"Invalid size: {size}")
+        minimum = (rules.get("minDealSize") or {}).get("value")
+        if minimum is not None:
+            if size < minimum:
+                raise InvalidInputError(
+                    f"Size {size} is below the minimum of {minimum}"
+                )
+            if _decimals(size) > _decimals(minimum):
+                raise InvalidInputError(
+                    f"Size {size} is not a multiple of the lot step "
+                    f"{Decimal(1).scaleb(-_decimals(minimum))}"
+                )
+        maximum = (rules.get("maxDealSize") or {}).get("value")
+        if maximum is not None and size > maximum:
+            raise InvalidInputError(
+                f"Size {size} is above the maximum of {maximum}"
+            )
+
+    @staticmethod
+    def _check_currency(order: dict, instrument: dict) -> None:
+        code = order.get("currencyCode")
+        currencies = instrument.get("currencies")
+        if code is None or not currencies:
+            return
+        if code not in {c.get("code") for c in currencies}:
+            raise InvalidInputError(
+                f"Currency {code} is not offered for {order['epic']}"
+            )
+
+    @staticmethod
+    def _distance(
+        order: dict, kind: str, price: float, below: bool, point: float
+    ):
+        distance = order.get(f"{kind}Distance")
+        level = order.get(f"{kind}Level")
+        if distance is not None or level is None or price is None:
+            return distance
+        if (level < price) != below and level != price:
+            side = "below" if below else "above"
+            raise InvalidInputError(
+                f"{kind.capitalize()} level {level} must be {side} {price}"
+            )
+        return abs(price - level) / point
+
+    def _check_stop(
+        self,
+        order: dict,
+        rules: dict,
+        instrument: dict,
+        price: float,
+        point: float,
+    ) -> None:
+        guaranteed = order.get("guaranteedStop")
+        has_stop = (
+            order.get("stopDistance") is not None
+            or order.get("stopLevel") is not None
+        )
+        if guaranteed:
+            if instrument.get("controlledRiskAllowed") is False:
+                raise InvalidInputError(
+                    f"Guaranteed stops are not allowed for {order['epic']}"
+                )
+            if not has_stop:
+                raise InvalidInputError("A guaranteed stop needs a stop")
+        if not has_stop:
+            return
+        if instrument.get("stopsLimitsAllowed") is False:
+            raise InvalidInputError(
+                f"Stops are not allowed for {order['epic']}"
+            )
+        below = order["direction"] == "BUY"
+        distance = self._distance(order, "stop", price, below, point)
+        name = (
+            "minControlledRiskStopDistance"
+            if guaranteed
+            else "minNormalStopOrLimitDistance"
+        )
+        self._check_distance("Stop", distance, rules, name, price, point)
+
+    def _check_limit(
+        self,
+        order: dict,
+        rules: dict,
+        instrument: dict,
+        price: float,
+        point: float,
+    ) -> None:
+        if order.get("limitDistance") is None and (
+            order.get("limitLevel") is None
+        ):
+            return
+        if instrument.get("stopsLimitsAllowed") is False:
+            raise InvalidInputError(
+                f"Limits are not allowed for {order['epic']}"
+            )
+        below = order["direction"] == "SELL"
+        distance = self._distance(order, "limit", price, below, point)
+        name = "minNormalStopOrLimitDistance"
+        self._check_distance("Limit", distance, rules, name, price, point)
+
+    @staticmethod
+    def _check_distance(
+        label: str,
+        distance: float,
+        rules: dict,
+        name: str,
+        price: float,
+        point: float,
+    ) -> None:
+        if distance is None:
+            return
+        minimum = _rule(rules, name, price, point)
+        maximum = _rule(rules, "maxStopOrLimitDistance", price, point)
+        if minimum is not None and distance < minimum:
+            raise InvalidInputError(
+                f"{label} distance {distance} is below the minimum of "
+                f"{minimum}"
+            )
+        if maximum is not None and distance > maximum:
+            raise InvalidInputError(
+                f"{label} distance {distance} is above the maximum of "
+                f"{maximum}"
+            )
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .client import IGClient
+    from .async_client import AsyncIGClient
 
 
 class Watchlists:
@@ -35,3 +36,35 @@ class Watchlists:
     def remove_market(self, watchlist_id: str, epic: str) -> dict:
         """Remove market from watchlist."""
         return self.client.delete(f"/watchlists/{watchlist_id}/{epic}")
+
+
+class AsyncWatchlists:
+    """Async client for IG watchlists endpoints."""
+
+    def __init__(self, client: AsyncIGClient) -> None:
+        """Initialize AsyncWatchlists."""
+        self.client = client
+
+    async def list_watchlists(self) -> dict:
+        """List all watchlists."""
+        return await self.client.get("/watchlists")
+
+    async def create_watchlist(self, data: dict) -> dict:
+        """Create a new watchlist."""
+        return await self.client.post("/watchlists", data)
+
+    async def get_watchlist(self, watchlist_id: str) -> dict:
+        """Get a watchlist by ID."""
+        return await self.client.get(f"/watchlists/{watchlist_id}")
+
+    async def delete_watchlist(self, watchlist_id: str) -> dict:
+        """Delete a watchlist by ID."""
+        return await self.client.delete(f"/watchlists/{watchlist_id}")
+
+    async def add_market(self, watchlist_id: str, epic: str) -> dict:
+        """Add market to watchlist."""
+        return await self.client.put(f"/watchlists/{watchlist_id}/{epic}", {})
+
+    async def remove_market(self, watchlist_id: str, epic: str) -> dict:
+        """Remove market from watchlist."""
+        return await self.client.delete(f"/watchlists/{watchlist_id}/{epic}")
@@ -1,5 +1,7 @@
+import json
 import pytest
 from igapy.client import IGClient
+from igapy.async_client import AsyncIGClient
 
 
 class DummyResponse:
@@ -16,27 +18,37 @@ class DummyResponse:
         return self._json
 
 
+def _body(json_data, data):
+    """Return a request body as sent with json= or pre-encoded data=."""
+    return json.loads(data) if data is not None else json_data
+
+
 class DummySession:
     """A dummy session object for simulating requests.Session."""
 
     def __init__(self):
         self._response = DummyResponse()
         self.headers = {}
+        self.calls = []
 
     def get(self, url, params=None, headers=None):
         """Simulate a GET request."""
+        self.calls.append(("GET", url, params))
         return self._response
 
-    def post(self, url, json=None, headers=None):
+    def post(self, url, json=None, data=None, headers=None):
         """Simulate a POST request."""
+        self.calls.append(("POST", url, _body(json, data)))
         return self._response
 
-    def put(self, url, json=None, headers=None):
+    def put(self, url, json=None, data=None, headers=None):
         """Simulate a PUT request."""
+        self.calls.append(("PUT", url, _body(json, data)))
         return self._response
 
     def delete(self, url, headers=None):
         """Simulate a DELETE request."""
+        self.calls.append(("DELETE", url, None))
         return self._response
 
 
@@ -46,3 +58,60 @@ def dummy_client():
     client = IGClient("key", "user", "pass", is_demo=True)
     client.session = DummySession()
     return client
+
+
+class DummyAsyncResponse:
+    """A dummy aiohttp response object for simulating async responses."""
+
+    def __init__(self, status=200, json_data=None, headers=None, text=None):
+        self.status = status
+        self.headers = headers or {}
+        self._text = json.dumps(json_data or {}) if text is None else text
+        self.reads = 0
+
+    async def text(self):
+        """Return the dummy response body."""
+        self.reads += 1
+        return self._text
+
+
+class DummyAsyncSession:
+    """A dummy session object for simulating aiohttp.ClientSession."""
+
+    def __init__(self):
+        self._response = DummyAsyncResponse()
+        self.headers = {}
+        self.calls = []
+        self.closed = False
+
+    async def get(self, url, params=None, headers=None):
+        """Simulate a GET request."""
+        self.calls.append(("GET", url, params))
+        return self._response
+
+    async def post(self, url, json=None, headers=None):
+        """Simulate a POST request."""
+        self.calls.append(("POST", url, json))
+        return self._response
+
+    async def put(self, url, json=None, headers=None):
+        """Simulate a PUT request."""
+        self.calls.append(("PUT", url, json))
+        return self._response
+
+    async def delete(self, url, headers=None):
+        """Simulate a DELETE request."""
+        self.calls.append(("DELETE", url, None))
+        return self._response
+
+    async def close(self):
+        """Simulate closing the session."""
+        self.closed = True
+
+
+@pytest.fixture
+def dummy_async_client():
+    """Fixture providing an AsyncIGClient with a dummy async session."""
+    client = AsyncIGClient("key", "user", "pass", is_demo=True)
+    client.session = DummyAsyncSession()
+    return client
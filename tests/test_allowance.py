@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+import pytest
+from igapy.allowance import AllowanceTracker, estimate_points
+from igapy.exceptions import InvalidInputError
+from igapy.prices import Prices
+from conftest import DummyResponse
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+START = datetime(2025, 1, 1)
+
+
+def _job(epic, minutes):
+    return (epic, "MINUTE", START, START + timedelta(minutes=minutes - 1))
+
+
+def test_prices_response_updates_client_allowance(dummy_client):
+    """Test allowance metadata is tracked from prices responses."""
+    dummy_client.session._response = DummyResponse(
+        200,
+        {
+            "prices": [],
+            "metadata": {
+                "allowance": {
+                    "remainingAllowance": 9000,
+                    "totalAllowance": 10000,
+                    "allowanceExpiry": 3600,
+                }
+            },
+        },
+    )
+    Prices(dummy_client).get_prices("E")
+    assert dummy_client.allowance.remaining == 9000
+    assert dummy_client.allowance.total == 10000
+    assert 0 < dummy_client.allowance.resets_in <= 3600
+
+
+def test_legacy_allowance_key():
+    """Test the top-level allowance key of older responses."""
+    clock = FakeClock()
+    tracker = AllowanceTracker(clock)
+    tracker.update({"allowance": {"remainingAllowance": 5}})
+    assert tracker.remaining == 5
+    assert tracker.resets_in is None
+
+
+def test_estimate_points():
+    """Test point estimates for date ranges."""
+    assert estimate_points("MINUTE", START, START + timedelta(hours=1)) == 61
+    assert estimate_points("DAY", START, START) == 1
+    with pytest.raises(InvalidInputError):
+        estimate_points("FORTNIGHT", START, START)
+
+
+def test_plan_without_known_allowance_runs_everything():
+    """Test every job runs when no allowance has been seen."""
+    plan = AllowanceTracker().plan([_job("A", 10), _job("B", 5)])
+    assert [job[0] for job in plan.now] == ["B", "A"]
+    assert plan.deferred == []
+    assert plan.cost == 15
+
+
+def test_plan_splits_and_defers():
+    """Test jobs are split at the budget and the rest deferred."""
+    clock = FakeClock()
+    tracker = AllowanceTracker(clock)
+    tracker.update(
+        {"allowance": {"remainingAllowance": 25, "allowanceExpiry": 60}}
+    )
+    plan = tracker.plan([_job("A", 30), _job("B", 10), _job("C", 40)])
+    assert plan.cost == 25
+    assert plan.now[0] == _job("B", 10)
+    assert plan.now[1] == _job("A", 15)
+    split = plan.deferred[0]
+    assert split[0] == "A"
+    assert split[2] == START + timedelta(minutes=15)
+    assert [job[0] for job in plan.deferred] == ["A", "C"]
+    assert plan.resets_in == 60
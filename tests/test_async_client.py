@@ -0,0 +1,111 @@
+import asyncio
+import pytest
+from igapy.async_client import AsyncIGClient
+from igapy.exceptions import ApiKeyMissingError, IGAPIError
+from igapy.markets import AsyncMarkets
+from igapy.orders import AsyncOrders
+from igapy.prices import AsyncPrices
+from igapy.session import AsyncSessionAPI
+from conftest import DummyAsyncResponse
+
+
+def test_async_login_success(dummy_async_client):
+    """Test successful async login and token storage."""
+    dummy_async_client.session._response = DummyAsyncResponse(
+        200,
+        {"accountId": "ABC"},
+        headers={"CST": "cst", "X-SECURITY-TOKEN": "token"},
+    )
+    result = asyncio.run(dummy_async_client.login())
+    assert result["accountId"] == "ABC"
+    assert dummy_async_client.session.headers["CST"] == "cst"
+    assert dummy_async_client.session.headers["X-SECURITY-TOKEN"] == "token"
+
+
+def test_async_login_missing_key():
+    """Test async login raises if API key is missing."""
+    client = AsyncIGClient("", "user", "pass", True)
+    with pytest.raises(ApiKeyMissingError):
+        asyncio.run(client.login())
+
+
+def test_async_login_failure(dummy_async_client):
+    """Test failed async login reads the body before raising."""
+    resp = DummyAsyncResponse(401)
+    dummy_async_client.session._response = resp
+    with pytest.raises(IGAPIError):
+        asyncio.run(dummy_async_client.login())
+    assert resp.reads == 1
+
+
+def test_async_session_data_before_login():
+    """Test session_data is None until login."""
+    client = AsyncIGClient("key", "user", "pass")
+    assert client.session_data is None
+
+
+def test_async_handle_error_status(dummy_async_client):
+    """Test async error response raises IGAPIError."""
+    dummy_async_client.session._response = DummyAsyncResponse(
+        400, {"errorCode": "ERR"}
+    )
+    with pytest.raises(IGAPIError):
+        asyncio.run(dummy_async_client.get("/foo"))
+    assert dummy_async_client.session._response.reads == 1
+
+
+def test_async_empty_body(dummy_async_client):
+    """Test non-JSON body returns empty dict."""
+    dummy_async_client.session._response = DummyAsyncResponse(200, text="")
+    assert asyncio.run(dummy_async_client.delete("/foo")) == {}
+
+
+def test_async_endpoints(dummy_async_client):
+    """Test async endpoint classes route through the async client."""
+    session = dummy_async_client.session
+    session._response = DummyAsyncResponse(200, {"ok": True})
+
+    async def run():
+        return [
+            await AsyncMarkets(dummy_async_client).get_market_details("E"),
+            await AsyncPrices(dummy_async_client).get_prices_num_points(
+                "E", "DAY", 5
+            ),
+            await AsyncOrders(dummy_async_client).create_otc_position(
+                {"epic": "E"}
+            ),
+            await AsyncSessionAPI(dummy_async_client).switch_account("A2"),
+        ]
+
+    results = asyncio.run(run())
+    assert all(r == {"ok": True} for r in results)
+    methods = [call[0] for call in session.calls]
+    assert methods == ["GET", "GET", "POST", "PUT"]
+    assert session.calls[0][1].endswith("/markets/E")
+
+
+def test_async_concurrent_requests(dummy_async_client):
+    """Test many requests can run concurrently on one event loop."""
+    dummy_async_client.session._response = DummyAsyncResponse(200, {"x": 1})
+    markets = AsyncMarkets(dummy_async_client)
+
+    async def run():
+        return await asyncio.gather(
+            *(markets.get_market_details(f"E{i}") for i in range(50))
+        )
+
+    assert len(asyncio.run(run())) == 50
+    assert len(dummy_async_client.session.calls) == 50
+
+
+def test_async_context_manager_closes(dummy_async_client):
+    """Test the async context manager closes the session."""
+    session = dummy_async_client.session
+
+    async def run():
+        async with dummy_async_client:
+            pass
+
+    asyncio.run(run())
+    assert session.closed
+    assert dummy_async_client.session is None
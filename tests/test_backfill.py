@@ -0,0 +1,133 @@
+import csv
+import pytest
+import threading
+import time
+from datetime import datetime, timedelta
+from igapy.backfill import (
+    BulkDownloader,
+    CSVSink,
+    ParquetSink,
+    StoreSink,
+    split_job,
+)
+from igapy.exceptions import IGAPIError, InvalidInputError
+from igapy.store import PriceStore
+
+START = datetime(2025, 1, 1)
+
+
+class FakePrices:
+    """Prices stand-in returning one bar per minute in the range."""
+
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+        self._lock = threading.Lock()
+
+    def get_prices_date_range(self, epic, resolution, start, end):
+        with self._lock:
+            self.calls.append((epic, start))
+        first = datetime.fromisoformat(start)
+        last = datetime.fromisoformat(end)
+        if (epic, first) in self.fail:
+            raise IGAPIError("API error: 500")
+        # Finish out of order to prove the sink still sees job order.
+        time.sleep(0.01 if first.minute % 2 else 0.0)
+        bars = []
+        while first <= last:
+            bars.append(
+                {
+                    "snapshotTimeUTC": first.isoformat(),
+                    "closePrice": {"bid": float(first.minute)},
+                }
+            )
+            first += timedelta(minutes=1)
+        return {"prices": bars}
+
+
+def _job(epic, minutes):
+    return (epic, "MINUTE", START, START + timedelta(minutes=minutes - 1))
+
+
+def test_split_job():
+    """Test jobs split into chunks of at most chunk_points bars."""
+    chunks = split_job(_job("E", 10), 4)
+    assert [(c[2].minute, c[3].minute) for c in chunks] == [
+        (0, 3),
+        (4, 7),
+        (8, 9),
+    ]
+
+
+def test_split_job_rejects_empty_chunks():
+    """Test chunk_points below 1 is rejected instead of looping."""
+    with pytest.raises(InvalidInputError):
+        split_job(_job("E", 10), 0)
+
+
+def test_results_reach_sink_in_order():
+    """Test chunks are delivered in job and chunk order."""
+    seen, progress = [], []
+    downloader = BulkDownloader(FakePrices(), max_workers=4, chunk_points=2)
+    report = downloader.run(
+        [_job("A", 6), _job("B", 4)],
+        lambda chunk, resp: seen.append((chunk[0], chunk[2].minute)),
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    assert seen == [("A", 0), ("A", 2), ("A", 4), ("B", 0), ("B", 2)]
+    assert report.ok
+    assert progress[-1] == (5, 5)
+
+
+def test_failures_are_reported_and_resumed(tmp_path):
+    """Test failed chunks are retried on a resumed run."""
+    checkpoint = str(tmp_path / "progress.txt")
+    prices = FakePrices(fail={("A", START + timedelta(minutes=2))})
+    downloader = BulkDownloader(prices, chunk_points=2, checkpoint=checkpoint)
+    report = downloader.run([_job("A", 6)], lambda chunk, resp: None)
+    assert not report.ok
+    assert len(report.completed) == 2
+    prices.fail.clear()
+    prices.calls.clear()
+    report = downloader.run([_job("A", 6)], lambda chunk, resp: None)
+    assert report.ok
+    assert len(report.skipped) == 2
+    assert prices.calls == [("A", "2025-01-01 00:02:00")]
+
+
+def test_csv_sink(tmp_path):
+    """Test the CSV sink writes a header and one row per bar."""
+    path = str(tmp_path / "out.csv")
+    sink = CSVSink(path)
+    BulkDownloader(FakePrices(), chunk_points=2).run([_job("A", 3)], sink)
+    sink.close()
+    with open(path) as f:
+        rows = list(csv.reader(f))
+    assert rows[0][:3] == ["epic", "resolution", "timestamp"]
+    assert len(rows) == 4
+
+
+def test_store_sink(tmp_path):
+    """Test the store sink merges chunks into a PriceStore."""
+    store = PriceStore(str(tmp_path))
+    BulkDownloader(FakePrices(), chunk_points=2).run(
+        [_job("A", 5)], StoreSink(store)
+    )
+    assert list(store.load("A", "MINUTE")["bid_close"]) == [
+        0.0,
+        1.0,
+        2.0,
+        3.0,
+        4.0,
+    ]
+
+
+def test_parquet_sink(tmp_path):
+    """Test the Parquet sink writes one file per chunk."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    BulkDownloader(FakePrices(), chunk_points=2).run(
+        [_job("A", 3)], ParquetSink(str(tmp_path))
+    )
+    files = sorted(tmp_path.iterdir())
+    assert len(files) == 2
+    assert pq.read_table(files[0]).num_rows == 2
@@ -0,0 +1,176 @@
+import json
+import pytest
+import time
+
+from igapy.books import PositionBook, WorkingOrderBook, _Book
+
+
+class FakeStreaming:
+    """Streaming stand-in holding trade listeners."""
+
+    def __init__(self):
+        self.listeners = []
+
+    def add_trade_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_trade_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def send(self, field, **update):
+        for listener in list(self.listeners):
+            listener({field: json.dumps(update)})
+
+
+def _position(deal_id, epic, size=1.0):
+    return {
+        "position": {"dealId": deal_id, "size": size, "direction": "BUY"},
+        "market": {"epic": epic},
+    }
+
+
+class FakeOrders:
+    """Orders stand-in serving a mutable positions snapshot."""
+
+    def __init__(self, positions):
+        self.positions = positions
+        self.calls = 0
+        self.on_fetch = None
+
+    def get_positions(self):
+        self.calls += 1
+        if self.on_fetch:
+            self.on_fetch()
+        return {"positions": list(self.positions)}
+
+
+def _book(positions, interval=None):
+    streaming = FakeStreaming()
+    orders = FakeOrders(positions)
+    return PositionBook(orders, streaming, interval), orders, streaming
+
+
+def test_snapshot_indexes():
+    """Test the REST snapshot is indexed by deal id and epic."""
+    book, _, _ = _book([_position("A", "E1"), _position("B", "E1")])
+    assert book.get("A")["epic"] == "E1"
+    assert len(book.by_epic("E1")) == 2
+    assert len(book) == 2
+
+
+def test_incomplete_book_fails_on_construction():
+    """Test a subclass missing an index hook cannot be constructed."""
+
+    class NoIndexes(_Book):
+        _field = "OPU"
+
+        def _fetch(self):
+            return []
+
+    streaming = FakeStreaming()
+    with pytest.raises(TypeError):
+        NoIndexes(FakeOrders([]), streaming)
+    assert streaming.listeners == []
+
+
+def test_opu_updates():
+    """Test OPU open, update and delete messages."""
+    book, orders, streaming = _book([_position("A", "E1")])
+    streaming.send("OPU", dealId="B", epic="E2", size=2.0, status="OPEN")
+    streaming.send("OPU", dealId="A", epic="E1", size=3.0, status="UPDATED")
+    before = book.get("A")
+    streaming.send("OPU", dealId="A", epic="E1", status="DELETED")
+    streaming.send("OPU", dealId="C", epic="E2", dealStatus="REJECTED")
+    assert book.get("A") is None
+    assert before["size"] == 3.0 and before["direction"] == "BUY"
+    assert [p["dealId"] for p in book.by_epic("E2")] == ["B"]
+    assert book.by_epic("E1") == []
+    assert orders.calls == 1
+
+
+def test_reconcile_replays_updates_during_fetch():
+    """Test updates streamed while reconciling survive the snapshot."""
+    book, orders, streaming = _book([_position("A", "E1")])
+    orders.on_fetch = lambda: streaming.send(
+        "OPU", dealId="B", epic="E1", size=1.0, status="OPEN"
+    )
+    book.reconcile()
+    assert {p["dealId"] for p in book.positions()} == {"A", "B"}
+
+
+def test_periodic_reconcile():
+    """Test the book reconciles against REST at the configured rate."""
+    book, orders, _ = _book([_position("A", "E1")], interval=0.01)
+    orders.positions = [_position("Z", "E9")]
+    deadline = time.monotonic() + 2
+    while book.get("Z") is None and time.monotonic() < deadline:
+        time.sleep(0.005)
+    book.close()
+    assert book.get("A") is None
+    assert book.get("Z")["epic"] == "E9"
+
+
+def _order(deal_id, epic, direction, level):
+    return {
+        "workingOrderData": {
+            "dealId": deal_id,
+            "epic": epic,
+            "direction": direction,
+            "orderLevel": level,
+            "orderSize": 1.0,
+        },
+        "marketData": {"epic": epic},
+    }
+
+
+class FakeWorkingOrders:
+    """Orders stand-in serving a working orders snapshot."""
+
+    def __init__(self, orders):
+        self.orders = orders
+
+    def get_working_orders(self):
+        return {"workingOrders": self.orders}
+
+
+def _order_book(orders):
+    streaming = FakeStreaming()
+    book = WorkingOrderBook(FakeWorkingOrders(orders), streaming, None)
+    return book, streaming
+
+
+def test_working_order_snapshot_normalized():
+    """Test REST orderLevel and orderSize become level and size."""
+    book, _ = _order_book([_order("A", "E", "BUY", 100)])
+    assert book.get("A")["level"] == 100.0
+    assert book.get("A")["size"] == 1.0
+    assert [o["dealId"] for o in book.by_epic("E")] == ["A"]
+
+
+def test_near_is_a_level_range_query():
+    """Test orders within N points of a price, by direction."""
+    book, _ = _order_book(
+        [
+            _order("A", "E", "BUY", 100),
+            _order("B", "E", "SELL", 104),
+            _order("C", "E", "BUY", 110),
+            _order("D", "OTHER", "BUY", 101),
+        ]
+    )
+    assert [o["dealId"] for o in book.near("E", 102, 2)] == ["A", "B"]
+    assert [o["dealId"] for o in book.near("E", 102, 2, "BUY")] == ["A"]
+    assert book.near("E", 200, 5) == []
+
+
+def test_wou_updates_move_levels():
+    """Test WOU messages add, re-level and delete orders."""
+    book, streaming = _order_book([_order("A", "E", "BUY", 100)])
+    streaming.send(
+        "WOU", dealId="B", epic="E", direction="SELL", level=90, status="OPEN"
+    )
+    streaming.send("WOU", dealId="A", level=120, status="UPDATED")
+    assert [o["dealId"] for o in book.near("E", 95, 6)] == ["B"]
+    assert [o["dealId"] for o in book.near("E", 120, 0)] == ["A"]
+    streaming.send("WOU", dealId="A", status="DELETED")
+    assert book.near("E", 120, 0) == []
+    assert len(book.working_orders()) == 1
@@ -0,0 +1,90 @@
+import threading
+
+from igapy.bulk import BulkOrders
+from igapy.exceptions import IGAPIError
+
+
+class FakeOrders:
+    """Orders stand-in whose deletes wait for each other."""
+
+    def __init__(self, concurrent=1):
+        self.barrier = threading.Barrier(concurrent, timeout=5)
+        self.deleted = []
+        self.lock = threading.Lock()
+
+    def get_positions(self):
+        return {
+            "positions": [
+                {"position": {"dealId": "P1"}, "market": {"epic": "A"}},
+                {"position": {"dealId": "P2"}, "market": {"epic": "B"}},
+                {"position": {"dealId": "P3"}, "market": {"epic": "A"}},
+            ]
+        }
+
+    def get_working_orders(self):
+        return {
+            "workingOrders": [
+                {"workingOrderData": {"dealId": "W1", "epic": "A"}},
+                {"workingOrderData": {"dealId": "W2", "epic": "B"}},
+            ]
+        }
+
+    def delete_position(self, deal_id):
+        self.barrier.wait()
+        if deal_id == "BAD":
+            raise IGAPIError("rejected")
+        with self.lock:
+            self.deleted.append(deal_id)
+        return {"dealReference": f"REF-{deal_id}"}
+
+    delete_working_order = delete_position
+
+
+class FakeConfirmer:
+    def confirm(self, reference):
+        if reference == "REF-P3":
+            raise IGAPIError("API error: 404")
+        status = "REJECTED" if reference == "REF-P2" else "ACCEPTED"
+        return {"dealReference": reference, "dealStatus": status}
+
+
+def test_flatten_runs_concurrently():
+    """Test every position is closed in parallel."""
+    orders = FakeOrders(concurrent=3)
+    report = BulkOrders(orders).flatten()
+    assert report.ok
+    assert [d for d, _ in report.completed] == ["P1", "P2", "P3"]
+    assert sorted(orders.deleted) == ["P1", "P2", "P3"]
+
+
+def test_close_by_epic_and_cancel_all():
+    """Test filtering positions and working orders by epic."""
+    orders = FakeOrders()
+    bulk = BulkOrders(orders, max_workers=1)
+    assert [d for d, _ in bulk.close_by_epic("A").completed] == ["P1", "P3"]
+    assert [d for d, _ in bulk.cancel_all("B").completed] == ["W2"]
+    assert [d for d, _ in bulk.cancel_all().completed] == ["W1", "W2"]
+
+
+def test_failures_and_rejections_are_reported():
+    """Test per-deal errors and rejected confirms are kept apart."""
+    bulk = BulkOrders(FakeOrders(), max_workers=1, confirmer=FakeConfirmer())
+    report = bulk.close_positions(["P1", "P2", "BAD"])
+    assert not report.ok
+    assert [d for d, _ in report.completed] == ["P1"]
+    assert [d for d, _ in report.rejected] == ["P2"]
+    assert [d for d, _ in report.failed] == ["BAD"]
+    assert report.confirms["P1"]["dealStatus"] == "ACCEPTED"
+    assert BulkOrders(FakeOrders()).close_positions([]).ok
+
+
+def test_confirm_errors_are_unconfirmed_not_failed():
+    """Test a sent delete whose confirm fails keeps its deal reference."""
+    bulk = BulkOrders(FakeOrders(), max_workers=1, confirmer=FakeConfirmer())
+    report = bulk.close_positions(["P1", "P3"])
+    assert not report.ok
+    assert report.failed == []
+    [(deal_id, response, error)] = report.unconfirmed
+    assert deal_id == "P3"
+    assert response["dealReference"] == "REF-P3"
+    assert isinstance(error, IGAPIError)
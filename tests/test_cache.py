@@ -0,0 +1,78 @@
+from igapy.accounts import Accounts
+from igapy.cache import ResponseCache
+from igapy.markets import Markets
+from conftest import DummyResponse
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hits_reference_data(dummy_client):
+    """Test repeated market details are served from the cache."""
+    dummy_client.cache = ResponseCache()
+    dummy_client.session._response = DummyResponse(200, {"market": "E"})
+    markets = Markets(dummy_client)
+    for _ in range(3):
+        assert markets.get_market_details("E") == {"market": "E"}
+    assert len(dummy_client.session.calls) == 1
+    assert dummy_client.cache.hits == 2
+    assert dummy_client.cache.misses == 1
+
+
+def test_uncached_paths_always_fetch(dummy_client):
+    """Test paths without a TTL rule bypass the cache."""
+    dummy_client.cache = ResponseCache()
+    markets = Markets(dummy_client)
+    markets.search_markets("FTSE")
+    markets.search_markets("FTSE")
+    assert len(dummy_client.session.calls) == 2
+
+
+def test_cache_entries_expire():
+    """Test entries expire after their TTL."""
+    clock = FakeClock()
+    cache = ResponseCache({"/a": 10.0}, clock=clock)
+    cache.set(("/a", ()), {"x": 1}, 10.0)
+    assert cache.get(("/a", ())) == {"x": 1}
+    clock.now = 10.0
+    assert cache.get(("/a", ())) is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Test the cache stays within maxsize."""
+    cache = ResponseCache(maxsize=2)
+    cache.set(("/a", ()), 1, 60.0)
+    cache.set(("/b", ()), 2, 60.0)
+    cache.get(("/a", ()))
+    cache.set(("/c", ()), 3, 60.0)
+    assert cache.get(("/b", ())) is None
+    assert cache.get(("/a", ())) == 1
+
+
+def test_invalidate_by_pattern():
+    """Test explicit invalidation by path pattern."""
+    cache = ResponseCache()
+    cache.set(("/markets/A", ()), 1, 60.0)
+    cache.set(("/markets/B", ()), 2, 60.0)
+    cache.set(("/accounts/preferences", ()), 3, 60.0)
+    assert cache.invalidate("/markets/*") == 2
+    assert cache.invalidate() == 1
+
+
+def test_write_invalidates_path(dummy_client):
+    """Test updating preferences drops the cached preferences."""
+    dummy_client.cache = ResponseCache()
+    accounts = Accounts(dummy_client)
+    accounts.get_preferences()
+    accounts.update_preferences({"trailingStopsEnabled": True})
+    accounts.get_preferences()
+    methods = [call[0] for call in dummy_client.session.calls]
+    assert methods == ["GET", "PUT", "GET"]
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import threading
+
+from igapy.confirm import AsyncDealConfirmer, DealConfirmer
+from igapy.metrics import CONFIRM, OPU, LatencyMetrics
+
+
+class FakeStreaming:
+    """Streaming stand-in holding trade listeners."""
+
+    def __init__(self):
+        self.listeners = []
+
+    def add_trade_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_trade_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def confirm(self, reference, status="ACCEPTED"):
+        payload = json.dumps(
+            {"dealReference": reference, "dealStatus": status}
+        )
+        for listener in self.listeners:
+            listener({"CONFIRMS": payload, "OPU": None, "WOU": None})
+
+
+class FakeOrders:
+    """Orders stand-in that streams the confirm after placing."""
+
+    def __init__(self, streaming, stream=True):
+        self.streaming = streaming
+        self.stream = stream
+        self.confirm_calls = []
+
+    def create_otc_position(self, order):
+        if self.stream:
+            threading.Timer(0.01, self.streaming.confirm, ("REF",)).start()
+        return {"dealReference": "REF"}
+
+    def get_confirms(self, deal_reference):
+        self.confirm_calls.append(deal_reference)
+        return {"dealReference": deal_reference, "dealStatus": "REJECTED"}
+
+
+class FakeAsyncOrders(FakeOrders):
+    async def create_otc_position(self, order):
+        return FakeOrders.create_otc_position(self, order)
+
+    async def get_confirms(self, deal_reference):
+        return FakeOrders.get_confirms(self, deal_reference)
+
+
+def test_place_and_confirm_from_stream():
+    """Test the streamed confirm resolves without a REST call."""
+    streaming = FakeStreaming()
+    orders = FakeOrders(streaming)
+    confirmer = DealConfirmer(orders, streaming)
+    result = confirmer.place_and_confirm({"epic": "E"})
+    assert result["dealStatus"] == "ACCEPTED"
+    assert orders.confirm_calls == []
+    assert confirmer.stream_confirms == 1
+
+
+def test_confirm_before_wait_is_buffered():
+    """Test a confirm streamed before waiting is still matched."""
+    streaming = FakeStreaming()
+    confirmer = DealConfirmer(FakeOrders(streaming), streaming)
+    streaming.confirm("EARLY")
+    assert confirmer.wait_for("EARLY").result(0)["dealStatus"] == "ACCEPTED"
+
+
+def test_falls_back_to_rest_on_timeout():
+    """Test get_confirms is used when no confirm streams in time."""
+    streaming = FakeStreaming()
+    orders = FakeOrders(streaming, stream=False)
+    confirmer = DealConfirmer(orders, streaming, timeout=0.01)
+    result = confirmer.place_and_confirm({"epic": "E"})
+    assert result["dealStatus"] == "REJECTED"
+    assert orders.confirm_calls == ["REF"]
+    assert confirmer.rest_confirms == 1
+    confirmer.close()
+    assert streaming.listeners == []
+
+
+def test_async_place_and_confirm():
+    """Test async confirmation from the stream and REST fallback."""
+    streaming = FakeStreaming()
+    orders = FakeAsyncOrders(streaming)
+    confirmer = AsyncDealConfirmer(orders, streaming)
+    result = asyncio.run(confirmer.place_and_confirm({"epic": "E"}))
+    assert result["dealStatus"] == "ACCEPTED"
+    orders.stream = False
+    result = asyncio.run(confirmer.place_and_confirm({"epic": "E"}, 0.01))
+    assert result["dealStatus"] == "REJECTED"
+    streaming.confirm("REF")  # a late confirm must not raise
+
+
+def test_confirm_and_opu_latency_metrics():
+    """Test send-to-confirm and send-to-OPU times are recorded by epic."""
+    streaming = FakeStreaming()
+    orders = FakeOrders(streaming, stream=False)
+    metrics = LatencyMetrics()
+    confirmer = DealConfirmer(orders, streaming, metrics=metrics)
+    # The confirm streams in before create_otc_position returns.
+    orders.create_otc_position = lambda order: (
+        streaming.confirm("REF"),
+        {"dealReference": "REF"},
+    )[1]
+    confirmer.place_and_confirm({"epic": "E"})
+    for listener in streaming.listeners:
+        listener({"OPU": json.dumps({"dealReference": "REF"})})
+    assert metrics.histogram(CONFIRM, "E").count == 1
+    assert metrics.histogram(OPU, "E").count == 1
+
+
+def test_opu_before_confirm_keeps_both_samples():
+    """Test an OPU streamed before its CONFIRM does not drop the confirm."""
+    streaming = FakeStreaming()
+    orders = FakeOrders(streaming, stream=False)
+    metrics = LatencyMetrics()
+    confirmer = DealConfirmer(orders, streaming, metrics=metrics)
+
+    def place(order):
+        for listener in list(streaming.listeners):
+            listener({"OPU": json.dumps({"dealReference": "REF"})})
+        threading.Timer(0.01, streaming.confirm, ("REF",)).start()
+        return {"dealReference": "REF"}
+
+    orders.create_otc_position = place
+    confirmer.place_and_confirm({"epic": "E"})
+    assert metrics.histogram(OPU, "E").count == 1
+    assert metrics.histogram(CONFIRM, "E").count == 1
+    assert confirmer._sent == {}
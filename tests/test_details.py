@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+from igapy.cache import ResponseCache
+from igapy.details import MarketDetailsCache
+
+
+class FakeMarkets:
+    """Markets stand-in returning canned details and counting fetches."""
+
+    def __init__(self, status="TRADEABLE"):
+        self.client = SimpleNamespace(cache=ResponseCache())
+        self.status = status
+        self.calls = []
+
+    def get_market_details(self, epic):
+        self.calls.append(epic)
+        return {
+            "instrument": {"epic": epic},
+            "dealingRules": {"minDealSize": {"value": len(self.calls)}},
+            "snapshot": {"marketStatus": self.status, "bid": 1.0},
+        }
+
+
+class FakeStreaming:
+    """Streaming stand-in keeping MARKET callbacks by epic."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.unsubscribed = []
+
+    def subscribe_market(self, epic, fields, callback):
+        self.callbacks[epic] = callback
+
+    def unsubscribe_market(self, epic):
+        self.unsubscribed.append(epic)
+
+
+def _cache(status="TRADEABLE"):
+    markets, streaming = FakeMarkets(status), FakeStreaming()
+    return MarketDetailsCache(markets, streaming), markets, streaming
+
+
+def test_hit_does_not_refetch():
+    """Test details are fetched once and the epic is subscribed."""
+    cache, markets, streaming = _cache()
+    first = cache.get_market_details("E")
+    assert cache.get_market_details("E") is first
+    assert markets.calls == ["E"]
+    assert "E" in streaming.callbacks
+
+
+def test_price_updates_patch_snapshot():
+    """Test bid, offer and time updates are applied without REST calls."""
+    cache, markets, streaming = _cache()
+    before = cache.get_market_details("E")
+    streaming.callbacks["E"](
+        {"MARKET_STATE": "TRADEABLE", "BID": "1.5", "OFFER": "1.6"}
+    )
+    streaming.callbacks["E"]({"UPDATE_TIME": "10:00:01"})
+    snapshot = cache.get_market_details("E")["snapshot"]
+    assert snapshot["bid"] == 1.5
+    assert snapshot["offer"] == 1.6
+    assert snapshot["updateTime"] == "10:00:01"
+    assert before["snapshot"]["bid"] == 1.0
+    assert markets.calls == ["E"]
+
+
+def test_state_change_refetches():
+    """Test a market state change drops the entry and the REST cache."""
+    cache, markets, streaming = _cache()
+    cache.get_market_details("E")
+    markets.client.cache.set(("/markets/E", ()), {}, 60)
+    markets.status = "EDITS_ONLY"
+    streaming.callbacks["E"]({"MARKET_STATE": "EDIT"})
+    assert len(cache) == 0
+    assert len(markets.client.cache) == 0
+    details = cache.get_market_details("E")
+    assert details["snapshot"]["marketStatus"] == "EDITS_ONLY"
+    assert markets.calls == ["E", "E"]
+
+
+def test_initial_stream_state_keeps_entry():
+    """Test a first state matching REST does not invalidate."""
+    cache, markets, streaming = _cache("ON_AUCTION")
+    cache.get_market_details("E")
+    streaming.callbacks["E"]({"MARKET_STATE": "AUCTION"})
+    assert len(cache) == 1
+
+
+def test_close_unsubscribes():
+    """Test close unsubscribes every cached epic."""
+    cache, markets, streaming = _cache()
+    cache.get_market_details("A")
+    cache.get_market_details("B")
+    cache.close()
+    assert sorted(streaming.unsubscribed) == ["A", "B"]
+    assert len(cache) == 0
@@ -0,0 +1,131 @@
+import threading
+
+import pytest
+
+from igapy.dispatch import BLOCK, CONFLATE, DROP_OLDEST, Dispatcher
+
+
+def _paused(dispatcher, name, received, **options):
+    """Create a channel whose deliveries wait for a gate.
+
+    started is set once a worker is inside the callback, so the first
+    update has left the queue.
+    """
+    gate, started = threading.Event(), threading.Event()
+
+    def callback(*args):
+        started.set()
+        gate.wait(5)
+        received.append(args)
+
+    return dispatcher.channel(name, callback, **options), gate, started
+
+
+def test_per_channel_order_and_stats():
+    """Test updates are delivered in order and counted."""
+    dispatcher = Dispatcher(workers=4)
+    received = []
+    channel = dispatcher.channel("c", lambda *a: received.append(a))
+    for i in range(200):
+        channel("E", i)
+    dispatcher.close()
+    assert [i for _, i in received] == list(range(200))
+    assert dispatcher.stats()["c"]["delivered"] == 200
+    assert dispatcher.stats()["c"]["depth"] == 0
+
+
+def test_drop_oldest():
+    """Test a full drop_oldest channel discards the oldest updates."""
+    dispatcher = Dispatcher(workers=1)
+    received = []
+    channel, gate, started = _paused(
+        dispatcher, "c", received, maxsize=2, policy=DROP_OLDEST
+    )
+    channel(0)
+    assert started.wait(5)  # the worker holds update 0 at the gate
+    for i in range(1, 5):
+        channel(i)
+    gate.set()
+    dispatcher.close()
+    assert received == [(0,), (3,), (4,)]
+    assert channel.dropped == 2
+
+
+def test_conflate_keeps_latest_per_item():
+    """Test conflation replaces queued updates for the same item."""
+    dispatcher = Dispatcher(workers=1)
+    received = []
+    channel, gate, started = _paused(
+        dispatcher, "c", received, policy=CONFLATE, key=lambda e, v: e
+    )
+    channel("A", 0)
+    assert started.wait(5)
+    for epic, value in [("A", 1), ("B", 1), ("A", 2), ("B", 2)]:
+        channel(epic, value)
+    gate.set()
+    dispatcher.close()
+    assert received == [("A", 0), ("A", 2), ("B", 2)]
+    assert channel.conflated == 2
+
+
+def test_block_waits_and_slow_channel_is_isolated():
+    """Test block applies backpressure without stalling other channels."""
+    dispatcher = Dispatcher(workers=2)
+    slow_received, fast_received = [], []
+    slow, gate, started = _paused(
+        dispatcher, "slow", slow_received, maxsize=1, policy=BLOCK
+    )
+    fast = dispatcher.channel("fast", lambda v: fast_received.append(v))
+    slow(0)
+    assert started.wait(5)
+    slow(1)
+    producer = threading.Thread(target=slow, args=(2,))
+    producer.start()
+    fast("x")
+    producer.join(0.05)
+    assert producer.is_alive()
+    gate.set()
+    producer.join(5)
+    dispatcher.close()
+    assert fast_received == ["x"]
+    assert slow_received == [(0,), (1,), (2,)]
+
+
+def test_reused_arguments_are_copied():
+    """Test a reused values list is captured as it was when enqueued."""
+    dispatcher = Dispatcher(workers=1)
+    received = []
+    channel, gate, started = _paused(dispatcher, "c", received)
+    values = ["1.0", "2.0"]
+    channel(values, 0b11)
+    assert started.wait(5)
+    values[0] = "1.5"
+    channel(values, 0b01)
+    values[0] = "9.9"
+    gate.set()
+    dispatcher.close()
+    assert received == [(["1.0", "2.0"], 0b11), (["1.5", "2.0"], 0b01)]
+
+
+def test_callback_errors_are_counted(capsys):
+    """Test a failing callback is counted and does not stop delivery."""
+    dispatcher = Dispatcher(workers=1)
+
+    def callback(v):
+        if v == 0:
+            raise ValueError("fail!")
+
+    channel = dispatcher.channel("c", callback)
+    channel(0)
+    channel(1)
+    dispatcher.close()
+    assert channel.errors == 1 and channel.delivered == 1
+    assert "Exception in c callback" in capsys.readouterr().out
+
+
+def test_invalid_policy():
+    """Test unknown policies are rejected."""
+    dispatcher = Dispatcher(workers=1)
+    with pytest.raises(ValueError):
+        dispatcher.channel("c", print, policy="spill")
+    dispatcher.close()
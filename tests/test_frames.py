@@ -0,0 +1,81 @@
+import math
+import pytest
+from igapy.frames import COLUMNS, PriceFrame, parse_snapshot_time
+
+RESPONSE = {
+    "prices": [
+        {
+            "snapshotTimeUTC": "2025-01-01T00:00:00",
+            "openPrice": {"bid": 1.0, "ask": 1.2, "lastTraded": None},
+            "highPrice": {"bid": 2.0, "ask": 2.2, "lastTraded": None},
+            "lowPrice": {"bid": 0.5, "ask": 0.7, "lastTraded": None},
+            "closePrice": {"bid": 1.5, "ask": 1.7, "lastTraded": None},
+            "lastTradedVolume": 10,
+        },
+        {
+            "snapshotTime": "2025/01/01 00:01:00",
+            "openPrice": {"bid": 1.5, "ask": 1.7},
+            "highPrice": {"bid": 1.6, "ask": 1.8},
+            "lowPrice": {"bid": 1.4, "ask": 1.6},
+            "closePrice": {"bid": 1.55, "ask": 1.75},
+        },
+    ]
+}
+
+
+def test_parse_snapshot_time_formats():
+    """Test both IG snapshot time formats decode to epoch ms."""
+    iso = parse_snapshot_time({"snapshotTimeUTC": "1970-01-01T00:00:01"})
+    legacy = parse_snapshot_time({"snapshotTime": "1970/01/01 00:00:01"})
+    offset = parse_snapshot_time(
+        {"snapshotTimeUTC": "1970-01-01T01:00:01+01:00"}
+    )
+    assert iso == legacy == offset == 1000
+
+
+def test_from_response_columns():
+    """Test a prices response decodes into typed columns."""
+    frame = PriceFrame.from_response(RESPONSE)
+    assert len(frame) == 2
+    assert tuple(frame.columns) == COLUMNS
+    assert frame["timestamp"].typecode == "q"
+    assert list(frame["timestamp"]) == [1735689600000, 1735689660000]
+    assert list(frame["bid_close"]) == [1.5, 1.55]
+    assert frame["volume"][0] == 10.0
+    assert math.isnan(frame["volume"][1])
+    assert math.isnan(frame["last_open"][0])
+
+
+def test_slice_is_zero_copy():
+    """Test slices share memory with the frame."""
+    frame = PriceFrame.from_response(RESPONSE)
+    part = frame.slice(1, 2)
+    assert len(part) == 1
+    frame["bid_open"][1] = 9.0
+    assert part["bid_open"][0] == 9.0
+
+
+def test_to_numpy_shares_memory():
+    """Test NumPy conversion does not copy."""
+    np = pytest.importorskip("numpy")
+    frame = PriceFrame.from_response(RESPONSE)
+    arrays = frame.to_numpy()
+    assert arrays["timestamp"].dtype == np.int64
+    frame["ask_open"][0] = 5.0
+    assert arrays["ask_open"][0] == 5.0
+
+
+def test_to_pandas():
+    """Test pandas conversion is indexed by UTC timestamp."""
+    pytest.importorskip("pandas")
+    df = PriceFrame.from_response(RESPONSE).to_pandas()
+    assert list(df["bid_close"]) == [1.5, 1.55]
+    assert str(df.index.tz) == "UTC"
+
+
+def test_to_arrow():
+    """Test Arrow conversion wraps the column buffers."""
+    pytest.importorskip("pyarrow")
+    table = PriceFrame.from_response(RESPONSE).slice(1, 2).to_arrow()
+    assert table.num_rows == 1
+    assert table.column("bid_close").to_pylist() == [1.55]
@@ -34,3 +34,15 @@ def test_market_navigation(dummy_client):
     assert "nodes" in nav
     sub = Markets(dummy_client).get_market_sub_nodes("N")
     assert isinstance(sub, dict)
+
+
+def test_get_markets_chunks_long_lists(dummy_client):
+    """Test get_markets splits epics into server-sized requests."""
+    epics = [f"E{i}" for i in range(120)]
+    Markets(dummy_client).get_markets(epics)
+    sent = sorted(
+        (call[2]["epics"].split(",") for call in dummy_client.session.calls),
+        key=lambda part: epics.index(part[0]),
+    )
+    assert [len(part) for part in sent] == [50, 50, 20]
+    assert sum(sent, []) == epics
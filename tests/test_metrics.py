@@ -0,0 +1,71 @@
+import pytest
+
+from igapy.metrics import (
+    PARSE,
+    SEND,
+    SERIALIZE,
+    Histogram,
+    LatencyMetrics,
+)
+
+
+def test_histogram_percentiles():
+    """Test percentiles are within the bucket precision."""
+    histogram = Histogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    assert histogram.count == 100
+    assert histogram.percentile(50) == pytest.approx(0.050, rel=0.01)
+    assert histogram.percentile(99) == pytest.approx(0.099, rel=0.01)
+    assert histogram.percentile(100) == 0.1
+    assert histogram.mean == pytest.approx(0.0505)
+    assert Histogram().percentile(50) is None
+
+
+def test_latency_metrics_per_epic():
+    """Test samples are kept per epic and across all epics."""
+    metrics = LatencyMetrics()
+    metrics.record(SEND, 0.010, "A")
+    metrics.record(SEND, 0.030, "B")
+    assert metrics.percentiles(SEND, "A")[50] == pytest.approx(0.010, 0.01)
+    assert metrics.percentiles(SEND)["count"] == 2
+    assert metrics.percentiles(SEND, "C") == {"count": 0}
+    assert set(metrics.summary()) == {(SEND, None), (SEND, "A"), (SEND, "B")}
+
+
+def test_client_times_trading_requests(dummy_client):
+    """Test trading requests are timed by stage and tagged by epic."""
+    metrics = LatencyMetrics()
+    dummy_client.metrics = metrics
+    dummy_client.post("/positions/otc", {"epic": "E", "size": 1})
+    dummy_client.get("/markets/E")
+    for stage in (SERIALIZE, SEND, PARSE):
+        assert metrics.histogram(stage, "E").count == 1
+        assert metrics.histogram(stage).count == 1
+    assert dummy_client.session.calls[0][2] == {"epic": "E", "size": 1}
+
+
+def test_histogram_is_a_snapshot():
+    """Test a returned histogram does not change as samples arrive."""
+    metrics = LatencyMetrics()
+    metrics.record(SEND, 0.010)
+    snapshot = metrics.histogram(SEND)
+    metrics.record(SEND, 0.020)
+    assert snapshot.count == 1
+    assert metrics.histogram(SEND).count == 2
+
+
+def test_untimed_client_leaves_encoding_to_requests(dummy_client):
+    """Test bodies are only pre-encoded when a metrics sink is set."""
+    sent = {}
+
+    def post(url, json=None, data=None, headers=None):
+        sent.update(json=json, data=data)
+        return dummy_client.session._response
+
+    dummy_client.session.post = post
+    dummy_client.post("/positions/otc", {"epic": "E"})
+    assert sent == {"json": {"epic": "E"}, "data": None}
+    dummy_client.metrics = LatencyMetrics()
+    with pytest.raises(ValueError):
+        dummy_client.post("/positions/otc", {"level": float("nan")})
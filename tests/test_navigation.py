@@ -0,0 +1,105 @@
+import threading
+from igapy.exceptions import IGAPIError
+from igapy.navigation import MarketCrawler, MarketIndex
+
+TREE = {
+    "": {"nodes": [{"id": "1", "name": "Indices"}, {"id": "2", "name": "FX"}]},
+    "1": {
+        "nodes": [{"id": "11", "name": "UK"}],
+        "markets": [{"epic": "IX.A", "instrumentName": "A"}],
+    },
+    "2": {"markets": [{"epic": "CS.EUR", "instrumentName": "EUR/USD"}]},
+    "11": {"markets": [{"epic": "IX.FTSE", "instrumentName": "FTSE 100"}]},
+}
+
+
+class FakeMarkets:
+    """Markets stand-in serving a navigation tree from a dict."""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.calls = []
+        self.fail = set()
+        self._lock = threading.Lock()
+
+    def get_market_navigation(self):
+        return self.get_market_sub_nodes("")
+
+    def get_market_sub_nodes(self, node_id):
+        with self._lock:
+            self.calls.append(node_id)
+        if node_id in self.fail:
+            raise IGAPIError("API error: 403 exceeded")
+        return self.tree[node_id]
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_crawl_builds_index():
+    """Test a full crawl indexes every node and market."""
+    markets = FakeMarkets(TREE)
+    index = MarketCrawler(markets, clock=FakeClock()).crawl()
+    assert set(index.nodes) == {"", "1", "2", "11"}
+    assert index.markets["IX.FTSE"]["node"] == "11"
+    assert index.nodes["1"]["children"] == ["11"]
+    assert index.snapshot_at == 1000.0
+    assert sorted(markets.calls) == ["", "1", "11", "2"]
+
+
+def test_index_save_and_load(tmp_path):
+    """Test an index round-trips through JSON."""
+    index = MarketCrawler(FakeMarkets(TREE)).crawl()
+    path = str(tmp_path / "index.json")
+    index.save(path)
+    loaded = MarketIndex.load(path)
+    assert loaded.markets == index.markets
+    assert loaded.nodes == index.nodes
+
+
+def test_recrawl_only_revisits_stale_subtrees():
+    """Test recrawl refetches stale nodes and applies changes."""
+    clock = FakeClock()
+    markets = FakeMarkets(dict(TREE))
+    crawler = MarketCrawler(markets, clock=clock)
+    index = crawler.crawl()
+    clock.now = 2000.0
+    index.nodes["2"]["fetched_at"] = 400.0
+    markets.tree["2"] = {
+        "markets": [{"epic": "CS.GBP", "instrumentName": "GBP/USD"}]
+    }
+    markets.calls.clear()
+    crawler.recrawl(index, max_age=1500.0)
+    assert markets.calls == ["2"]
+    assert "CS.EUR" not in index.markets
+    assert index.markets["CS.GBP"]["node"] == "2"
+
+
+def test_recrawl_removes_vanished_children():
+    """Test children missing from a refetched node are dropped."""
+    clock = FakeClock()
+    markets = FakeMarkets(dict(TREE))
+    crawler = MarketCrawler(markets, clock=clock)
+    index = crawler.crawl()
+    clock.now = 5000.0
+    markets.tree["1"] = {"nodes": []}
+    crawler.recrawl(index, max_age=60.0)
+    assert "11" not in index.nodes
+    assert "IX.FTSE" not in index.markets
+
+
+def test_failed_nodes_are_reported():
+    """Test failures are recorded and left stale for a later recrawl."""
+    markets = FakeMarkets(TREE)
+    markets.fail.add("1")
+    crawler = MarketCrawler(markets)
+    index = crawler.crawl()
+    assert [node for node, _ in crawler.failed] == ["1"]
+    assert index.nodes["1"]["fetched_at"] is None
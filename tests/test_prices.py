@@ -67,3 +67,38 @@ def test_get_prices_error(dummy_client):
     api = Prices(dummy_client)
     with pytest.raises(IGAPIError):
         api.get_prices("E")
+
+
+def test_get_prices_sends_resolution(dummy_client):
+    """Test get_prices passes the resolution parameter."""
+    Prices(dummy_client).get_prices("E", resolution="HOUR")
+    assert dummy_client.session.calls[0][2]["resolution"] == "HOUR"
+
+
+def test_iter_prices_follows_pages(dummy_client):
+    """Test iter_prices yields snapshots from every page in order."""
+    pages = {
+        n: {
+            "prices": [{"n": n, "i": i} for i in range(2)],
+            "metadata": {"pageData": {"pageNumber": n, "totalPages": 3}},
+        }
+        for n in (1, 2, 3)
+    }
+
+    def get(url, params=None, headers=None):
+        dummy_client.session.calls.append(("GET", url, params))
+        return DummyResponse(200, pages[params["pageNumber"]])
+
+    dummy_client.session.get = get
+    snapshots = list(Prices(dummy_client).iter_prices("E", page_size=2))
+    assert [(s["n"], s["i"]) for s in snapshots] == [
+        (n, i) for n in (1, 2, 3) for i in range(2)
+    ]
+    assert len(dummy_client.session.calls) == 3
+
+
+def test_iter_prices_single_page(dummy_client):
+    """Test iter_prices stops after one page without pageData."""
+    dummy_client.session._response = DummyResponse(200, {"prices": [1, 2]})
+    assert list(Prices(dummy_client).iter_prices("E")) == [1, 2]
+    assert len(dummy_client.session.calls) == 1
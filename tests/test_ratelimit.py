@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import pytest
+from igapy.client import IGClient
+from igapy.exceptions import IGAPIError
+from igapy.ratelimit import NON_TRADING, TRADING, RateLimiter, TokenBucket
+from conftest import DummyResponse, DummySession
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_paces_after_burst():
+    """Test bucket allows a burst then reports wait time."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.0
+    assert bucket.try_acquire() == 0.5
+    clock.now = 0.5
+    assert bucket.try_acquire() == 0.0
+
+
+def test_token_bucket_drain():
+    """Test drain empties the bucket."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=5, clock=clock)
+    bucket.drain()
+    assert bucket.delay() == 1.0
+
+
+def test_lane_classification():
+    """Test trading writes are routed to the trading lane."""
+    assert RateLimiter.lane("POST", "/positions/otc") == TRADING
+    assert RateLimiter.lane("DELETE", "/working-orders/otc/D1") == TRADING
+    assert RateLimiter.lane("GET", "/positions") == NON_TRADING
+    assert RateLimiter.lane("GET", "/markets/E") == NON_TRADING
+
+
+def test_rolling_minute_never_exceeds_allowance():
+    """Test burst plus refill stays within the per-minute allowance."""
+    clock = FakeClock()
+    limiter = RateLimiter(non_trading_per_minute=30, clock=clock)
+    sent = 0
+    while clock.now < 60.0:
+        wait = limiter.try_acquire(NON_TRADING)
+        if wait:
+            clock.now += wait
+        else:
+            sent += 1
+    assert sent <= 30
+
+
+def test_invalid_arguments_rejected():
+    """Test allowances and burst below one are rejected."""
+    with pytest.raises(ValueError):
+        RateLimiter(non_trading_per_minute=0)
+    with pytest.raises(ValueError):
+        RateLimiter(burst=0)
+
+
+def test_single_request_allowance_can_acquire():
+    """Test an allowance of one per minute still holds a token."""
+    clock = FakeClock()
+    limiter = RateLimiter(non_trading_per_minute=1, clock=clock)
+    assert limiter.try_acquire(NON_TRADING) == 0.0
+    assert limiter.try_acquire(NON_TRADING) == 60.0
+
+
+def _fast_limiter(clock):
+    """Limiter whose waits are short in real time."""
+    return RateLimiter(
+        trading_per_minute=6001,
+        non_trading_per_minute=6001,
+        burst=1,
+        clock=clock,
+    )
+
+
+def test_acquire_blocks_until_token():
+    """Test acquire waits for a refill instead of failing."""
+    clock = FakeClock()
+    limiter = _fast_limiter(clock)
+    limiter.acquire(TRADING)
+    thread = threading.Thread(target=limiter.acquire, args=(TRADING,))
+    thread.start()
+    thread.join(0.05)
+    assert thread.is_alive()
+    clock.now += 1.0
+    thread.join(1.0)
+    assert not thread.is_alive()
+
+
+def test_non_trading_held_while_trading_waits():
+    """Test a data fetch is served after a waiting trading request."""
+    clock = FakeClock()
+    limiter = _fast_limiter(clock)
+    limiter.penalize(TRADING)
+    order = []
+
+    def run(lane):
+        limiter.acquire(lane)
+        order.append(lane)
+
+    trading = threading.Thread(target=run, args=(TRADING,))
+    trading.start()
+    trading.join(0.05)
+    non_trading = threading.Thread(target=run, args=(NON_TRADING,))
+    non_trading.start()
+    non_trading.join(0.05)
+    assert order == []
+    clock.now += 1.0
+    trading.join(1.0)
+    non_trading.join(1.0)
+    assert order == [TRADING, NON_TRADING]
+
+
+def test_async_trading_goes_ahead_of_data_fetches(dummy_async_client):
+    """Test async trading calls hold back concurrent async fetches."""
+    limiter = RateLimiter(
+        trading_per_minute=6001, non_trading_per_minute=6001, burst=1
+    )
+    limiter.penalize(TRADING)
+    dummy_async_client.rate_limiter = limiter
+
+    async def run():
+        await asyncio.gather(
+            dummy_async_client.post("/positions/otc", {"epic": "E"}),
+            dummy_async_client.get("/markets/E"),
+        )
+
+    asyncio.run(run())
+    methods = [call[0] for call in dummy_async_client.session.calls]
+    assert methods == ["POST", "GET"]
+
+
+def test_api_key_allowance_drains_both_lanes():
+    """Test the per-app allowance error drains every lane."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.penalize(
+        NON_TRADING, "error.public-api.exceeded-api-key-allowance"
+    )
+    assert limiter.buckets[TRADING].tokens == 0.0
+    assert limiter.buckets[NON_TRADING].tokens == 0.0
+
+
+def test_client_penalizes_on_exceeded_allowance():
+    """Test a 403 allowance error drains the lane's bucket."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    client = IGClient("key", "user", "pass", rate_limiter=limiter)
+    client.session = DummySession()
+    client.session._response = DummyResponse(
+        403, text="error.public-api.exceeded-account-allowance"
+    )
+    with pytest.raises(IGAPIError):
+        client.get("/markets/E")
+    assert limiter.buckets[NON_TRADING].tokens == 0.0
+    assert limiter.buckets[TRADING].tokens > 0
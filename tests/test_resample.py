@@ -0,0 +1,79 @@
+import math
+from datetime import datetime, timedelta
+import pytest
+from igapy.exceptions import InvalidInputError
+from igapy.frames import PriceFrame
+from igapy.resample import resample
+from igapy.utils import to_epoch_ms
+
+
+def _frame(times, closes, volumes=None):
+    prices = []
+    for i, (t, c) in enumerate(zip(times, closes)):
+        snapshot = {
+            "snapshotTimeUTC": t.isoformat(),
+            "openPrice": {"bid": c - 0.5},
+            "highPrice": {"bid": c + 1},
+            "lowPrice": {"bid": c - 1},
+            "closePrice": {"bid": c},
+        }
+        if volumes:
+            snapshot["lastTradedVolume"] = volumes[i]
+        prices.append(snapshot)
+    return PriceFrame.from_response({"prices": prices})
+
+
+def test_resample_minutes_to_hours():
+    """Test OHLCV aggregation into hourly bars."""
+    start = datetime(2025, 1, 1, 10)
+    times = [start + timedelta(minutes=m) for m in (0, 30, 59, 60, 61)]
+    frame = _frame(times, [1.0, 5.0, 3.0, 2.0, 4.0], [1, 2, 3, 4, 5])
+    hours = resample(frame, "HOUR")
+    assert list(hours["timestamp"]) == [
+        to_epoch_ms(start),
+        to_epoch_ms(start + timedelta(hours=1)),
+    ]
+    assert list(hours["bid_open"]) == [0.5, 1.5]
+    assert list(hours["bid_high"]) == [6.0, 5.0]
+    assert list(hours["bid_low"]) == [0.0, 1.0]
+    assert list(hours["bid_close"]) == [3.0, 4.0]
+    assert list(hours["volume"]) == [6.0, 9.0]
+    assert math.isnan(hours["ask_close"][0])
+
+
+def test_missing_bars_are_not_filled():
+    """Test empty buckets are left out."""
+    start = datetime(2025, 1, 1, 10)
+    frame = _frame([start, start + timedelta(hours=3)], [1.0, 2.0])
+    assert len(resample(frame, "HOUR")) == 2
+
+
+def test_session_offset():
+    """Test daily bars aligned to a 22:00 UTC session open."""
+    times = [datetime(2025, 1, 1, 21), datetime(2025, 1, 1, 22)]
+    days = resample(_frame(times, [1.0, 2.0]), "DAY", timedelta(hours=22))
+    assert list(days["timestamp"]) == [
+        to_epoch_ms(datetime(2024, 12, 31, 22)),
+        to_epoch_ms(datetime(2025, 1, 1, 22)),
+    ]
+
+
+def test_week_and_month_alignment():
+    """Test weeks start on Monday and months on the first."""
+    times = [datetime(2025, 1, 1), datetime(2025, 1, 6), datetime(2025, 2, 3)]
+    frame = _frame(times, [1.0, 2.0, 3.0])
+    weeks = resample(frame, "WEEK")
+    assert weeks["timestamp"][0] == to_epoch_ms(datetime(2024, 12, 30))
+    months = resample(frame, "MONTH")
+    assert list(months["timestamp"]) == [
+        to_epoch_ms(datetime(2025, 1, 1)),
+        to_epoch_ms(datetime(2025, 2, 1)),
+    ]
+    assert list(months["bid_close"]) == [2.0, 3.0]
+
+
+def test_unsorted_frame_rejected():
+    """Test unsorted input raises InvalidInputError."""
+    times = [datetime(2025, 1, 2), datetime(2025, 1, 1)]
+    with pytest.raises(InvalidInputError):
+        resample(_frame(times, [1.0, 2.0]), "DAY")
@@ -0,0 +1,83 @@
+from igapy.navigation import MarketIndex
+from igapy.search import MarketSearchIndex, tokenize
+
+MARKETS = [
+    {
+        "epic": "IX.D.FTSE.DAILY.IP",
+        "instrumentName": "FTSE 100",
+        "expiry": "DFB",
+    },
+    {
+        "epic": "IX.D.FTSE.MAR.IP",
+        "instrumentName": "FTSE 100",
+        "expiry": "MAR-25",
+    },
+    {
+        "epic": "CS.D.EURUSD.TODAY.IP",
+        "instrumentName": "EUR/USD",
+        "expiry": "-",
+    },
+    {
+        "epic": "UA.D.AAPL.DAILY.IP",
+        "instrumentName": "Apple Inc",
+        "expiry": "DFB",
+    },
+]
+
+
+class FakeMarkets:
+    """Markets stand-in recording live searches."""
+
+    def __init__(self):
+        self.terms = []
+
+    def search_markets(self, search_term):
+        self.terms.append(search_term)
+        return {"markets": [{"epic": "LIVE"}]}
+
+
+def _epics(result):
+    return [m["epic"] for m in result["markets"]]
+
+
+def test_tokenize():
+    """Test tokens are lowercase alphanumeric runs."""
+    assert tokenize("IX.D.FTSE.DAILY.IP") == ["ix", "d", "ftse", "daily", "ip"]
+
+
+def test_prefix_search():
+    """Test partial names match by prefix."""
+    index = MarketSearchIndex(MARKETS)
+    assert _epics(index.search("appl")) == ["UA.D.AAPL.DAILY.IP"]
+    assert _epics(index.search("eur")) == ["CS.D.EURUSD.TODAY.IP"]
+
+
+def test_all_tokens_must_match():
+    """Test multi-token queries intersect and match expiry."""
+    index = MarketSearchIndex(MARKETS)
+    assert _epics(index.search("ftse mar")) == ["IX.D.FTSE.MAR.IP"]
+
+
+def test_exact_epic_ranks_first():
+    """Test an exact epic query puts that market first."""
+    index = MarketSearchIndex(MARKETS)
+    result = _epics(index.search("IX.D.FTSE.MAR.IP"))
+    assert result[0] == "IX.D.FTSE.MAR.IP"
+    assert _epics(index.search("ftse", limit=1)) == ["IX.D.FTSE.DAILY.IP"]
+
+
+def test_miss_uses_fallback():
+    """Test misses go to the live endpoint when configured."""
+    live = FakeMarkets()
+    index = MarketSearchIndex(MARKETS, fallback=live)
+    assert _epics(index.search("bitcoin")) == ["LIVE"]
+    assert live.terms == ["bitcoin"]
+    assert MarketSearchIndex(MARKETS).search("bitcoin") == {"markets": []}
+
+
+def test_from_snapshot(tmp_path):
+    """Test building from a saved MarketIndex snapshot."""
+    path = str(tmp_path / "index.json")
+    MarketIndex(markets={m["epic"]: m for m in MARKETS}).save(path)
+    index = MarketSearchIndex.from_snapshot(path)
+    assert _epics(index.search("apple")) == ["UA.D.AAPL.DAILY.IP"]
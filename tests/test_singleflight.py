@@ -0,0 +1,76 @@
+import threading
+import time
+import pytest
+from igapy.client import IGClient
+from igapy.exceptions import IGAPIError
+from igapy.singleflight import SingleFlight
+from conftest import DummyResponse, DummySession
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test concurrent calls with the same key run fn once."""
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait()
+        return {"ok": True}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("k", fn)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert results == [{"ok": True}] * 5
+
+
+def test_errors_are_shared():
+    """Test every waiting caller receives the leader's exception."""
+    flight = SingleFlight()
+    with pytest.raises(ValueError):
+        flight.do("k", lambda: (_ for _ in ()).throw(ValueError("x")))
+    assert flight.do("k", lambda: 1) == 1
+
+
+def test_client_coalesces_identical_gets():
+    """Test IGClient shares one in-flight GET between threads."""
+    client = IGClient("key", "user", "pass", coalesce=True)
+    client.session = session = DummySession()
+    release = threading.Event()
+    original_get = session.get
+
+    def slow_get(url, params=None, headers=None):
+        release.wait()
+        return original_get(url, params=params, headers=headers)
+
+    session.get = slow_get
+    session._response = DummyResponse(200, {"positions": []})
+    threads = [
+        threading.Thread(target=client.get, args=("/positions",))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+    assert len(session.calls) == 1
+
+
+def test_client_coalesced_error_raises():
+    """Test a coalesced GET still raises IGAPIError."""
+    client = IGClient("key", "user", "pass", coalesce=True)
+    client.session = DummySession()
+    client.session._response = DummyResponse(500, text="boom")
+    with pytest.raises(IGAPIError):
+        client.get("/positions")
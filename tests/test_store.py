@@ -0,0 +1,97 @@
+from datetime import datetime
+from igapy.store import PriceStore, _next_bar_ms
+from igapy.utils import to_epoch_ms
+
+
+def _bar(minute):
+    return {
+        "snapshotTimeUTC": f"2025-01-01T00:{minute:02d}:00",
+        "closePrice": {"bid": float(minute), "ask": float(minute) + 0.5},
+    }
+
+
+class FakePrices:
+    """Prices stand-in serving one bar per minute of 2025-01-01 00:xx."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_prices_date_range(self, epic, resolution, start, end):
+        self.calls.append((start, end))
+        first = datetime.fromisoformat(start).minute
+        last = datetime.fromisoformat(end).minute
+        return {"prices": [_bar(m) for m in range(first, last + 1)]}
+
+
+def _t(minute):
+    return datetime(2025, 1, 1, 0, minute)
+
+
+def test_fetch_only_requests_missing_ranges(tmp_path):
+    """Test repeated fetches reuse stored data."""
+    store = PriceStore(str(tmp_path))
+    prices = FakePrices()
+    frame = store.fetch(prices, "E", "MINUTE", _t(10), _t(20))
+    assert len(frame) == 11
+    assert len(prices.calls) == 1
+    again = store.fetch(prices, "E", "MINUTE", _t(12), _t(15))
+    assert list(again["bid_close"]) == [12.0, 13.0, 14.0, 15.0]
+    assert len(prices.calls) == 1
+
+
+def test_fetch_fills_gaps_on_both_sides(tmp_path):
+    """Test a wider request fetches only the uncovered edges."""
+    store = PriceStore(str(tmp_path))
+    prices = FakePrices()
+    store.fetch(prices, "E", "MINUTE", _t(10), _t(20))
+    frame = store.fetch(prices, "E", "MINUTE", _t(5), _t(25))
+    assert prices.calls[1:] == [
+        ("2025-01-01 00:05:00", "2025-01-01 00:09:59"),
+        ("2025-01-01 00:21:00", "2025-01-01 00:25:00"),
+    ]
+    assert list(frame["bid_close"]) == [float(m) for m in range(5, 26)]
+    assert store.coverage("E", "MINUTE") == [
+        [to_epoch_ms(_t(5)), to_epoch_ms(_t(25))]
+    ]
+
+
+def test_load_is_memory_mapped(tmp_path):
+    """Test loaded columns are memoryviews over the stored files."""
+    store = PriceStore(str(tmp_path))
+    store.fetch(FakePrices(), "E", "MINUTE", _t(0), _t(2))
+    frame = store.load("E", "MINUTE")
+    assert isinstance(frame["timestamp"], memoryview)
+    assert frame["timestamp"].format == "q"
+    assert len(frame) == 3
+
+
+def test_empty_store(tmp_path):
+    """Test an unknown key loads as an empty frame."""
+    store = PriceStore(str(tmp_path))
+    assert len(store.load("E", "DAY")) == 0
+    assert store.missing("E", "DAY", 0, 10) == [(0, 10)]
+
+
+def test_backfill_rewrite_keeps_appended_bars(tmp_path):
+    """Test an earlier write merges with bars already stored."""
+    store = PriceStore(str(tmp_path))
+    prices = FakePrices()
+    store.fetch(prices, "E", "MINUTE", _t(10), _t(12))
+    store.fetch(prices, "E", "MINUTE", _t(13), _t(14))
+    frame = store.fetch(prices, "E", "MINUTE", _t(8), _t(14))
+    assert list(frame["bid_close"]) == [float(m) for m in range(8, 15)]
+    assert len(prices.calls) == 3
+
+
+def test_next_bar_steps_by_resolution():
+    """Test gaps resume one bar after stored data, by calendar month."""
+    minute = to_epoch_ms(_t(20))
+    assert _next_bar_ms(minute, "MINUTE") == to_epoch_ms(_t(21))
+    january = to_epoch_ms(datetime(2025, 1, 1))
+    assert _next_bar_ms(january, "MONTH") == to_epoch_ms(datetime(2025, 2, 1))
+    december = to_epoch_ms(datetime(2024, 12, 1))
+    assert _next_bar_ms(december, "MONTH") == january
+    end_of_january = to_epoch_ms(datetime(2025, 1, 31))
+    assert _next_bar_ms(end_of_january, "MONTH") == to_epoch_ms(
+        datetime(2025, 2, 28)
+    )
@@ -1,4 +1,10 @@
+import asyncio
+import threading
+import time
+
 import pytest
+from igapy.dispatch import CONFLATE, DROP_OLDEST
+from igapy.metrics import RECONNECT, LatencyMetrics
 from igapy.streaming import IGStreamingClient
 from types import SimpleNamespace
 
@@ -55,23 +61,34 @@ class DummySubscription:
     def setDataAdapter(self, adapter):
         self.adapter = adapter
 
-    def trigger(self, data):
+    def trigger(self, data, pos=1):
         for cb in self.listeners:
             # If cb is a class with onItemUpdate, call that method
             if hasattr(cb, "onItemUpdate"):
-                cb.onItemUpdate(DummyItemUpdate(self.fields, data))
+                cb.onItemUpdate(DummyItemUpdate(self.fields, data, pos))
             else:
-                cb(DummyItemUpdate(self.fields, data))
+                cb(DummyItemUpdate(self.fields, data, pos))
 
 
 class DummyItemUpdate:
-    def __init__(self, fields, data):
+    def __init__(self, fields, data, pos=1):
         self._fields = fields
         self._data = data
+        self._pos = pos
 
     def getValue(self, field):
         return self._data.get(field)
 
+    def getItemPos(self):
+        return self._pos
+
+    def getChangedFieldsByPosition(self):
+        return {
+            i + 1: self._data[f]
+            for i, f in enumerate(self._fields)
+            if f in self._data
+        }
+
 
 @pytest.fixture(autouse=True)
 def patch_ls(monkeypatch):
@@ -140,6 +157,276 @@ def test_subscribe_trade(dummy_client):
     assert received[0]["CONFIRMS"] == "OK"
 
 
+def test_subscribe_market(dummy_client):
+    """Test market subscription, callback and unsubscribe."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    received = []
+    s.subscribe_market("EPIC", ["MARKET_STATE"], received.append)
+    sub = s._subscriptions["MARKET:EPIC"]
+    assert sub.mode == "MERGE"
+    sub.trigger({"MARKET_STATE": "TRADEABLE"})
+    assert received[0]["MARKET_STATE"] == "TRADEABLE"
+    s.unsubscribe_market("EPIC")
+    assert "MARKET:EPIC" not in s._subscriptions
+
+
+def test_trade_listeners_share_subscription(dummy_client):
+    """Test trade listeners share one TRADE subscription."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    first, second = [], []
+    s.add_trade_listener(first.append)
+    s.add_trade_listener(second.append)
+    assert len(s._ls_client.subscribed) == 1
+    key = s._trade_key
+    s._subscriptions[key].trigger({"CONFIRMS": "{}"})
+    assert first[0]["CONFIRMS"] == second[0]["CONFIRMS"] == "{}"
+    s.remove_trade_listener(first.append)
+    assert key in s._subscriptions
+    s.remove_trade_listener(second.append)
+    assert key not in s._subscriptions
+
+
+def test_trade_listeners_independent_of_subscribe_trade(dummy_client):
+    """Test subscribe_trade and trade listeners do not disturb each other."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    item = f"TRADE:{dummy_client.session_data['currentAccountId']}"
+    listened, direct = [], []
+    s.add_trade_listener(listened.append)
+    s.subscribe_trade(["CONFIRMS"], direct.append)
+    key = s._trade_key
+    s.unsubscribe_trade()
+    assert key in s._subscriptions
+    s._subscriptions[key].trigger({"OPU": "{}"})
+    assert listened[0]["OPU"] == "{}"
+    s.subscribe_trade(["CONFIRMS"], direct.append)
+    s.remove_trade_listener(listened.append)
+    assert key not in s._subscriptions
+    s._subscriptions[item].trigger({"CONFIRMS": "{}"})
+    assert direct == [{"CONFIRMS": "{}"}]
+
+
+def test_subscribe_prices_batches_epics(dummy_client):
+    """Test many epics share one subscription routed by item position."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    received = []
+    key = s.subscribe_prices(
+        ["A", "B", "C"], ["BID"], lambda e, d: received.append((e, d))
+    )
+    assert len(s._ls_client.subscribed) == 1
+    sub = s._subscriptions[key]
+    assert sub.items == [f"PRICE:dummyId:{e}" for e in "ABC"]
+    assert sub.adapter == "Pricing"
+    sub.trigger({"BID": "1.5"}, pos=2)
+    assert received == [("B", {"BID": "1.5"})]
+    assert s.subscribe_prices(["A", "B"], ["BID"], print) is None
+
+
+def test_unsubscribe_prices_regroups(dummy_client):
+    """Test removing epics replaces the group with the remaining ones."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    received = []
+    first = s.subscribe_prices(["A", "B"], ["BID"], lambda e, d: None)
+    s.subscribe_prices(["C", "D"], ["BID"], lambda e, d: received.append(e))
+    s.unsubscribe_prices(["C", "A", "B"])
+    assert first not in s._subscriptions
+    assert len(s._ls_client.unsubscribed) == 2
+    (key,) = s._subscriptions
+    sub = s._subscriptions[key]
+    assert sub.items == ["PRICE:dummyId:D"]
+    sub.trigger({"BID": "1"}, pos=1)
+    assert received == ["D"]
+    s.unsubscribe(key)
+    assert s.subscribe_prices(["D"], ["BID"], print) is not None
+
+
+def test_unsubscribe_prices_subscribes_replacement_first(dummy_client):
+    """Test remaining epics are resubscribed before the old group goes."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    old = s.subscribe_prices(["A", "B"], ["BID"], lambda e, d: None)
+    old_sub = s._subscriptions[old]
+    events = []
+    ls = s._ls_client
+    subscribe, unsubscribe = ls.subscribe, ls.unsubscribe
+    ls.subscribe = lambda sub: (events.append("sub"), subscribe(sub))
+    ls.unsubscribe = lambda sub: (events.append("unsub"), unsubscribe(sub))
+    s.unsubscribe_prices(["A"])
+    assert events == ["sub", "unsub"]
+    assert ls.unsubscribed == [old_sub]
+    assert s._epics["B"] != old
+
+
+def test_changed_only_delivery(dummy_client):
+    """Test changed_only passes reused values plus a changed-field mask."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    received = []
+    s.subscribe(
+        "ITEM",
+        "MERGE",
+        ["BID", "OFFER", "UTM"],
+        lambda values, mask: received.append((values, list(values), mask)),
+        changed_only=True,
+    )
+    sub = s._subscriptions["ITEM"]
+    sub.trigger({"BID": "1", "OFFER": "2", "UTM": "t"})
+    sub.trigger({"OFFER": "3"})
+    assert received[0][1:] == (["1", "2", "t"], 0b111)
+    assert received[1][1:] == (["1", "3", "t"], 0b010)
+    assert received[0][0] is received[1][0]
+
+
+def test_changed_only_prices_and_debug(dummy_client, capsys):
+    """Test grouped changed_only delivery and the debug exception guard."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    received = []
+    key = s.subscribe_prices(
+        ["A", "B"],
+        ["BID"],
+        lambda e, v, m: received.append((e, list(v), m)),
+        changed_only=True,
+    )
+    s._subscriptions[key].trigger({"BID": "9"}, pos=2)
+    assert received == [("B", ["9"], 1)]
+
+    def fail(values, mask):
+        raise ValueError("fail!")
+
+    s.subscribe("FAST", "MERGE", ["BID"], fail, changed_only=True)
+    with pytest.raises(ValueError):
+        s._subscriptions["FAST"].trigger({"BID": "1"})
+    s.debug = True
+    s.subscribe("SAFE", "MERGE", ["BID"], fail, changed_only=True)
+    s._subscriptions["SAFE"].trigger({"BID": "1"})
+    assert "Exception in onItemUpdate callback" in capsys.readouterr().out
+
+
+def _start_updates(stream):
+    """Run the first __anext__ far enough to subscribe."""
+    task = asyncio.ensure_future(stream.__anext__())
+    return task
+
+
+def test_updates_async_iterator_batches(dummy_client):
+    """Test updates arrive in order with one loop wakeup per batch."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+    items = ["MARKET:A", "MARKET:B"]
+
+    async def run():
+        stream = s.updates(items, ["BID"])
+        first = _start_updates(stream)
+        await asyncio.sleep(0)
+        sub = s._subscriptions[stream._key]
+        wakeups = []
+        set_event = stream._event.set
+        stream._event.set = lambda: (wakeups.append(1), set_event())
+
+        def produce():
+            for i in range(100):
+                sub.trigger({"BID": str(i)}, pos=i % 2 + 1)
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+        received = [await first]
+        async for update in stream:
+            received.append(update)
+            if len(received) == 100:
+                break
+        batches = len(wakeups)
+        stream.close()
+        return received, batches, sub
+
+    received, batches, sub = asyncio.run(run())
+    assert received[0] == ("MARKET:A", {"BID": "0"})
+    assert [int(d["BID"]) for _, d in received] == list(range(100))
+    assert batches == 1
+    assert s._ls_client.unsubscribed == [sub]
+
+
+def test_updates_conflate_and_drop(dummy_client):
+    """Test conflate keeps the latest per item and drop_oldest drops."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+
+    async def collect(policy, maxsize):
+        stream = s.updates(["X", "Y"], ["BID"], maxsize=maxsize, policy=policy)
+        first = _start_updates(stream)
+        await asyncio.sleep(0)
+        sub = s._subscriptions[stream._key]
+        for i, pos in enumerate([1, 2, 1, 1, 2]):
+            sub.trigger({"BID": i}, pos=pos)
+        await asyncio.sleep(0)
+        received = [await first]
+        received.append(await stream.__anext__())
+        stream.close()
+        return received, stream
+
+    received, stream = asyncio.run(collect(CONFLATE, 10))
+    assert received == [("X", {"BID": 3}), ("Y", {"BID": 4})]
+    assert stream.conflated == 3
+    received, stream = asyncio.run(collect(DROP_OLDEST, 2))
+    assert received == [("X", {"BID": 3}), ("Y", {"BID": 4})]
+    assert stream.dropped == 3
+
+
+def test_updates_cancellation_unsubscribes(dummy_client):
+    """Test cancelling the consumer task unsubscribes its items."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+
+    async def run():
+        stream = s.updates(["X"], ["BID"])
+
+        async def consume():
+            async for _ in stream:
+                pass
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return stream
+
+    stream = asyncio.run(run())
+    assert stream._key not in s._subscriptions
+    assert len(s._ls_client.unsubscribed) == 1
+
+
+def test_updates_break_unsubscribes(dummy_client):
+    """Test leaving an async for loop early unsubscribes its items."""
+    s = IGStreamingClient(dummy_client)
+    s.start()
+
+    async def run():
+        stream = s.updates(["X"], ["BID"])
+
+        async def consume():
+            async for update in stream:
+                return update
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        s._subscriptions[stream._key].trigger({"BID": "1"}, pos=1)
+        update = await asyncio.wait_for(task, 5)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        # Checked inside the loop, before asyncio.run closes generators.
+        assert stream._key not in s._subscriptions
+        return update
+
+    assert asyncio.run(run()) == ("X", {"BID": "1"})
+    assert len(s._ls_client.unsubscribed) == 1
+
+
 def test_subscribe_chart_tick(dummy_client):
     """Test chart tick subscription and callback."""
     s = IGStreamingClient(dummy_client)
@@ -178,6 +465,20 @@ def test_unsubscribe(dummy_client):
     )  # Should contain the DummySubscription instance
 
 
+def _wait_for_recovery(s, timeout=5):
+    """Wait until the reconnect supervisor has recovered."""
+    deadline = time.monotonic() + timeout
+    while s.last_recovery_time is None and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def _disconnect(s):
+    """Simulate a disconnect event from the SDK."""
+    for listener in s._ls_client.listeners:
+        if hasattr(listener, "onStatusChange"):
+            listener.onStatusChange("DISCONNECTED")
+
+
 def test_reconnect_and_resubscribe(dummy_client, capsys):
     """Test that reconnect triggers and subscriptions are re-added."""
     s = IGStreamingClient(dummy_client, reconnect=True, reconnect_delay=0)
@@ -186,18 +487,74 @@ def test_reconnect_and_resubscribe(dummy_client, capsys):
     s.subscribe_price("EPIC", ["BID"], lambda d: received.append(d))
     account_id = dummy_client.session_data["currentAccountId"]
     item = f"PRICE:{account_id}:EPIC"
-    # Simulate disconnect event
-    for listener in s._ls_client.listeners:
-        if hasattr(listener, "onStatusChange"):
-            listener.onStatusChange("DISCONNECTED")
+    _disconnect(s)
+    _wait_for_recovery(s)
     # After reconnect, subscription should still exist
     assert item in s._subscriptions
+    assert s._ls_client.subscribed.count(s._subscriptions[item]) == 2
     # Simulate update after reconnect
     sub = s._subscriptions[item]
     sub.trigger({"BID": "2.2"})
     assert received[-1]["BID"] == "2.2"
     out = capsys.readouterr().out
     assert "Reconnected and re-subscribed" in out
+    s.stop()
+
+
+def test_disconnect_does_not_block_sdk_thread(dummy_client):
+    """Test the status callback returns at once, even with a long delay."""
+    s = IGStreamingClient(dummy_client, reconnect_delay=30)
+    s.start()
+    started = time.monotonic()
+    _disconnect(s)
+    assert time.monotonic() - started < 1
+    s.stop()
+    s._supervisor.join(5)
+    assert not s._supervisor.is_alive()
+
+
+def test_disconnect_while_recovering_is_ignored(dummy_client):
+    """Test our own disconnect during recovery starts no second one."""
+    s = IGStreamingClient(dummy_client, reconnect_delay=30)
+    s.start()
+    with s._lock:
+        s._recovering = True
+    _disconnect(s)
+    assert not s._disconnected.is_set()
+    s.stop()
+
+
+def test_reconnect_backoff_and_recovery_metric(dummy_client, monkeypatch):
+    """Test failed attempts back off, tokens refresh, and time is recorded."""
+    metrics = LatencyMetrics()
+    logins = []
+    dummy_client.login = lambda: logins.append(1)
+    s = IGStreamingClient(dummy_client, reconnect_delay=0, metrics=metrics)
+    s.start()
+    connect = s._ls_client.connect
+    failures = []
+
+    def flaky_connect():
+        if len(failures) < 2:
+            failures.append(1)
+            raise ConnectionError("down")
+        connect()
+
+    s._ls_client.connect = flaky_connect
+    _disconnect(s)
+    _wait_for_recovery(s)
+    s.stop()
+    assert len(logins) == 3
+    assert metrics.histogram(RECONNECT).count == 1
+    assert s._ls_client.connectionDetails.pw == "CST-dummycst|XST-dummytoken"
+
+    monkeypatch.setattr("random.uniform", lambda a, b: b)
+    s = IGStreamingClient(
+        dummy_client, reconnect_delay=1, max_reconnect_delay=5
+    )
+    assert [s._backoff(n) for n in range(5)] == [1, 2, 4, 5, 5]
+    s = IGStreamingClient(dummy_client, reconnect_delay=0)
+    assert [s._backoff(n) for n in range(3)] == [0.1, 0.2, 0.4]
 
 
 def test_callback_exception_handling(dummy_client, capsys):
@@ -1,4 +1,19 @@
-from igapy.utils import parse_date, build_headers
+import asyncio
+import threading
+
+import pytest
+
+from igapy.exceptions import IGAPIError
+from igapy.utils import (
+    build_headers,
+    chunk_ids,
+    fetch_chunked,
+    fetch_chunked_async,
+    format_date,
+    from_epoch_ms,
+    parse_date,
+    to_epoch_ms,
+)
 from datetime import datetime
 
 
@@ -16,3 +31,57 @@ def test_build_headers(dummy_client):
     assert headers["X-IG-API-KEY"] == dummy_client.api_key
     assert headers["CST"] == "c"
     assert headers["X-SECURITY-TOKEN"] == "t"
+
+
+def test_epoch_ms_round_trip():
+    """Test epoch millisecond conversion and IG date formatting."""
+    dt = datetime(2025, 1, 2, 3, 4, 5)
+    assert from_epoch_ms(to_epoch_ms(dt)) == dt
+    assert format_date(dt) == "2025-01-02 03:04:05"
+
+
+def test_chunk_ids():
+    """Test ids are split into consecutive bounded chunks."""
+    assert chunk_ids(range(5), 2) == [[0, 1], [2, 3], [4]]
+    assert chunk_ids([], 2) == []
+
+
+def test_fetch_chunked_merges_in_input_order():
+    """Test chunks run concurrently and merge back in input order."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch(part):
+        barrier.wait()
+        return {"marketDetails": [{"epic": e} for e in part]}
+
+    ids = [f"E{i}" for i in range(6)]
+    result = fetch_chunked(fetch, ids, chunk_size=2)
+    assert [m["epic"] for m in result["marketDetails"]] == ids
+    assert "failed" not in result
+
+
+def test_fetch_chunked_reports_failures():
+    """Test ids of failed chunks are listed and total failure raises."""
+
+    def fetch(part):
+        if "E2" in part:
+            raise IGAPIError("boom")
+        return {"marketDetails": part}
+
+    result = fetch_chunked(fetch, ["E0", "E1", "E2", "E3"], chunk_size=2)
+    assert result == {"marketDetails": ["E0", "E1"], "failed": ["E2", "E3"]}
+    with pytest.raises(IGAPIError):
+        fetch_chunked(fetch, ["E2", "E2"], chunk_size=1)
+
+
+def test_fetch_chunked_async():
+    """Test async chunked fetching merges in input order."""
+
+    async def fetch(part):
+        await asyncio.sleep(0.01 * (3 - len(part)))
+        return {"clientSentiments": part}
+
+    result = asyncio.run(
+        fetch_chunked_async(fetch, ["A", "B", "C", "D", "E"], chunk_size=2)
+    )
+    assert result == {"clientSentiments": ["A", "B", "C", "D", "E"]}
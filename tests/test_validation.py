@@ -0,0 +1,155 @@
+import asyncio
+import pytest
+
+from igapy.exceptions import InvalidInputError
+from igapy.orders import AsyncOrders, Orders
+from igapy.validation import OrderValidator
+
+DETAILS = {
+    "instrument": {
+        "epic": "E",
+        "currencies": [{"code": "GBP"}, {"code": "USD"}],
+        "controlledRiskAllowed": True,
+        "stopsLimitsAllowed": True,
+    },
+    "dealingRules": {
+        "minDealSize": {"unit": "POINTS", "value": 0.5},
+        "minNormalStopOrLimitDistance": {"unit": "POINTS", "value": 10},
+        "minControlledRiskStopDistance": {"unit": "POINTS", "value": 40},
+        "maxStopOrLimitDistance": {"unit": "PERCENTAGE", "value": 10},
+    },
+    "snapshot": {"bid": 999.0, "offer": 1000.0},
+}
+
+
+class FakeMarkets:
+    def get_market_details(self, epic):
+        return DETAILS
+
+
+def _order(**fields):
+    return dict({"epic": "E", "direction": "BUY", "size": 1.0}, **fields)
+
+
+def _check(**fields):
+    OrderValidator(FakeMarkets()).validate(_order(**fields))
+
+
+def test_valid_order_passes():
+    """Test an order within every rule is accepted."""
+    _check(stopDistance=20, limitLevel=1050, currencyCode="GBP")
+    _check(guaranteedStop=True, stopLevel=950)
+
+
+@pytest.mark.parametrize(
+    "fields, message",
+    [
+        ({"direction": "HOLD"}, "direction"),
+        ({"size": 0.2}, "below the minimum"),
+        ({"size": 1.25}, "lot step"),
+        ({"currencyCode": "EUR"}, "Currency"),
+        ({"stopDistance": 5}, "Stop distance"),
+        ({"stopLevel": 1010}, "below"),
+        ({"guaranteedStop": True, "stopDistance": 20}, "minimum of 40"),
+        ({"guaranteedStop": True}, "needs a stop"),
+        ({"limitDistance": 150}, "above the maximum of 100"),
+    ],
+)
+def test_invalid_orders_raise(fields, message):
+    """Test each rule rejects a breaking order with a clear message."""
+    with pytest.raises(InvalidInputError, match=message):
+        _check(**fields)
+
+
+def test_working_order_uses_order_level():
+    """Test distances of working orders are measured from their level."""
+    _check(level=900, stopLevel=880)
+    with pytest.raises(InvalidInputError):
+        _check(level=900, stopLevel=895)
+
+
+def test_orders_validate_before_sending(dummy_client):
+    """Test Orders rejects invalid orders without a request."""
+    orders = Orders(dummy_client, validator=OrderValidator(FakeMarkets()))
+    with pytest.raises(InvalidInputError):
+        orders.create_otc_position(_order(size=0.1))
+    with pytest.raises(InvalidInputError):
+        orders.create_working_order(_order(size=0.1, level=900))
+    assert dummy_client.session.calls == []
+    orders.create_otc_position(_order())
+    assert len(dummy_client.session.calls) == 1
+
+
+FX_DETAILS = {
+    "instrument": {
+        "epic": "FX",
+        "onePipMeans": "0.0001 USD/EUR",
+        "stopsLimitsAllowed": True,
+    },
+    "dealingRules": {
+        "minDealSize": {"unit": "POINTS", "value": 1},
+        "minNormalStopOrLimitDistance": {"unit": "POINTS", "value": 5},
+        "maxStopOrLimitDistance": {"unit": "POINTS", "value": 500},
+    },
+    "snapshot": {"bid": 1.1000, "offer": 1.1001, "scalingFactor": 1},
+}
+
+
+class FXMarkets:
+    def get_market_details(self, epic):
+        return FX_DETAILS
+
+
+def test_levels_are_converted_to_points():
+    """Test level distances use the instrument's pip size, not price."""
+    validator = OrderValidator(FXMarkets())
+    # 0.0020 below the offer is 20 points: inside 5..500.
+    validator.validate(_order(epic="FX", stopLevel=1.0981))
+    with pytest.raises(InvalidInputError, match="below the minimum"):
+        validator.validate(_order(epic="FX", stopLevel=1.0999))
+    with pytest.raises(InvalidInputError, match="above the maximum"):
+        validator.validate(_order(epic="FX", limitLevel=1.2001))
+
+
+class AsyncFakeMarkets:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_market_details(self, epic):
+        self.calls += 1
+        return DETAILS
+
+
+def test_async_orders_await_validation(dummy_async_client):
+    """Test AsyncOrders validates through an async details source."""
+    markets = AsyncFakeMarkets()
+    orders = AsyncOrders(dummy_async_client, OrderValidator(markets))
+    with pytest.raises(InvalidInputError):
+        asyncio.run(orders.create_otc_position(_order(size=0.1)))
+    with pytest.raises(InvalidInputError):
+        asyncio.run(orders.create_working_order(_order(stopDistance=5)))
+    assert markets.calls == 2
+    assert dummy_async_client.session.calls == []
+
+
+def test_async_validation_runs_sync_source_off_loop():
+    """Test a blocking details source is not called on the event loop."""
+    on_loop = []
+
+    class BlockingMarkets:
+        def get_market_details(self, epic):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return DETAILS
+
+    asyncio.run(OrderValidator(BlockingMarkets()).validate_async(_order()))
+    assert on_loop == [False]
+
+
+def test_sync_validate_rejects_async_source():
+    """Test validate refuses a source that needs awaiting."""
+    with pytest.raises(TypeError, match="validate_async"):
+        OrderValidator(AsyncFakeMarkets()).validate(_order())